@@ -0,0 +1,152 @@
+"""
+#### Description:
+    Throughput benchmarks of the API clients against the local stub server, no network needed.
+
+    Each scenario reports client operations per second, HTTP requests per second, p50/p99
+    latency per operation and the peak memory allocated by the client while it runs. The stub
+    server runs in its own process so its work and memory do not count against the client.
+
+#### Example:
+    ```
+    python benchmarks/run.py
+    python benchmarks/run.py --latency 0.02 --scenario batch_post --json results.json
+    ```
+"""
+from typing import Any, Callable, Dict, List
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pycomptox.core.config import Config  # noqa: E402
+from pycomptox.core.transport import Transport  # noqa: E402
+
+
+class StubProcess:
+    """
+    Stub server running in a child process.
+    """
+    def __init__(self, **options):
+        args = [sys.executable, "-m", "pycomptox.testing"]
+        for name, value in options.items():
+            if value is not None:
+                args += [f"--{name.replace('_', '-')}", str(value)]
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self.process = subprocess.Popen(args, cwd=root, stdout=subprocess.PIPE, text=True)
+        self.base_url = self.process.stdout.readline().strip()
+
+    def close(self) -> None:
+        self.process.terminate()
+        self.process.wait()
+
+
+def percentile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def measure(name: str, operations: List[Callable[[], Any]], concurrency: int, events: List[Any]) -> Dict[str, Any]:
+    """
+    Run the operations on `concurrency` threads, then once more under tracemalloc for memory.
+    """
+    latencies = []
+
+    def timed(operation: Callable[[], Any]) -> None:
+        start = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - start)
+
+    events.clear()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(timed, operations))
+    elapsed = time.perf_counter() - start
+    requests = len(events)
+
+    tracemalloc.start()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(lambda operation: operation(), operations))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "scenario": name,
+        "operations": len(operations),
+        "ops_per_s": len(operations) / elapsed,
+        "requests_per_s": requests / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "peak_mib": peak / 2 ** 20,
+    }
+
+
+def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    from pycomptox.apis.bioactivity import BioActivityData
+    from pycomptox.apis.chem_search import ChemProperties
+    from pycomptox.apis.hazard import Hazard
+
+    server = StubProcess(latency=args.latency, list_size=args.list_size, batch_limit=200,
+                         records_per_id=args.records_per_id)
+    config = Config(api_key="stub-api-key", base_url=server.base_url, pool_maxsize=args.concurrency)
+    events = []
+    options = dict(config=config, transport=Transport(pool_maxsize=args.concurrency), memo_cache=None,
+                   hooks=[events.append], max_workers=args.concurrency)
+    hazard = Hazard("stub-api-key", **options)
+    properties = ChemProperties("stub-api-key", **options)
+    bioactivity = BioActivityData("stub-api-key", **options)
+
+    ids = [f"DTXSID{i:07d}" for i in range(max(args.requests, args.batch_ids))]
+    scenarios = {
+        "single_get": lambda: [lambda id_=id_: hazard.get_hazard(type="all", dtxsid=id_) for id_ in ids[:args.requests]],
+        "batch_post": lambda: [lambda: properties.get_properties_batch(dtxsid_list=ids[:args.batch_ids])] * args.repeat,
+        "list_pull": lambda: [lambda: bioactivity.get_data(search_by="aeid", search_for=1386)] * args.repeat,
+        "list_stream": lambda: [
+            lambda: sum(1 for _ in bioactivity.get_data(search_by="aeid", search_for=1386, stream=True))
+        ] * args.repeat,
+    }
+
+    results = []
+    try:
+        for name in args.scenario or list(scenarios):
+            concurrency = args.concurrency if name == "single_get" else 1
+            results.append(measure(name, scenarios[name](), concurrency, events))
+    finally:
+        server.close()
+    return results
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the pycomptox clients against a local stub server")
+    parser.add_argument("--scenario", action="append", choices=["single_get", "batch_post", "list_pull", "list_stream"])
+    parser.add_argument("--latency", type=float, default=0.0, help="Server latency per request in seconds")
+    parser.add_argument("--concurrency", type=int, default=8, help="Threads for single GETs, workers for batches")
+    parser.add_argument("--requests", type=int, default=2000, help="Single GETs per run")
+    parser.add_argument("--batch-ids", type=int, default=2000, help="IDs per batch POST")
+    parser.add_argument("--list-size", type=int, default=20000, help="Records returned by a list pull")
+    parser.add_argument("--records-per-id", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5, help="Batch and list operations per scenario")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    columns = ["scenario", "operations", "ops_per_s", "requests_per_s", "p50_ms", "p99_ms", "peak_mib"]
+    print("  ".join(f"{column:>14}" for column in columns))
+    for result in results:
+        print("  ".join(f"{result[column]:>14.2f}" if isinstance(result[column], float) else f"{result[column]:>14}"
+                        for column in columns))
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,97 @@
 # __init__.py
-# Import necessary modules or packages
-import logging
+# Public names are resolved lazily: `import pycomptox` loads no API module and has no side
+# effects, and `pycomptox.Hazard` imports only the module defining it (and its dependencies).
+import importlib
+
+# Public name -> module defining it
+_LAZY = {
+    # Facade
+    "CompTox": "pycomptox.client",
+    "AsyncCompTox": "pycomptox.client",
+    "DossierBuilder": "pycomptox.dossier",
+    "BulkJob": "pycomptox.jobs",
+    # Chemical APIs
+    "ChemSearch": "pycomptox.apis.chem_search",
+    "ChemFate": "pycomptox.apis.chem_search",
+    "ChemList": "pycomptox.apis.chem_search",
+    "ChemDetails": "pycomptox.apis.chem_search",
+    "GHSClassExist": "pycomptox.apis.chem_search",
+    "SystemIUPAC": "pycomptox.apis.chem_search",
+    "ChemProperties": "pycomptox.apis.chem_search",
+    # Hazard APIs
+    "Hazard": "pycomptox.apis.hazard",
+    "SkinEye": "pycomptox.apis.hazard",
+    "Cancer": "pycomptox.apis.hazard",
+    "Genotox": "pycomptox.apis.hazard",
+    # Bioactivity APIs
+    "BioActivityAssay": "pycomptox.apis.bioactivity",
+    "BioActivityData": "pycomptox.apis.bioactivity",
+    # Exposure APIs
+    "FunctionalUse": "pycomptox.apis.exposure",
+    "Product": "pycomptox.apis.exposure",
+    "Httk": "pycomptox.apis.exposure",
+    "ListPresence": "pycomptox.apis.exposure",
+    "GeneralExposure": "pycomptox.apis.exposure",
+    "DemographicExposure": "pycomptox.apis.exposure",
+    # Core
+    "Config": "pycomptox.core.config",
+    "Transport": "pycomptox.core.transport",
+    "DiskCache": "pycomptox.core.cache",
+    "MemoryCache": "pycomptox.core.cache",
+    "RetryPolicy": "pycomptox.core.throttle",
+    "TokenBucket": "pycomptox.core.throttle",
+    "set_rate_limit": "pycomptox.core.throttle",
+    "LatencyHistogram": "pycomptox.core.metrics",
+    "add_hook": "pycomptox.core.metrics",
+    "remove_hook": "pycomptox.core.metrics",
+    "APIRequestError": "pycomptox.utils.exceptions",
+    "set_json_backend": "pycomptox.utils.jsonlib",
+    # Local indexes
+    "ChemicalIndex": "pycomptox.local.chemical_index",
+    "TypeAheadSession": "pycomptox.local.typeahead",
+    "AsyncTypeAheadSession": "pycomptox.local.typeahead",
+    "MassRangeCache": "pycomptox.local.mass_cache",
+    "PropertyRangeCache": "pycomptox.local.property_cache",
+    "JSONLSink": "pycomptox.utils.sinks",
+    "CSVSink": "pycomptox.utils.sinks",
+    "ParquetSink": "pycomptox.utils.sinks",
+}
+
+_SUBPACKAGES = ("apis", "core", "local", "utils")
+
+__all__ = sorted(_LAZY) + ["initialize_package"]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name]), name)
+    elif name in _SUBPACKAGES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Cache the resolved attribute so __getattr__ is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY) | set(_SUBPACKAGES))
+
 
 # Initialization code
 def initialize_package(config=None):
     """
     Initialize the package with optional configuration.
 
+    Not called on import: applications that want the package's default logging setup
+    call it explicitly.
+
     Args:
         config (dict, optional): Configuration dictionary for package setup.
     """
+    import logging
+
     # Set up logging
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger(__name__)
@@ -21,5 +103,3 @@ def initialize_package(config=None):
             logger.info(f"{key} = {value}")
 
     logger.info("Package initialized successfully!")
-
-initialize_package()
\ No newline at end of file
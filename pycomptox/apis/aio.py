@@ -0,0 +1,96 @@
+"""
+#### Description:
+    Asyncio versions of the API clients. Each class reuses the URL building and validation of its
+    blocking counterpart, but every method returns an awaitable. Clients share one connection pool
+    per event loop unless a `transport` is given.
+
+#### Example:
+    ```python
+    client = AsyncChemSearch(api_key=api_key)
+    response = await client.get_chemical(op="equal", word="DTXSID7020182")
+
+    hazard = AsyncHazard(api_key=api_key)
+    responses = await asyncio.gather(*[hazard.get_hazard(type="all", dtxsid=d) for d in dtxsids])
+    ```
+"""
+from ..core.async_client import AsyncBaseAPIClient
+from .chem_search import ChemSearch, ChemFate, ChemList, ChemDetails, GHSClassExist, SystemIUPAC, ChemProperties
+from .hazard import Hazard, SkinEye, Cancer, Genotox
+from .bioactivity import BioActivityAssay, BioActivityData
+from .exposure import FunctionalUse, Product, Httk, ListPresence, GeneralExposure, DemographicExposure
+
+
+class AsyncChemSearch(AsyncBaseAPIClient, ChemSearch):
+    pass
+
+
+class AsyncChemFate(AsyncBaseAPIClient, ChemFate):
+    pass
+
+
+class AsyncChemList(AsyncBaseAPIClient, ChemList):
+    pass
+
+
+class AsyncChemDetails(AsyncBaseAPIClient, ChemDetails):
+    pass
+
+
+class AsyncGHSClassExist(AsyncBaseAPIClient, GHSClassExist):
+    pass
+
+
+class AsyncSystemIUPAC(AsyncBaseAPIClient, SystemIUPAC):
+    pass
+
+
+class AsyncChemProperties(AsyncBaseAPIClient, ChemProperties):
+    pass
+
+
+class AsyncHazard(AsyncBaseAPIClient, Hazard):
+    pass
+
+
+class AsyncSkinEye(AsyncBaseAPIClient, SkinEye):
+    pass
+
+
+class AsyncCancer(AsyncBaseAPIClient, Cancer):
+    pass
+
+
+class AsyncGenotox(AsyncBaseAPIClient, Genotox):
+    pass
+
+
+class AsyncBioActivityAssay(AsyncBaseAPIClient, BioActivityAssay):
+    pass
+
+
+class AsyncBioActivityData(AsyncBaseAPIClient, BioActivityData):
+    pass
+
+
+class AsyncFunctionalUse(AsyncBaseAPIClient, FunctionalUse):
+    pass
+
+
+class AsyncProduct(AsyncBaseAPIClient, Product):
+    pass
+
+
+class AsyncHttk(AsyncBaseAPIClient, Httk):
+    pass
+
+
+class AsyncListPresence(AsyncBaseAPIClient, ListPresence):
+    pass
+
+
+class AsyncGeneralExposure(AsyncBaseAPIClient, GeneralExposure):
+    pass
+
+
+class AsyncDemographicExposure(AsyncBaseAPIClient, DemographicExposure):
+    pass
@@ -1,10 +1,11 @@
 from ..core.base_client import BaseAPIClient
-from typing import Dict, Any, Union
+from typing import Dict, Any, List, Union
+from functools import partial
 
 class BioActivityAssay(BaseAPIClient):
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
     def get_assay(self, aeid: int = None, **kwargs) -> Dict[str, Any]:
 
@@ -14,9 +15,12 @@ class BioActivityAssay(BaseAPIClient):
         
         #### Parameters:
             - aeid: int
-                - The AEID of the assay. If not provided, all assays will be returned.
+                - The AEID of the assay. If not provided, all assays will be returned and the
+                  response is memoized in-process (see `pycomptox.core.cache.catalogue_cache`).
             - kwargs: Dict
-                - Additional keyword arguments.
+                - Additional keyword arguments. `stream=True` returns an iterator decoding one
+                  assay at a time while the response downloads.
+                  `output` is an optional result type, 'pandas', 'arrow' or 'records'.
             
         #### Returns:
             - Dict[str, Any]
@@ -34,6 +38,10 @@ class BioActivityAssay(BaseAPIClient):
             client = BioActivityAssay(api_key=api_key)
             response = client.get_assay(aeid=1)
             response = client.get_assay()
+
+            # Decode one assay at a time while downloading
+            for assay in client.get_assay(stream=True):
+                print(assay)
         """
 
         if aeid is None:
@@ -45,10 +53,10 @@ class BioActivityAssay(BaseAPIClient):
     
 class BioActivityData(BaseAPIClient):
     
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
-    def get_data(self, search_by: str, search_for: Union[int, str], **kwargs) -> Dict[str, Any]:
+    def get_data(self, search_by: str, search_for: Union[int, str, List[Union[int, str]]], **kwargs) -> Dict[str, Any]:
 
         """
         #### Description:
@@ -57,10 +65,13 @@ class BioActivityData(BaseAPIClient):
         #### Arguments:
             - search_by: str
                 - The search parameter. Must be one of 'spid', 'm4id', 'dtxsid', 'aeid'.
-            - search_for: Union[int, str]
-                - The value to search for.
+            - search_for: Union[int, str, List[Union[int, str]]]
+                - The value to search for. A list of values is fetched concurrently and returned
+                  as a mapping of value to result.
             - kwargs: Dict
-                - Additional keyword arguments.
+                - Additional keyword arguments. `max_workers` caps the requests in flight for a list; `return_exceptions=True` maps failed IDs to their error instead of raising.
+                  `stream=True` returns an iterator decoding one row at a time while the response downloads.
+                  `output` is an optional result type, 'pandas', 'arrow' or 'records'.
         
         #### Returns:
             - Dict[str, Any]
@@ -75,6 +86,11 @@ class BioActivityData(BaseAPIClient):
             response = client.get_data(search_by="m4id", search_for=392006)
             response = client.get_data(search_by="dtxsid", search_for="DTXSID0021125")
             response = client.get_data(search_by="aeid", search_for=1386)
+            responses = client.get_data(search_by="dtxsid", search_for=["DTXSID0021125", "DTXSID7020182"])
+
+            # Large assays can be decoded one row at a time while downloading
+            for row in client.get_data(search_by="aeid", search_for=1386, stream=True):
+                print(row)
 
         """
     
@@ -82,6 +98,9 @@ class BioActivityData(BaseAPIClient):
 
         if search_by not in ["spid", "m4id", "dtxsid", "aeid"]:
             raise ValueError("search by must be one of 'spid', 'm4id', 'dtxsid', 'aeid'")
+
+        if isinstance(search_for, list):
+            return self._fan_out(partial(self.get_data, search_by), search_for, **kwargs)
         
         if search_by == "spid":
             if not isinstance(search_for, str):
@@ -118,6 +137,7 @@ class BioActivityData(BaseAPIClient):
                 - The AEID of the assay.
             - kwargs: Dict
                 - Additional keyword arguments.
+                  `output` is an optional result type, 'pandas', 'arrow' or 'records'.
             
         #### Returns:
             - Dict[str, Any]
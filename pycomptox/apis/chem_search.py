@@ -1,15 +1,49 @@
 from ..core.base_client import BaseAPIClient
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, Iterable, Iterator, List, Tuple
 import json
 
+if TYPE_CHECKING:  # pragma: no cover
+    from ..local.chemical_index import ChemicalIndex
+
+# Maximum number of values the batch endpoints accept in a single request.
+# Larger lists are split into chunks of this size and sent concurrently.
+SEARCH_BATCH_LIMIT = 200
+FATE_BATCH_LIMIT = 1000
+DETAILS_BATCH_LIMIT = 200
+GHS_BATCH_LIMIT = 200
+PROPERTIES_BATCH_LIMIT = 200
+
 class ChemSearch(BaseAPIClient):
     """
     #### Description: 
          Client for Chemical search. This client provides methods to search chemicals based on various parameters.
+         With a local `index`, `get_chemical` searches are answered from the index when it has hits.
     """
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, index: "ChemicalIndex" = None, **kwargs):
+        """
+        :param index: Optional `pycomptox.local.ChemicalIndex` answering searches without a request.
+        """
+        super().__init__(api_key, **kwargs)
+        self.index = index
+
+    def _local(self, endpoint: str, kwargs: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        Answer start-with, equal and contain searches from the index; a search without hits is sent.
+        """
+        if self.index is None or not endpoint.startswith("chemical/search/"):
+            return False, None
+
+        op, _, word = endpoint[len("chemical/search/"):].partition("/")
+        params = kwargs.get("params") or {}
+        if op not in ("start-with", "equal", "contain") or not word or "/" in word:
+            return False, None
+        if params.get("projection", "chemicalsearchall") != "chemicalsearchall":
+            return False, None
+
+        top = params.get("top")
+        hits = self.index.search(op, word, top=int(top) if top is not None else None)
+        return bool(hits), hits
 
     """
     #### GET Methods
@@ -114,9 +148,11 @@ class ChemSearch(BaseAPIClient):
         """
         #### Description:
             note : Search batch of values (values are separated by EOL character and maximum 200 values are allowed).
+            Longer lists are split into chunks of 200 that are sent concurrently and merged into one list.
 
         #### Input Parameters:
             - data_list: List of DTXCID or DTXSID
+            - max_workers: Optional number of chunks sent concurrently. Defaults to the client's max_workers.
 
         #### Output Schema:
             {
@@ -136,15 +172,12 @@ class ChemSearch(BaseAPIClient):
             client = ChemSearch(api_key=api_key)
             response = client.by_batch(data_list=["DTXCID30182", "DTXCID30182"])
         """
-        kwargs = {}
-        kwargs["data"] = '\n'.join(data_list)
-
         headers = {}
         headers["Content-Type"] = "text/plain"
 
         resource_id = f"chemical/search/equal/"
 
-        return self.post(resource_id, headers=headers, **kwargs)
+        return self._post_batch(resource_id, data_list, SEARCH_BATCH_LIMIT, headers=headers, as_text=True, **kwargs)
     
     def by_mass_batch(self, data_list: List[str], query_params: Dict[str, Any] = None) -> Dict[str, Any]:
         # TO be implemented
@@ -160,13 +193,15 @@ class ChemFate(BaseAPIClient):
          Client for Chemical Fate search. This client provides methods to search chemicals batch of DTXIDS and single DTXID.
     """
      
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
     def get_dtxids_batch(self, data_list: List[str], **kwargs) -> Dict[str, Any]:
         """
         ####  Description:
             Fetch fate data for a batch of DTXSIDs . Maximum 1000 DTXSIDs are allowed in a single request.
+            Longer lists are split into chunks of 1000 that are sent concurrently and merged into one list.
+            With a client cache, records are cached per DTXSID and only uncached DTXSIDs are requested.
 
         #### request body:
             ["string"]
@@ -190,15 +225,33 @@ class ChemFate(BaseAPIClient):
             client = ChemFate(api_key=api_key)
             response = client.get_dtxids_batch(data_list=["DTXSID7020182"], query_params={})
         """
-        kwargs = {}
-        kwargs["json"] = data_list
+        headers = {}
+        headers["Content-Type"] = "application/json"
+
+        resource_id = f"chemical/fate/search/by-dtxsid/"
+
+        return self._post_records(resource_id, data_list, FATE_BATCH_LIMIT, headers=headers, **kwargs)
 
+    def iter_dtxids_batch(self, data: Iterable[str], window: int = None, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        ####  Description:
+            Streaming version of get_dtxids_batch for DTXSID sets of any size.
+            DTXSIDs are read lazily from any iterable (a generator, a database cursor or a file handle
+            with one DTXSID per line) and fate records are yielded, in input order, as each chunk of
+            1000 completes. At most `window` chunks are in flight, so memory stays bounded.
+
+        #### Example:
+            client = ChemFate(api_key=api_key)
+            with open("dtxsids.txt") as f:
+                for record in client.iter_dtxids_batch(f, window=4):
+                    ...
+        """
         headers = {}
         headers["Content-Type"] = "application/json"
 
         resource_id = f"chemical/fate/search/by-dtxsid/"
 
-        return self.post(resource_id, headers=headers, **kwargs)
+        return self._iter_records(resource_id, data, FATE_BATCH_LIMIT, headers=headers, window=window, **kwargs)
     
     def by_dtxsid(self, dtxsid: str, query_params: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -247,14 +300,14 @@ class ChemList(BaseAPIClient):
     
     """
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
 
     def get_list_types(self, **kwargs) -> Dict[str, Any]:
         """
         #### Description:
-            Fetch list types.
+            Fetch list types. The response is memoized in-process (see `pycomptox.core.cache.catalogue_cache`).
 
         #### Output Schema:
             [
@@ -303,6 +356,10 @@ class ChemList(BaseAPIClient):
             response = client.get_public_list(op="name", value="40CFR1164")
             kwargs = {"params": {"projection": "chemicallistwithdtxsids"}
             response = client.get_public_list(op="type", value="other", **kwargs)
+
+            # Large lists can be decoded one list at a time while downloading
+            for chem_list in client.get_public_list(op="type", value="other", stream=True, **kwargs):
+                print(chem_list["listName"])
         """
         if op not in ["name", "type", "dtxsid"]:
             raise ValueError("Invalid operator. Valid values are 'name', 'dtxsid', 'type'")
@@ -357,7 +414,7 @@ class ChemList(BaseAPIClient):
     def get_all_public_lists(self, **kwargs) -> Dict[str, Any]:
         """
         #### Description:
-            Fetch all public lists.
+            Fetch all public lists. The response is memoized in-process (see `pycomptox.core.cache.catalogue_cache`).
 
         #### Output Schema:
             [
@@ -378,6 +435,10 @@ class ChemList(BaseAPIClient):
         #### Example:
             client = ChemList(api_key=api_key)
             response = client.get_all_public_lists()
+
+            # Decode one list at a time while downloading
+            for chem_list in client.get_all_public_lists(stream=True):
+                print(chem_list["listName"])
         """
         resource_id = f"chemical/list/"
         
@@ -389,8 +450,8 @@ class ChemDetails(BaseAPIClient):
     #### Description: 
          Client for Chemical Details search. This client provides methods to search chemicals based on dtxsid or dtxcid.
     """
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
     def get_chemical_details(self, by :str, word: str, **kwargs) -> Dict[str, Any]:
         """
@@ -467,6 +528,8 @@ class ChemDetails(BaseAPIClient):
         """
         #### Description:
             Fetch chemical details based on DTXSID or DTXCID in batch.
+            Lists of any size are accepted; they are split into chunks of 200 that are sent concurrently.
+            With a client cache, records are cached per ID and only uncached IDs are requested.
 
         #### Input Parameters:
             - by: Operator to search chemical. Valid values are 'dtxsid', 'dtxcid'
@@ -493,13 +556,10 @@ class ChemDetails(BaseAPIClient):
         elif by == "dtxcid":
             resource_id = f"chemical/detail/search/by-dtxcid/"
         
-        kwargs = {}
-        kwargs["json"] = data_list
-
         headers = {}
         headers["Content-Type"] = "application/json"
 
-        return self.post(resource_id, headers=headers, **kwargs)
+        return self._post_records(resource_id, data_list, DETAILS_BATCH_LIMIT, key_field=by, headers=headers, **kwargs)
     
 
 class GHSClassExist(BaseAPIClient):
@@ -508,8 +568,8 @@ class GHSClassExist(BaseAPIClient):
         This endpoint will return Y if Pubchem has GHS Safety data otherwise it will return N.
     """
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
     
     def if_class_exist(self, dtx_id:str, **kwargs) -> Dict[str, Any]:
         """
@@ -538,6 +598,7 @@ class GHSClassExist(BaseAPIClient):
         """
         #### Description:
             Similar to if_class_exist but for batch of DTXSIDs.
+            Lists of any size are accepted; they are split into chunks of 200 that are sent concurrently.
         
         #### Input Parameters:
             - dtx_id_list: List of DTXSIDs
@@ -555,14 +616,11 @@ class GHSClassExist(BaseAPIClient):
             client = GHSClassExist(api_key=api_key)
             response = client.if_class_exist_batch(dtx_id_list=["DTXSID1020560"])
         """
-        kwargs = {}
-        kwargs["json"] = dtx_id_list
-
         headers = {}
         headers["Content-Type"] = "application/json"
         resource_id = f"chemical/ghslink/to-dtxsid/" 
 
-        return self.post(resource_id, headers=headers, **kwargs)
+        return self._post_batch(resource_id, dtx_id_list, GHS_BATCH_LIMIT, headers=headers, **kwargs)
 
 
 class SystemIUPAC(BaseAPIClient):
@@ -571,8 +629,8 @@ class SystemIUPAC(BaseAPIClient):
         This endpoint returns smile code, InChlKey or InChl for a chemical name.
     """
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
     def get_iupac(self, chem_name: str, what:str, **kwargs) -> str:
         """
@@ -614,13 +672,14 @@ class ChemProperties(BaseAPIClient):
         Get Chemical properties.
     """
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
     def get_properties(self, by: str, params: Dict[str, Any] = None , **kwargs) -> Dict[str, Any]:
         """
         #### Description:
-            Get Chemical properties.
+            Get Chemical properties. The 'experimental' and 'predicted' name catalogues are memoized
+            in-process (see `pycomptox.core.cache.catalogue_cache`).
 
         #### Input Parameters:
             - by: Operator to search chemical. Valid values are 'propid', 'dtxsid', 'predicted', 'experimental'
@@ -689,6 +748,8 @@ class ChemProperties(BaseAPIClient):
         """
         #### Description:
             Get Chemical properties in batch.
+            Lists of any size are accepted; they are split into chunks of 200 that are sent concurrently.
+            With a client cache, records are cached per DTXSID and only uncached DTXSIDs are requested.
 
         #### Input Parameters:
             - dtxsid_list: List of DTXSIDs
@@ -713,14 +774,34 @@ class ChemProperties(BaseAPIClient):
             client = ChemProperties(api_key=api_key)
             response = client.get_properties_batch(dtxsid_list=["DTXSID7020182"])
         """
-        kwargs = {}
-        kwargs["json"] = dtxsid_list
-
         headers = {}
         headers["Content-Type"] = "application/json"
         resource_id = f"chemical/property/search/by-dtxsid/" 
 
-        return self.post(resource_id, headers=headers, **kwargs)
+        return self._post_records(resource_id, dtxsid_list, PROPERTIES_BATCH_LIMIT, headers=headers, **kwargs)
+
+    def iter_properties_batch(self, dtxsids: Iterable[str], window: int = None, **kwargs) -> Iterator[Dict[str, Any]]:
+
+        """
+        #### Description:
+            Streaming version of get_properties_batch for DTXSID sets of any size.
+            DTXSIDs are read lazily from any iterable and property records are yielded, in input order,
+            as each chunk of 200 completes. At most `window` chunks are in flight, so memory stays bounded.
+
+        #### Input Parameters:
+            - dtxsids: Iterable of DTXSIDs, e.g. a file handle with one DTXSID per line
+            - window: Number of chunks in flight, defaults to the client's `max_workers`
+
+        #### Example:
+            client = ChemProperties(api_key=api_key)
+            for record in client.iter_properties_batch(dtxsids=cursor):
+                ...
+        """
+        headers = {}
+        headers["Content-Type"] = "application/json"
+        resource_id = f"chemical/property/search/by-dtxsid/"
+
+        return self._iter_records(resource_id, dtxsids, PROPERTIES_BATCH_LIMIT, headers=headers, window=window, **kwargs)
 
 
 class IndigoService(BaseAPIClient):
@@ -728,16 +809,16 @@ class IndigoService(BaseAPIClient):
     #### Description:
     """
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
 
 class ChemFile(BaseAPIClient):
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
 class Synonyms(BaseAPIClient):
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
\ No newline at end of file
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
\ No newline at end of file
@@ -1,20 +1,23 @@
 from ..core.base_client import BaseAPIClient
 from typing import Dict, Any, List, Union
+from functools import partial
 import json
 
 class FunctionalUse(BaseAPIClient):
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
     
-    def get_functional_use(self, type:str, dtxsid: str, **kwargs) -> Dict[str, Any]:
+    def get_functional_use(self, type:str, dtxsid: Union[str, List[str]], **kwargs) -> Dict[str, Any]:
         """
         #### Description: 
             Get functional use information for a given DTXSID. This function can return either the probability or the functional use information for a given DTXSID.
         
         #### Arguments:
             - type: str: The type of information to return. Must be either 'prob' or 'func'.
-            - dtxsid: str: The DTXSID for which to retrieve the functional use information.
-            - **kwargs: Dict: Additional arguments to pass to the request.
+            - dtxsid: Union[str, List[str]]: The DTXSID for which to retrieve the functional use information.
+                           A list of DTXSIDs is fetched concurrently and returned as a mapping of DTXSID to result.
+            - **kwargs: Dict: Additional arguments to pass to the request. `max_workers` caps the requests in flight for a list; `return_exceptions=True` maps failed IDs to their error instead of raising.
+                           `output` is an optional result type, 'pandas', 'arrow' or 'records'.
         
         #### Returns:
             - Dict: The response from the API.
@@ -42,6 +45,7 @@ class FunctionalUse(BaseAPIClient):
             ```python
             client = FunctionalUse(api_key=api_key)
             response = client.get_functional_use(type="prob", dtxsid="DTXSID7020182")
+            responses = client.get_functional_use(type="func", dtxsid=["DTXSID7020182", "DTXSID1020560"])
             print(response)
             ```
 
@@ -50,6 +54,9 @@ class FunctionalUse(BaseAPIClient):
         type = type.lower()
         if type not in ["prob", "func"]:
             raise ValueError("Type must be either 'prob' or 'func'.")
+
+        if isinstance(dtxsid, list):
+            return self._fan_out(partial(self.get_functional_use, type), dtxsid, **kwargs)
         
         if type == "prob":
             resource_id = f"exposure/functional-use/probability/search/by-dtxsid/{dtxsid}"
@@ -59,19 +66,22 @@ class FunctionalUse(BaseAPIClient):
         return self.get(resource_id, **kwargs)
     
 class Product(BaseAPIClient):
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
-    def get_product_data(self, type:str, dtxsid: str = None, **kwargs) -> Dict[str, Any]:
+    def get_product_data(self, type:str, dtxsid: Union[str, List[str]] = None, **kwargs) -> Dict[str, Any]:
         
         """
         #### Description:
             Get product data information for a given DTXSID. This function can return either the PUC or all product data information for a given DTXSID.
+            The PUC catalogue is memoized in-process (see `pycomptox.core.cache.catalogue_cache`).
         
         #### Arguments:
             - type: str: The type of information to return. Must be either 'puc' or 'all'.
-            - dtxsid: str: The DTXSID for which to retrieve the product data information.
-            - **kwargs: Dict: Additional arguments to pass to the request.
+            - dtxsid: Union[str, List[str]]: The DTXSID for which to retrieve the product data information.
+                           A list of DTXSIDs is fetched concurrently and returned as a mapping of DTXSID to result.
+            - **kwargs: Dict: Additional arguments to pass to the request. `max_workers` caps the requests in flight for a list; `return_exceptions=True` maps failed IDs to their error instead of raising.
+                           `output` is an optional result type, 'pandas', 'arrow' or 'records'.
         
         #### Returns:
             - Dict: The response from the API.
@@ -113,6 +123,7 @@ class Product(BaseAPIClient):
             ```python
             client = Product(api_key=api_key)
             response = client.get_product_data(type="puc", dtxsid="DTXSID7020182")
+            responses = client.get_product_data(type="all", dtxsid=["DTXSID7020182", "DTXSID1020560"])
             print(response)
             ```
         """
@@ -126,23 +137,27 @@ class Product(BaseAPIClient):
         elif type == "all":
             if dtxsid is None:
                 raise ValueError("When type is 'all', dtxsid must be provided.")
+            if isinstance(dtxsid, list):
+                return self._fan_out(partial(self.get_product_data, type), dtxsid, **kwargs)
             resource_id = f"exposure/product-data/search/by-dtxsid/{dtxsid}"
 
         return self.get(resource_id, **kwargs)
     
 class Httk(BaseAPIClient):
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
-    def get_httk_data(self, dtxsid: str, **kwargs) -> Dict[str, Any]:
+    def get_httk_data(self, dtxsid: Union[str, List[str]], **kwargs) -> Dict[str, Any]:
             
         """
         #### Description:
             Get httk data information for a given DTXSID.
 
         #### Arguments:
-            - dtxsid: str: The DTXSID for which to retrieve the httk data information.
-            - **kwargs: Dict: Additional arguments to pass to the request.
+            - dtxsid: Union[str, List[str]]: The DTXSID for which to retrieve the httk data information.
+                           A list of DTXSIDs is fetched concurrently and returned as a mapping of DTXSID to result.
+            - **kwargs: Dict: Additional arguments to pass to the request. `max_workers` caps the requests in flight for a list; `return_exceptions=True` maps failed IDs to their error instead of raising.
+                           `output` is an optional result type, 'pandas', 'arrow' or 'records'.
         
         #### Returns:
             {
@@ -167,27 +182,34 @@ class Httk(BaseAPIClient):
             ```python
             client = Httk(api_key=api_key)
             response = client.get_httk_data(dtxsid="DTXSID1020560")
+            responses = client.get_httk_data(dtxsid=["DTXSID1020560", "DTXSID7020182"], max_workers=16)
             print(response)
             ```
         """
+        if isinstance(dtxsid, list):
+            return self._fan_out(self.get_httk_data, dtxsid, **kwargs)
+
         resource_id = f"exposure/httk/search/by-dtxsid/{dtxsid}"
 
         return self.get(resource_id, **kwargs)
     
 class ListPresence(BaseAPIClient):
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
     
-    def get_list_presence(self, dtxsid: str = None, **kwargs) -> Dict[str, Any]:
+    def get_list_presence(self, dtxsid: Union[str, List[str]] = None, **kwargs) -> Dict[str, Any]:
 
         """
         #### Description:
             Get list presence information for a given DTXSID. This function can return either the list presence or the list presence tags for a given DTXSID.
         
         #### Arguments:
-            - dtxsid: str: The DTXSID for which to retrieve the list presence information.
-                           If no dtxsid is provided, the function will return the list presence tags.
-            - **kwargs: Dict: Additional arguments to pass to the request.
+            - dtxsid: Union[str, List[str]]: The DTXSID for which to retrieve the list presence information.
+                           If no dtxsid is provided, the function will return the list presence tags,
+                           which are memoized in-process (see `pycomptox.core.cache.catalogue_cache`).
+                           A list of DTXSIDs is fetched concurrently and returned as a mapping of DTXSID to result.
+            - **kwargs: Dict: Additional arguments to pass to the request. `max_workers` caps the requests in flight for a list; `return_exceptions=True` maps failed IDs to their error instead of raising.
+                           `output` is an optional result type, 'pandas', 'arrow' or 'records'.
 
         #### Returns:
             - Dict: The response from the API.
@@ -220,9 +242,13 @@ class ListPresence(BaseAPIClient):
             client = ListPresence(api_key=api_key)
             response = client.get_list_presence(dtxsid="DTXSID1020560")
             response = client.get_list_presence()
+            responses = client.get_list_presence(dtxsid=["DTXSID1020560", "DTXSID7020182"])
 
         """
 
+        if isinstance(dtxsid, list):
+            return self._fan_out(self.get_list_presence, dtxsid, **kwargs)
+
         if dtxsid is None:
             resource_id = f"exposure/list-presence/tags"
 
@@ -232,18 +258,20 @@ class ListPresence(BaseAPIClient):
         return self.get(resource_id, **kwargs)
     
 class GeneralExposure(BaseAPIClient):
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
     
-    def get_general_exposure(self, dtxsid: str, **kwargs) -> Dict[str, Any]:
+    def get_general_exposure(self, dtxsid: Union[str, List[str]], **kwargs) -> Dict[str, Any]:
 
         """
         #### Description:
             Get general exposure information for a given DTXSID.
 
         #### Arguments:
-            - dtxsid: str: The DTXSID for which to retrieve the general exposure information.
-            - **kwargs: Dict: Additional arguments to pass to the request.
+            - dtxsid: Union[str, List[str]]: The DTXSID for which to retrieve the general exposure information.
+                           A list of DTXSIDs is fetched concurrently and returned as a mapping of DTXSID to result.
+            - **kwargs: Dict: Additional arguments to pass to the request. `max_workers` caps the requests in flight for a list; `return_exceptions=True` maps failed IDs to their error instead of raising.
+                           `output` is an optional result type, 'pandas', 'arrow' or 'records'.
 
         #### Returns:
             {
@@ -263,26 +291,32 @@ class GeneralExposure(BaseAPIClient):
             ```python
             client = GeneralExposure(api_key=api_key)
             response = client.get_general_exposure(dtxsid="DTXSID1020560")
+            responses = client.get_general_exposure(dtxsid=["DTXSID1020560", "DTXSID7020182"])
             print(response)
             ```
         """
+        if isinstance(dtxsid, list):
+            return self._fan_out(self.get_general_exposure, dtxsid, **kwargs)
+
         resource_id = f"exposure/seem/general/search/by-dtxsid/{dtxsid}"
 
         return self.get(resource_id, **kwargs)
     
 class DemographicExposure(BaseAPIClient):
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
     
-    def get_demographic_exposure(self, dtxsid: str, **kwargs) -> Dict[str, Any]:
+    def get_demographic_exposure(self, dtxsid: Union[str, List[str]], **kwargs) -> Dict[str, Any]:
     
         """
         #### Description:
             Get demographic exposure information for a given DTXSID.
         
         #### Arguments:
-            - dtxsid: str: The DTXSID for which to retrieve the demographic exposure information.
-            - **kwargs: Dict: Additional arguments to pass to the request.
+            - dtxsid: Union[str, List[str]]: The DTXSID for which to retrieve the demographic exposure information.
+                           A list of DTXSIDs is fetched concurrently and returned as a mapping of DTXSID to result.
+            - **kwargs: Dict: Additional arguments to pass to the request. `max_workers` caps the requests in flight for a list; `return_exceptions=True` maps failed IDs to their error instead of raising.
+                           `output` is an optional result type, 'pandas', 'arrow' or 'records'.
         
         #### Returns:
             [
@@ -309,10 +343,14 @@ class DemographicExposure(BaseAPIClient):
             ```python
             client = DemographicExposure(api_key=api_key)
             response = client.get_demographic_exposure(dtxsid="DTXSID1020560")
+            responses = client.get_demographic_exposure(dtxsid=["DTXSID1020560", "DTXSID7020182"])
             print(response)
             ```
         """
 
+        if isinstance(dtxsid, list):
+            return self._fan_out(self.get_demographic_exposure, dtxsid, **kwargs)
+
         resource_id = f"exposure/seem/demographic/search/by-dtxsid/{dtxsid}"
 
         return self.get(resource_id, **kwargs)
@@ -1,11 +1,14 @@
 from ..core.base_client import BaseAPIClient
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, Iterable, Iterator, List, Union
 import json
 
+# Maximum number of DTXSIDs the hazard batch endpoints accept in a single request
+HAZARD_BATCH_LIMIT = 200
+
 class Hazard(BaseAPIClient):
    
-    def __init__(self, api_key: str):
-      super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+      super().__init__(api_key, **kwargs)
 
     def get_hazard(self, type: str, dtxsid:str, **kwargs) -> Dict[str, Any]:
         """
@@ -19,6 +22,7 @@ class Hazard(BaseAPIClient):
                 - The DTXSID of the chemical to fetch hazard information for.
             - kwargs: Dict
                 - Additional arguments to pass to the request.
+                  `output` is an optional result type, 'pandas', 'arrow' or 'records'.
         
         #### Returns:
             - Dict: The JSON response from the API.
@@ -83,31 +87,81 @@ class Hazard(BaseAPIClient):
         """
         #### Description:
             Similar to get_hazard, but fetches hazard information for multiple chemicals at once. 200 chemicals at a time.
+            Longer lists are split into chunks of 200 that are sent concurrently and merged into one list.
+            With a client cache, records are cached per DTXSID and only uncached DTXSIDs are requested.
+
+        #### Arguments:
+            - type: str
+                - The type of hazard to fetch. Must be one of 'human', 'eco', or 'all'.
+            - dtxsid_list: List[str]
+                - The DTXSIDs of the chemicals to fetch hazard information for.
+            - kwargs: Dict
+                - Additional arguments to pass to the request. `max_workers` sets the number of chunks sent concurrently.
+                  `output` is an optional result type, 'pandas', 'arrow' or 'records'.
+
+        #### Example:
+            ```python
+            client = Hazard(api_key=api_key, max_workers=8)
+            response = client.get_hazard_batch(type="all", dtxsid_list=dtxsids)
+            ```
         """
 
-        type  = type.lower()
-        if type not in ["human", "eco", "all"]:
-            raise ValueError("Invalid hazard type. Must be one of 'human', 'eco', or 'all'.")
+        resource_id = self._batch_resource(type)
 
-        if type == "all":
-            resource_id = "hazard/search/by-dtxsid/"
-        elif type == "human":
-            resource_id = "hazard/human/search/by-dtxsid/"
-        elif type == "eco":
-            resource_id = "hazard/eco/search/by-dtxsid/"
+        headers = {}
+        headers["Content-Type"] = "application/json"
+
+        return self._post_records(resource_id, dtxsid_list, HAZARD_BATCH_LIMIT, headers=headers, **kwargs)
+
+    def iter_hazard_batch(self, type: str, dtxsids: Iterable[str], window: int = None, **kwargs) -> Iterator[Dict[str, Any]]:
 
-        kwargs = {}
-        kwargs["json"] = dtxsid_list
+        """
+        #### Description:
+            Streaming version of get_hazard_batch for DTXSID sets of any size.
+            DTXSIDs are read lazily from any iterable (a list, a generator, a database cursor or a file
+            handle with one DTXSID per line) and the records are yielded, in input order, as each
+            chunk of 200 completes. At most `window` chunks are in flight, so memory stays bounded.
+
+        #### Arguments:
+            - type: str
+                - The type of hazard to fetch. Must be one of 'human', 'eco', or 'all'.
+            - dtxsids: Iterable[str]
+                - The DTXSIDs of the chemicals to fetch hazard information for.
+            - window: int
+                - Number of chunks in flight, defaults to the client's `max_workers`.
+            - kwargs: Dict
+                - Additional arguments to pass to the request.
+
+        #### Example:
+            ```python
+            client = Hazard(api_key=api_key, max_workers=8)
+            with open("dtxsids.txt") as f:
+                for record in client.iter_hazard_batch(type="all", dtxsids=f):
+                    ...
+            ```
+        """
+        resource_id = self._batch_resource(type)
 
         headers = {}
         headers["Content-Type"] = "application/json"
 
-        return self.post(resource_id, **kwargs)
+        return self._iter_records(resource_id, dtxsids, HAZARD_BATCH_LIMIT, headers=headers, window=window, **kwargs)
+
+    def _batch_resource(self, type: str) -> str:
+        type  = type.lower()
+        if type not in ["human", "eco", "all"]:
+            raise ValueError("Invalid hazard type. Must be one of 'human', 'eco', or 'all'.")
+
+        if type == "all":
+            return "hazard/search/by-dtxsid/"
+        elif type == "human":
+            return "hazard/human/search/by-dtxsid/"
+        return "hazard/eco/search/by-dtxsid/"
     
 class SkinEye(BaseAPIClient):
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
     def get_by_dtxsid(self, dtxsid: Union[str, List[str]],  **kwargs) -> Dict[str, Any]:
         """
@@ -119,6 +173,7 @@ class SkinEye(BaseAPIClient):
                 - The DTXSID of the chemical to fetch skin and eye irritation information for.
             - kwargs: Dict
                 - Additional arguments to pass to the request.
+                  `output` is an optional result type, 'pandas', 'arrow' or 'records'.
         
         #### Returns:
             {
@@ -137,7 +192,8 @@ class SkinEye(BaseAPIClient):
                 "classification": "string"
             }
 
-            in case of batch request:
+            in case of batch request (lists are sent in chunks of 200 and, with a client cache,
+            records are cached per DTXSID so only uncached DTXSIDs are requested):
 
             [
                  "string"
@@ -151,12 +207,10 @@ class SkinEye(BaseAPIClient):
             ```
         """
         if isinstance(dtxsid, list):
-            kwargs = {}
-            kwargs["json"] = dtxsid
             headers = {}
             headers["Content-Type"] = "application/json"
             resource_id = "hazard/skin-eye/search/by-dtxsid/"
-            return self.post(resource_id, **kwargs)
+            return self._post_records(resource_id, dtxsid, HAZARD_BATCH_LIMIT, headers=headers, **kwargs)
         
         elif isinstance(dtxsid, str):
             resource_id = f"hazard/skin-eye/search/by-dtxsid/{dtxsid}"
@@ -164,8 +218,8 @@ class SkinEye(BaseAPIClient):
         
 class Cancer(BaseAPIClient):
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
 
     def get_by_dtxsid(self, dtxsid: Union[str, List[str]],  **kwargs) -> Dict[str, Any]:
 
@@ -178,6 +232,7 @@ class Cancer(BaseAPIClient):
                 - The DTXSID of the chemical to fetch cancer information for.
             - kwargs: Dict
                 - Additional arguments to pass to the request.
+                  `output` is an optional result type, 'pandas', 'arrow' or 'records'.
         
         #### Returns:
             {
@@ -189,7 +244,8 @@ class Cancer(BaseAPIClient):
                 "exposureRoute": "string"
             }
 
-            in case of batch request:
+            in case of batch request (lists are sent in chunks of 200 and, with a client cache,
+            records are cached per DTXSID so only uncached DTXSIDs are requested):
 
             [
                  "string"
@@ -203,12 +259,10 @@ class Cancer(BaseAPIClient):
             ```
         """
         if isinstance(dtxsid, list):
-            kwargs = {}
-            kwargs["json"] = dtxsid
             headers = {}
             headers["Content-Type"] = "application/json"
             resource_id = "hazard/cancer-summary/search/by-dtxsid/"
-            return self.post(resource_id, **kwargs)
+            return self._post_records(resource_id, dtxsid, HAZARD_BATCH_LIMIT, headers=headers, **kwargs)
         
         elif isinstance(dtxsid, str):
             resource_id = f"hazard/cancer-summary/search/by-dtxsid/{dtxsid}"
@@ -216,8 +270,8 @@ class Cancer(BaseAPIClient):
         
 class Genotox(BaseAPIClient):
 
-    def __init__(self, api_key: str):
-        super().__init__(api_key)
+    def __init__(self, api_key: str, **kwargs):
+        super().__init__(api_key, **kwargs)
     
     def get_summary_data(self, dtxsid:Union[str, List[str]], **kwargs) -> Dict[str, Any]:
         """
@@ -229,6 +283,7 @@ class Genotox(BaseAPIClient):
                 - The dtxsid of the chemical to fetch genotoxicity summary data for.
             - kwargs: Dict
                 - Additional arguments to pass to the request.
+                  `output` is an optional result type, 'pandas', 'arrow' or 'records'.
         
         #### Returns:
             {
@@ -244,7 +299,8 @@ class Genotox(BaseAPIClient):
             "assayType": "string"
             }
 
-            in case of batch request:
+            in case of batch request (lists are sent in chunks of 200 and, with a client cache,
+            records are cached per DTXSID so only uncached DTXSIDs are requested):
 
             [
                  "string"
@@ -258,12 +314,10 @@ class Genotox(BaseAPIClient):
             ```
         """
         if isinstance(dtxsid, list):
-            kwargs = {}
-            kwargs["json"] = dtxsid
             headers = {}
             headers["Content-Type"] = "application/json"
             resource_id = "hazard/genetox/summary/search/by-dtxsid/"
-            return self.post(resource_id, **kwargs)
+            return self._post_records(resource_id, dtxsid, HAZARD_BATCH_LIMIT, headers=headers, **kwargs)
         
         elif isinstance(dtxsid, str):
             resource_id = f"hazard/genetox/summary/search/by-dtxsid/{dtxsid}"
@@ -279,6 +333,7 @@ class Genotox(BaseAPIClient):
                 - The dtxsid of the chemical to fetch genotoxicity detail data for.
             - kwargs: Dict
                 - Additional arguments to pass to the request.
+                  `output` is an optional result type, 'pandas', 'arrow' or 'records'.
         
         #### Returns:
             {
@@ -295,7 +350,8 @@ class Genotox(BaseAPIClient):
             "url": "string"
             }
 
-            in case of batch request:
+            in case of batch request (lists are sent in chunks of 200 and, with a client cache,
+            records are cached per DTXSID so only uncached DTXSIDs are requested):
 
             [
                  "string"
@@ -309,12 +365,10 @@ class Genotox(BaseAPIClient):
             ```
         """
         if isinstance(dtxsid, list):
-            kwargs = {}
-            kwargs["json"] = dtxsid
             headers = {}
             headers["Content-Type"] = "application/json"
             resource_id = "hazard/genetox/details/search/by-dtxsid/"
-            return self.post(resource_id, **kwargs)
+            return self._post_records(resource_id, dtxsid, HAZARD_BATCH_LIMIT, headers=headers, **kwargs)
         
         elif isinstance(dtxsid, str):
             resource_id = f"hazard/genetox/details/search/by-dtxsid/{dtxsid}"
@@ -0,0 +1,168 @@
+"""
+#### Description:
+    Single entry point to every CompTox API group. A `CompTox` object holds one configuration,
+    one connection pool, one response cache and one rate limiter; the API clients it exposes are
+    built on first access and share that state, so all calls of an application reuse the same
+    pooled connections and throttling.
+
+#### Example:
+    ```python
+    with CompTox(api_key=api_key, rate_limiter=TokenBucket(rate=5, burst=5)) as comptox:
+        chemicals = comptox.chem_search.get_chemical(op="equal", word="DTXSID7020182")
+        hazard = comptox.hazard.get_hazard_batch(type="all", dtxsid_list=dtxsids)
+        httk = comptox.httk.get_httk_data(dtxsid=dtxsids)
+
+    async with AsyncCompTox(api_key=api_key) as comptox:
+        hazard = await comptox.hazard.get_hazard(type="all", dtxsid="DTXSID7020182")
+    ```
+"""
+from typing import Any, Callable, List
+import importlib
+import threading
+from .core.base_client import conf
+from .core.cache import catalogue_cache
+from .core.config import Config
+from .core.throttle import RetryPolicy, TokenBucket
+
+
+class _SubClient:
+    """
+    Facade attribute building an API client on first access, then caching it on the instance.
+    """
+    def __init__(self, module: str, name: str):
+        self.module = module
+        self.name = name
+
+    def __set_name__(self, owner, attr):
+        self.attr = attr
+
+    def __get__(self, facade, owner=None):
+        if facade is None:
+            return self
+        with facade._lock:
+            client = facade.__dict__.get(self.attr)
+            if client is None:
+                client = facade._build(self.module, self.name)
+                facade.__dict__[self.attr] = client
+        return client
+
+
+class CompTox:
+    """
+    Client for all CompTox APIs sharing one configuration, transport, cache and rate limiter.
+
+    Each API group (e.g., `hazard`, `httk`) is an attribute whose client is created, and whose
+    module is imported, the first time it is used.
+    """
+    _apis = "pycomptox.apis"
+    _prefix = ""
+
+    # Chemical APIs
+    chem_search = _SubClient("chem_search", "ChemSearch")
+    chem_fate = _SubClient("chem_search", "ChemFate")
+    chem_list = _SubClient("chem_search", "ChemList")
+    chem_details = _SubClient("chem_search", "ChemDetails")
+    ghs = _SubClient("chem_search", "GHSClassExist")
+    iupac = _SubClient("chem_search", "SystemIUPAC")
+    properties = _SubClient("chem_search", "ChemProperties")
+    # Hazard APIs
+    hazard = _SubClient("hazard", "Hazard")
+    skin_eye = _SubClient("hazard", "SkinEye")
+    cancer = _SubClient("hazard", "Cancer")
+    genotox = _SubClient("hazard", "Genotox")
+    # Bioactivity APIs
+    assay = _SubClient("bioactivity", "BioActivityAssay")
+    bioactivity = _SubClient("bioactivity", "BioActivityData")
+    # Exposure APIs
+    functional_use = _SubClient("exposure", "FunctionalUse")
+    product = _SubClient("exposure", "Product")
+    httk = _SubClient("exposure", "Httk")
+    list_presence = _SubClient("exposure", "ListPresence")
+    general_exposure = _SubClient("exposure", "GeneralExposure")
+    demographic_exposure = _SubClient("exposure", "DemographicExposure")
+
+    def __init__(self, api_key: str, config: Config = None, transport=None, cache=None,
+                 memo_cache=catalogue_cache, rate_limiter: TokenBucket = None, retry: RetryPolicy = None,
+                 max_workers: int = None, coalesce: bool = True, hooks: List[Callable[[Any], Any]] = None):
+        """
+        :param api_key: CompTox API key.
+        :param config: Base URL, pool sizes and worker defaults, the module-level `conf` when not given.
+        :param transport: Connection pool, a new one owned by this object when not given. An owned pool
+                          holds requests beyond `config.pool_maxsize` until a connection is free.
+        :param cache: Optional response cache (e.g., `DiskCache`) shared by every API group.
+        :param memo_cache: In-process cache of reference catalogues.
+        :param rate_limiter: Limiter shared by every API group, the process-wide one when not given.
+        :param retry: Retry policy for throttled and failed responses.
+        :param max_workers: Concurrent requests per batch or fan-out call.
+        :param coalesce: Share one response between identical requests in flight.
+        :param hooks: Instrumentation hooks called with each `RequestEvent`.
+        """
+        self.api_key = api_key
+        self.config = config if config is not None else conf
+        self._owns_transport = transport is None
+        self.transport = transport if transport is not None else self._new_transport()
+        self.cache = cache
+        self.memo_cache = memo_cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.max_workers = max_workers
+        self.coalesce = coalesce
+        self.hooks = list(hooks or [])
+        self._lock = threading.RLock()
+
+    def _new_transport(self):
+        from .core.transport import Transport
+
+        # Concurrent fan-outs (e.g. `DossierBuilder`) can outnumber the connections; queue them instead
+        return Transport(pool_connections=self.config.pool_connections, pool_maxsize=self.config.pool_maxsize,
+                         pool_block=True)
+
+    def _build(self, module: str, name: str) -> Any:
+        cls = getattr(importlib.import_module(f"{self._apis}.{module}"), self._prefix + name)
+        return cls(
+            self.api_key, config=self.config, transport=self.transport, cache=self.cache, memo_cache=self.memo_cache,
+            rate_limiter=self.rate_limiter, retry=self.retry, max_workers=self.max_workers,
+            coalesce=self.coalesce, hooks=self.hooks,
+        )
+
+    def close(self) -> None:
+        """
+        Close the connection pool, unless it was passed in by the caller.
+        """
+        if self._owns_transport:
+            self.transport.close()
+
+    def __enter__(self) -> "CompTox":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class AsyncCompTox(CompTox):
+    """
+    Asyncio counterpart of `CompTox`: every API group is the `Async*` client of `pycomptox.apis.aio`.
+    """
+    _prefix = "Async"
+
+    def _new_transport(self):
+        from .core.async_client import AsyncTransport
+
+        return AsyncTransport()
+
+    def _build(self, module: str, name: str) -> Any:
+        # Every async client lives in pycomptox.apis.aio
+        return super()._build("aio", name)
+
+    async def close(self) -> None:
+        """
+        Close the connection pool of the running event loop, unless it was passed in by the caller.
+        """
+        if self._owns_transport:
+            await self.transport.close()
+
+    async def __aenter__(self) -> "AsyncCompTox":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
@@ -0,0 +1,403 @@
+from ..utils.exceptions import APIRequestError
+from ..utils.batching import chunked, iter_ids, merge_results
+from ..utils.jsonstream import AsyncClosingIterator, JSONArrayParser
+from ..utils import jsonlib
+from typing import Dict, Any, AsyncIterator, Callable, Iterable, List, Optional
+from .base_client import BaseAPIClient
+from .metrics import RequestEvent
+from .singleflight import async_single_flight
+import asyncio
+import collections
+import copy
+import weakref
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+class AsyncTransport:
+    """
+    Pooled asyncio HTTP transport shared by async API clients.
+
+    One `aiohttp.ClientSession` is kept per event loop, so every client using the
+    transport on that loop shares the same connection pool. A session is closed by `close()`
+    or, when its loop is shut down by `asyncio.run()`, as the loop cancels its remaining tasks.
+    Loops that are closed without cancelling their tasks must call `close()` before.
+    """
+    def __init__(self, limit: int = 100, limit_per_host: int = 100):
+        """
+        :param limit: Maximum number of simultaneous connections.
+        :param limit_per_host: Maximum number of simultaneous connections to one host.
+        """
+        if aiohttp is None:
+            raise ImportError("aiohttp is required for the async clients: pip install pycomptox[async]")
+
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self._sessions = weakref.WeakKeyDictionary()
+        self._guards = weakref.WeakKeyDictionary()
+
+    def session(self) -> "aiohttp.ClientSession":
+        """
+        Return the session bound to the running event loop, creating it on first use.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[loop] = session
+            self._guards[loop] = loop.create_task(self._close_on_shutdown(loop, session))
+        return session
+
+    async def _close_on_shutdown(self, loop: asyncio.AbstractEventLoop, session: "aiohttp.ClientSession") -> None:
+        """
+        Wait until cancelled, by `close()` or by the loop shutting down, then close `session`.
+        """
+        try:
+            await loop.create_future()
+        finally:
+            if self._sessions.get(loop) is session:
+                del self._sessions[loop]
+                self._guards.pop(loop, None)
+            await session.close()
+
+    async def close(self) -> None:
+        """
+        Close the session bound to the running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.pop(loop, None)
+        guard = self._guards.pop(loop, None)
+        if guard is not None:
+            guard.cancel()
+        if session is not None:
+            await session.close()
+
+    async def __aenter__(self) -> "AsyncTransport":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+
+_default_async_transport: Optional[AsyncTransport] = None
+
+
+def get_default_async_transport() -> AsyncTransport:
+    """
+    Return the process-wide async transport, creating it on first use.
+    """
+    global _default_async_transport
+    if _default_async_transport is None:
+        _default_async_transport = AsyncTransport()
+    return _default_async_transport
+
+
+class AsyncBaseAPIClient(BaseAPIClient):
+    """
+    Asyncio counterpart of `BaseAPIClient`.
+
+    `get` and `post` return coroutines, so an API client mixed in after this class
+    keeps its URL building and validation but returns awaitables, e.g.
+    `class AsyncChemSearch(AsyncBaseAPIClient, ChemSearch)`.
+    Argument validation still happens when the method is called, before awaiting.
+    Identical requests in flight on the same event loop are coalesced.
+    """
+    def _default_transport(self) -> AsyncTransport:
+        return get_default_async_transport()
+
+    async def _request(self, method: str, url: str, headers: Dict[str, str] = None, **kwargs) -> Dict[str, Any]:
+        """
+        Helper coroutine to send an HTTP request.
+
+        :param method: The HTTP method (e.g., 'GET', 'POST', 'PUT', etc.)
+        :param url: The full URL to make the request to (relative to base_url)
+        :param headers: Additional headers to send with the request
+        :param kwargs: Additional arguments like params, data, or json.
+                       `use_cache=False` bypasses the response caches.
+                       `coalesce` overrides the client's setting for this request.
+                       `stream=True` returns an async iterator over the elements of the JSON array.
+        :return: The response as a dictionary.
+        """
+        use_cache = kwargs.pop("use_cache", True)
+        coalesce = kwargs.pop("coalesce", self.coalesce)
+        stream = kwargs.pop("stream", False)
+
+        if headers is None:
+            headers = {}
+
+        headers["x-api-key"] = self.api_key
+        headers["Accept"] = "application/json"
+
+        event = self._new_event(method, url, kwargs)
+        if stream:
+            return await self._stream(method, url, headers, event=event, **kwargs)
+
+        try:
+            result = await self._fetch(method, url, headers, event, use_cache, coalesce, **kwargs)
+        except Exception as e:
+            self._emit(event, e)
+            raise
+        self._emit(event)
+        return result
+
+    async def _fetch(self, method: str, url: str, headers: Dict[str, str], event: Optional[RequestEvent],
+                     use_cache: bool, coalesce: bool, **kwargs) -> Any:
+        """
+        Serve a request from the caches or an identical request in flight, or send it.
+        """
+        key = self._request_key(method, url, kwargs)
+        if key is None:
+            return await self._send(method, url, headers, event=event, **kwargs)
+
+        caches = use_cache and self._caches(method, self._endpoint(url))
+        if caches:
+            hit, value = self._cache_lookup(method, url, key)
+            if event is not None:
+                event.cache = "hit" if hit else "miss"
+            if hit:
+                return value
+
+        if event is not None:
+            event.coalesced = coalesce
+
+        sent = []
+
+        async def fetch() -> Any:
+            sent.append(True)
+            if event is not None:
+                event.coalesced = False
+            result = await self._send(method, url, headers, event=event, **kwargs)
+            if use_cache:
+                self._cache_store(method, url, key, result)
+            return result
+
+        if not coalesce:
+            return await fetch()
+        result = await async_single_flight.do(key, fetch)
+        # Waiters get their own copy, so mutating a result never changes another caller's
+        return result if sent else copy.deepcopy(result)
+
+    async def _send(self, method: str, url: str, headers: Dict[str, str], event: RequestEvent = None,
+                    **kwargs) -> Dict[str, Any]:
+        """
+        Send the request over the transport and decode the response.
+        """
+        response = await self._open(method, url, headers, event=event, **kwargs)
+        try:
+            content = await response.read()
+            encoding = response.get_encoding()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise APIRequestError(f"Error during {method} request to {url}: {str(e) or type(e).__name__}")
+        finally:
+            response.release()
+        if event is not None:
+            event.response_bytes = len(content)
+
+        try:
+            return jsonlib.loads(content)
+
+        except ValueError:
+            text = content.decode(encoding, errors="replace")
+            return text if text.strip() else None
+
+    async def _stream(self, method: str, url: str, headers: Dict[str, str], chunk_size: int = 65536,
+                      event: RequestEvent = None, **kwargs) -> AsyncIterator[Any]:
+        """
+        Send the request and return an async iterator over the elements of the JSON array it returns.
+        """
+        try:
+            response = await self._open(method, url, headers, event=event, **kwargs)
+        except Exception as e:
+            self._emit(event, e)
+            raise
+
+        released = []
+
+        def release(error: BaseException = None) -> None:
+            if not released:
+                released.append(True)
+                response.release()
+                self._emit(event, error)
+
+        async def records() -> AsyncIterator[Any]:
+            parser = JSONArrayParser()
+            error = None
+            try:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    if event is not None:
+                        event.response_bytes += len(chunk)
+                    for record in parser.feed(chunk):
+                        yield record
+                for record in parser.close():
+                    yield record
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = APIRequestError(f"Error while streaming {method} response from {url}: {str(e) or type(e).__name__}")
+                raise error
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                release(error)
+
+        # Releases the connection even when the iterator is dropped before its first record
+        return AsyncClosingIterator(records(), release)
+
+    async def _open(self, method: str, url: str, headers: Dict[str, str], event: RequestEvent = None,
+                    **kwargs) -> "aiohttp.ClientResponse":
+        """
+        Send the request and return the successful response, waiting on the rate limiter
+        and retrying like `BaseAPIClient._open`. The caller must release the response.
+        """
+        try:
+            session = self.transport.session()
+            attempt = 0
+            while True:
+                limiter = self._limiter()
+                if limiter is not None:
+                    delay = limiter.reserve()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                response = await session.request(method, url, headers=headers, **kwargs)
+                if event is not None:
+                    event.status = response.status
+                    event.retries = attempt
+                if not self.retry.should_retry(response.status, attempt):
+                    break
+
+                delay = self.retry.delay(attempt, response.headers.get("Retry-After"))
+                response.release()
+                if delay is None:
+                    raise APIRequestError(f"Error during {method} request to {url}: Retry-After "
+                                          f"{response.headers['Retry-After']} exceeds max_retry_after",
+                                          status_code=response.status)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+            if response.status >= 400:
+                response.release()
+            response.raise_for_status()
+            return response
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise APIRequestError(f"Error during {method} request to {url}: {str(e) or type(e).__name__}",
+                                  status_code=getattr(e, "status", None))
+
+    async def get(self, endpoint: str, headers: Dict[str, str] = None, output: str = None, **kwargs) -> Dict[str, Any]:
+        """
+        Make a GET request to the given endpoint with optional query parameters.
+
+        :param endpoint: The endpoint (e.g., '/data/resource')
+        :param headers: Optional headers for the request
+        :param output: Optional result type, 'pandas', 'arrow' or 'records'
+        :param kwargs: Additional arguments to pass to the request
+        :return: The JSON response from the API.
+        """
+        if not kwargs.get("stream", False):
+            answered, result = self._local(endpoint, kwargs)
+            if answered:
+                return self._output(endpoint, result, output)
+
+        url = f"{self.base_url}/{endpoint}"
+        result = await self._request("GET", url, headers=headers, **kwargs)
+        return self._output(endpoint, result, output, kwargs.get("stream", False))
+
+    async def post(self, endpoint: str, headers: Dict[str, str] = None, output: str = None, **kwargs) -> Dict[str, Any]:
+        """
+        Make a POST request to the given endpoint with optional data.
+
+        :param endpoint: The endpoint (e.g., '/data/resource')
+        :param headers: Optional headers for the request
+        :param output: Optional result type, 'pandas', 'arrow' or 'records'
+        :param kwargs: Additional arguments to pass to the request
+        :return: The JSON response from the API.
+        """
+        url = f"{self.base_url}/{endpoint}"
+        result = await self._request("POST", url, headers=headers, **kwargs)
+        return self._output(endpoint, result, output, kwargs.get("stream", False))
+
+    async def put(self, endpoint: str, headers: Dict[str, str] = None, data: Dict[str, Any] = None) -> Dict[str, Any]:
+        return await self._request("PUT", endpoint, headers=headers, json=data)
+
+    async def _post_batch(self, endpoint: str, data_list: List[str], chunk_size: int, headers: Dict[str, str] = None,
+                          as_text: bool = False, max_workers: int = None, output: str = None, **kwargs) -> List[Any]:
+        """
+        Async counterpart of `BaseAPIClient._post_batch`; at most `max_workers` chunks are in flight.
+        """
+        chunks = list(chunked(data_list, chunk_size))
+        semaphore = asyncio.Semaphore(max_workers if max_workers is not None else self.max_workers)
+
+        async def send(chunk: List[str]) -> Any:
+            body = {"data": "\n".join(chunk)} if as_text else {"json": chunk}
+            async with semaphore:
+                return await self.post(endpoint, headers=dict(headers or {}), **body, **kwargs)
+
+        if len(chunks) <= 1:
+            return self._output(endpoint, await send(chunks[0] if chunks else []), output)
+
+        return self._output(endpoint, merge_results(await asyncio.gather(*[send(chunk) for chunk in chunks])), output)
+
+    async def _fan_out(self, fetch: Callable[..., Any], ids: Iterable[Any], max_workers: int = None,
+                       return_exceptions: bool = False, **kwargs) -> Dict[Any, Any]:
+        """
+        Async counterpart of `BaseAPIClient._fan_out`; at most `max_workers` requests are in flight.
+        """
+        ids = list(dict.fromkeys(ids))
+        semaphore = asyncio.Semaphore(max_workers if max_workers is not None else self.max_workers)
+
+        async def send(id_: Any) -> Any:
+            async with semaphore:
+                try:
+                    return await fetch(id_, **kwargs)
+                except APIRequestError as e:
+                    if not return_exceptions:
+                        raise
+                    return e
+
+        results = await asyncio.gather(*[send(id_) for id_ in ids])
+        return dict(zip(ids, results))
+
+    async def _post_records(self, endpoint: str, data_list: List[str], chunk_size: int, key_field: str = "dtxsid",
+                            headers: Dict[str, str] = None, output: str = None, **kwargs) -> List[Any]:
+        """
+        Async counterpart of `BaseAPIClient._post_records`.
+        """
+        # Repeated IDs are sent and returned once, with or without a cache
+        data_list = list(dict.fromkeys(data_list))
+        caches = self._caches("POST", endpoint)
+        if not caches:
+            return await self._post_batch(endpoint, data_list, chunk_size, headers=headers, output=output, **kwargs)
+
+        keys, found, misses = self._record_lookup(caches, endpoint, data_list, kwargs.get("params"))
+        fresh = []
+        if misses:
+            fresh = await self._post_batch(endpoint, misses, chunk_size, headers=headers, use_cache=False, **kwargs)
+        else:
+            self._emit_record_hit(endpoint, list(keys))
+        return self._output(endpoint, self._record_merge(caches, endpoint, keys, found, misses, fresh, key_field), output)
+
+    async def _iter_records(self, endpoint: str, data: Iterable[str], chunk_size: int, key_field: str = "dtxsid",
+                            headers: Dict[str, str] = None, window: int = None, **kwargs) -> AsyncIterator[Any]:
+        """
+        Async counterpart of `BaseAPIClient._iter_records`; at most `window` chunks are in flight.
+        """
+        window = window if window is not None else self.max_workers
+        pending = collections.deque()
+        try:
+            for chunk in chunked(iter_ids(data), chunk_size):
+                pending.append(asyncio.ensure_future(
+                    self._post_records(endpoint, chunk, chunk_size, key_field=key_field, headers=headers, **kwargs)
+                ))
+                if len(pending) >= window:
+                    for record in await pending.popleft():
+                        yield record
+            while pending:
+                for record in await pending.popleft():
+                    yield record
+        finally:
+            for task in pending:
+                task.cancel()
@@ -1,18 +1,140 @@
 from ..utils.exceptions import APIRequestError
-import requests
-from typing import Dict, Any
+from ..utils.batching import chunked, iter_ids, merge_results
+from ..utils.jsonstream import ClosingIterator, iter_json_array
+from ..utils import jsonlib
+from ..utils.frames import convert
+from typing import TYPE_CHECKING, Dict, Any, Callable, Iterable, Iterator, List, Optional, Tuple
 from .config import Config
-import json
+from .transport import Transport, get_default_transport
+from .cache import make_cache_key, catalogue_cache
+from .schemas import record_name, schema_for
+from .throttle import RetryPolicy, TokenBucket, get_rate_limiter
+from .singleflight import single_flight
+from .metrics import RequestEvent, batch_size, body_size, emit, endpoint_template, get_hooks
+from concurrent.futures import ThreadPoolExecutor
+import collections
+import copy
+import time
+
+if TYPE_CHECKING:  # pragma: no cover
+    import requests
 
 conf = Config(api_key="my_api_key", base_url="https://api-ccte.epa.gov")
 
 class BaseAPIClient:
     """
     Base client for interacting with HTTP APIs.
+
+    All clients share one pooled keep-alive transport unless a `transport` is given.
+    `max_workers` caps how many chunks of a batch request, or single-ID requests of a
+    fan-out, are sent concurrently. An optional `cache` (e.g., `DiskCache`) serves repeated
+    requests locally. Reference catalogues (list types, property names, assays, ...) are
+    additionally memoized in-process by `memo_cache`; pass `memo_cache=None` to disable it.
+
+    Requests wait on `rate_limiter`, or on the process-wide limiter set with
+    `pycomptox.core.throttle.set_rate_limit`, and 429/5xx responses are retried following `retry`.
+    With `coalesce`, identical requests already in flight in the process share one response.
+
+    Every call ends with a `RequestEvent` passed to the client's `hooks` and to the hooks
+    registered with `pycomptox.core.metrics.add_hook` (e.g., a `LatencyHistogram`).
+
+    The base URL and pool defaults come from `config`, the module-level `conf` when not given.
     """
-    def __init__(self, api_key: str):
-        self.base_url = conf.base_url
+    def __init__(self, api_key: str, transport: Transport = None, max_workers: int = None, cache=None,
+                 memo_cache=catalogue_cache, rate_limiter: TokenBucket = None, retry: RetryPolicy = None,
+                 coalesce: bool = True, hooks: List[Callable[[RequestEvent], Any]] = None, config: Config = None):
+        self.config = config if config is not None else conf
+        self.base_url = self.config.base_url
         self.api_key = api_key
+        self.transport = transport if transport is not None else self._default_transport()
+        self.max_workers = max_workers if max_workers is not None else self.config.max_workers
+        self.cache = cache
+        self.memo_cache = memo_cache
+        self.rate_limiter = rate_limiter
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.coalesce = coalesce
+        self.hooks = list(hooks or [])
+
+    def _default_transport(self) -> Transport:
+        return get_default_transport(self.config.pool_connections, self.config.pool_maxsize)
+
+    def _limiter(self) -> Optional[TokenBucket]:
+        return self.rate_limiter if self.rate_limiter is not None else get_rate_limiter()
+
+    def _hooks(self) -> List[Callable[[RequestEvent], Any]]:
+        return self.hooks + get_hooks() if self.hooks else get_hooks()
+
+    def _new_event(self, method: str, url: str, kwargs: Dict[str, Any]) -> Optional[RequestEvent]:
+        """
+        Start measuring a call, or return None when no instrumentation hook is registered.
+        """
+        if not self._hooks():
+            return None
+        json_body, data = kwargs.get("json"), kwargs.get("data")
+        return RequestEvent(endpoint_template(self._endpoint(url)), method, request_bytes=body_size(json_body, data),
+                            batch_size=batch_size(json_body, data))
+
+    def _emit(self, event: Optional[RequestEvent], error: BaseException = None) -> None:
+        if event is None:
+            return
+        if error is not None:
+            event.error = type(error).__name__
+            event.status = getattr(error, "status_code", None) or event.status
+        emit(event.finish(), self._hooks())
+
+    def _endpoint(self, url: str) -> str:
+        """
+        Return the endpoint of a full URL, relative to base_url.
+        """
+        prefix = f"{self.base_url}/"
+        return url[len(prefix):] if url.startswith(prefix) else url
+
+    def _caches(self, method: str, endpoint: str) -> List[Any]:
+        """
+        Caches that apply to a request, fastest first.
+        """
+        if method not in ("GET", "POST"):
+            return []
+        return [cache for cache in (self.memo_cache, self.cache) if cache is not None and cache.ttl(endpoint) != 0]
+
+    def _request_key(self, method: str, url: str, kwargs: Dict[str, Any]) -> Optional[str]:
+        """
+        Key identifying a request by method, base_url, endpoint, query parameters and body, used
+        for caching and coalescing. None for methods that are neither cached nor coalesced.
+        """
+        if method not in ("GET", "POST"):
+            return None
+        return make_cache_key(method, self._endpoint(url), kwargs.get("params"), kwargs.get("json"), kwargs.get("data"),
+                              base_url=self.base_url)
+
+    def _cache_lookup(self, method: str, url: str, key: str) -> Tuple[bool, Any]:
+        """
+        Look a request up in the caches that apply to it.
+
+        :return: A tuple of (hit, value).
+        """
+        endpoint = self._endpoint(url)
+        return self._cache_get(self._caches(method, endpoint), key, endpoint)
+
+    def _cache_get(self, caches: List[Any], key: str, endpoint: str) -> Tuple[bool, Any]:
+        """
+        Look a key up in `caches`, promoting a hit to the faster caches in front of it.
+        """
+        for i, cache in enumerate(caches):
+            hit, value = cache.get(key)
+            if hit:
+                for faster in caches[:i]:
+                    faster.set(key, value, endpoint)
+                return True, value
+        return False, None
+
+    def _cache_store(self, method: str, url: str, key: str, value: Any) -> None:
+        """
+        Store a response in the caches that apply to it.
+        """
+        endpoint = self._endpoint(url)
+        for cache in self._caches(method, endpoint):
+            cache.set(key, value, endpoint)
 
     def _request(self, method: str, url: str, headers: Dict[str, str] = None, **kwargs) -> Dict[str, Any]:
         """
@@ -22,55 +144,405 @@ class BaseAPIClient:
         :param url: The full URL to make the request to (relative to base_url)
         :param headers: Additional headers to send with the request
         :param kwargs: Additional arguments like params, data, or json.
+                       `use_cache=False` bypasses the response caches.
+                       `coalesce` overrides the client's setting for this request.
+                       `stream=True` returns an iterator decoding one array element at a time
+                       while the body downloads; streamed requests are not cached or coalesced.
         :return: The response as a dictionary.
         """
-        
+        use_cache = kwargs.pop("use_cache", True)
+        coalesce = kwargs.pop("coalesce", self.coalesce)
+        stream = kwargs.pop("stream", False)
 
         if headers is None:
             headers = {}
 
         headers["x-api-key"] = self.api_key
         headers["Accept"] = "application/json"
-        print(">>>>>>>>", kwargs, headers)
+
+        event = self._new_event(method, url, kwargs)
+        if stream:
+            return self._stream(method, url, headers, event=event, **kwargs)
+
+        try:
+            result = self._fetch(method, url, headers, event, use_cache, coalesce, **kwargs)
+        except Exception as e:
+            self._emit(event, e)
+            raise
+        self._emit(event)
+        return result
+
+    def _fetch(self, method: str, url: str, headers: Dict[str, str], event: Optional[RequestEvent],
+               use_cache: bool, coalesce: bool, **kwargs) -> Any:
+        """
+        Serve a request from the caches or an identical request in flight, or send it.
+        """
+        key = self._request_key(method, url, kwargs)
+        if key is None:
+            return self._send(method, url, headers, event=event, **kwargs)
+
+        caches = use_cache and self._caches(method, self._endpoint(url))
+        if caches:
+            hit, value = self._cache_lookup(method, url, key)
+            if event is not None:
+                event.cache = "hit" if hit else "miss"
+            if hit:
+                return value
+
+        if event is not None:
+            event.coalesced = coalesce
+
+        sent = []
+
+        def fetch() -> Any:
+            sent.append(True)
+            if event is not None:
+                event.coalesced = False
+            result = self._send(method, url, headers, event=event, **kwargs)
+            if use_cache:
+                self._cache_store(method, url, key, result)
+            return result
+
+        if not coalesce:
+            return fetch()
+        result = single_flight.do(key, fetch)
+        # Waiters get their own copy, so mutating a result never changes another caller's
+        return result if sent else copy.deepcopy(result)
+
+    def _send(self, method: str, url: str, headers: Dict[str, str], event: RequestEvent = None,
+              **kwargs) -> Dict[str, Any]:
+        """
+        Send the request over the transport and decode the response.
+        """
+        response = self._open(method, url, headers, event=event, **kwargs)
+        content = response.content
+        if event is not None:
+            event.response_bytes = len(content)
+
+        try:
+            # Decode the body bytes directly, without building an intermediate str
+            return jsonlib.loads(content)
+
+        except ValueError:
+            # Some endpoints (e.g., IUPAC names) answer with plain text
+            return response.text if response.text.strip() else None
+
+    def _stream(self, method: str, url: str, headers: Dict[str, str], chunk_size: int = 65536,
+                event: RequestEvent = None, **kwargs) -> Iterator[Any]:
+        """
+        Send the request and return an iterator over the elements of the JSON array it returns.
+
+        The request is sent immediately; the body is read in `chunk_size` pieces while iterating.
+        The response is closed and the call's event emitted once the iterator is exhausted,
+        closed or garbage collected.
+        """
+        import requests
 
         try:
-            response = requests.request(method, url, headers=headers, **kwargs)
+            response = self._open(method, url, headers, event=event, stream=True, **kwargs)
+        except Exception as e:
+            self._emit(event, e)
+            raise
+
+        def chunks() -> Iterator[bytes]:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if event is not None:
+                    event.response_bytes += len(chunk)
+                yield chunk
+
+        released = []
+
+        def release(error: BaseException = None) -> None:
+            if not released:
+                released.append(True)
+                response.close()
+                self._emit(event, error)
+
+        def records() -> Iterator[Any]:
+            error = None
+            try:
+                yield from iter_json_array(chunks())
+            except requests.exceptions.RequestException as e:
+                error = APIRequestError(f"Error while streaming {method} response from {url}: {str(e)}")
+                raise error
+            except Exception as e:
+                error = e
+                raise
+            finally:
+                release(error)
+
+        # Releases the connection even when the iterator is dropped before its first record
+        return ClosingIterator(records(), release)
+
+    def _open(self, method: str, url: str, headers: Dict[str, str], event: RequestEvent = None,
+              **kwargs) -> "requests.Response":
+        """
+        Send the request over the transport and return the successful response.
+
+        Each attempt waits on the rate limiter; throttled and failed attempts are retried
+        after the delay given by the retry policy.
+        """
+        import requests
+
+        try:
+            attempt = 0
+            while True:
+                limiter = self._limiter()
+                if limiter is not None:
+                    limiter.acquire()
+
+                response = self.transport.request(method, url, headers=headers, **kwargs)
+                if event is not None:
+                    event.status = response.status_code
+                    event.retries = attempt
+                if not self.retry.should_retry(response.status_code, attempt):
+                    break
+
+                delay = self.retry.delay(attempt, response.headers.get("Retry-After"))
+                response.close()
+                if delay is None:
+                    raise APIRequestError(f"Error during {method} request to {url}: Retry-After "
+                                          f"{response.headers['Retry-After']} exceeds max_retry_after",
+                                          status_code=response.status_code)
+                time.sleep(delay)
+                attempt += 1
+
             response.raise_for_status()
+            return response
 
-            try: 
-                return response.json()
-            
-            except json.JSONDecodeError:
-                # The APPI call to IUPAC is not returning a valid JSON
-                print("Response is not a valid JSON")
-                return response.text if response.text.strip() else None
-        
         except requests.exceptions.RequestException as e:
-            raise APIRequestError(f"Error during {method} request to {url}: {str(e)}")
+            status_code = e.response.status_code if e.response is not None else None
+            raise APIRequestError(f"Error during {method} request to {url}: {str(e)}", status_code=status_code)
+
+    def _output(self, endpoint: str, result: Any, output: Optional[str], stream: bool = False) -> Any:
+        """
+        Convert a decoded response to the requested `output`, using the endpoint's schema.
+        """
+        if output is None:
+            return result
+        if stream:
+            raise ValueError("output cannot be combined with stream=True")
+        return convert(result, output, schema_for(endpoint), record_name(endpoint))
+
+    def _local(self, endpoint: str, kwargs: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        Answer a GET request without sending it, e.g. from a local index. Clients with local
+        data override this.
 
-    def get(self, endpoint: str, headers: Dict[str, str] = None, **kwargs) -> Dict[str, Any]:
+        :return: A tuple of (answered, decoded response).
+        """
+        return False, None
+
+    def get(self, endpoint: str, headers: Dict[str, str] = None, output: str = None, **kwargs) -> Dict[str, Any]:
         """
         Make a GET request to the given endpoint with optional query parameters.
 
         :param endpoint: The endpoint (e.g., '/data/resource')
         :param headers: Optional headers for the request
+        :param output: Optional result type, 'pandas', 'arrow' or 'records'
         :param params: Optional query parameters for the GET request
         :param kwargs: Additional arguments to pass to the request
         :return: The JSON response from the API.
         """
+        if not kwargs.get("stream", False):
+            answered, result = self._local(endpoint, kwargs)
+            if answered:
+                return self._output(endpoint, result, output)
+
         url = f"{self.base_url}/{endpoint}"
-        return self._request("GET", url, headers=headers, **kwargs)
+        result = self._request("GET", url, headers=headers, **kwargs)
+        return self._output(endpoint, result, output, kwargs.get("stream", False))
 
-    def post(self, endpoint: str, headers: Dict[str, str] = None, **kwargs) -> Dict[str, Any]:
+    def post(self, endpoint: str, headers: Dict[str, str] = None, output: str = None, **kwargs) -> Dict[str, Any]:
         """
         Make a POST request to the given endpoint with optional data.
         :param endpoint: The endpoint (e.g., '/data/resource')
         :param headers: Optional headers for the request
+        :param output: Optional result type, 'pandas', 'arrow' or 'records'
         :param params: Optional query parameters for the GET request
         :param kwargs: Additional arguments to pass to the request
         """
         url = f"{self.base_url}/{endpoint}"
-        return self._request("POST", url, headers=headers, **kwargs)
+        result = self._request("POST", url, headers=headers, **kwargs)
+        return self._output(endpoint, result, output, kwargs.get("stream", False))
 
     def put(self, endpoint: str, headers: Dict[str, str] = None, data: Dict[str, Any] = None) -> Dict[str, Any]:
         return self._request("PUT", endpoint, headers=headers, json=data)
+
+    def _post_batch(self, endpoint: str, data_list: List[str], chunk_size: int, headers: Dict[str, str] = None,
+                    as_text: bool = False, max_workers: int = None, output: str = None, **kwargs) -> List[Any]:
+        """
+        POST a list of any size to a size-limited batch endpoint.
+
+        The list is split into chunks of `chunk_size`, the chunks are sent concurrently
+        and the responses are merged into one list in input order.
+
+        :param endpoint: The batch endpoint (e.g., 'hazard/search/by-dtxsid/')
+        :param data_list: Values to send
+        :param chunk_size: Maximum number of values the endpoint accepts per request
+        :param headers: Optional headers for each request
+        :param as_text: Send each chunk as EOL separated text instead of a JSON array
+        :param max_workers: Number of chunks in flight, defaults to the client's `max_workers`
+        :param output: Optional result type, 'pandas', 'arrow' or 'records', built from the merged response
+        :param kwargs: Additional arguments to pass to each request
+        :return: The merged response.
+        """
+        chunks = list(chunked(data_list, chunk_size))
+        if max_workers is None:
+            max_workers = self.max_workers
+
+        def send(chunk: List[str]) -> Any:
+            body = {"data": "\n".join(chunk)} if as_text else {"json": chunk}
+            return self.post(endpoint, headers=dict(headers or {}), **body, **kwargs)
+
+        if len(chunks) <= 1:
+            return self._output(endpoint, send(chunks[0] if chunks else []), output)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as pool:
+            return self._output(endpoint, merge_results(pool.map(send, chunks)), output)
+
+    def _fan_out(self, fetch: Callable[..., Any], ids: Iterable[Any], max_workers: int = None,
+                 return_exceptions: bool = False, **kwargs) -> Dict[Any, Any]:
+        """
+        Call a single-ID method for many IDs over a bounded worker pool.
+
+        :param fetch: Method taking one ID (e.g., `self.get_httk_data`)
+        :param ids: IDs to fetch, duplicates are fetched once
+        :param max_workers: Number of requests in flight, defaults to the client's `max_workers`
+        :param return_exceptions: Map the IDs whose request failed to their `APIRequestError` instead
+                                  of raising the first one, so the other results are kept
+        :param kwargs: Additional arguments to pass to `fetch`
+        :return: Mapping of ID to its response, in input order.
+        """
+        ids = list(dict.fromkeys(ids))
+        if max_workers is None:
+            max_workers = self.max_workers
+
+        if not ids:
+            return {}
+
+        def send(id_: Any) -> Any:
+            try:
+                return fetch(id_, **kwargs)
+            except APIRequestError as e:
+                if not return_exceptions:
+                    raise
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ids))) as pool:
+            return dict(zip(ids, pool.map(send, ids)))
+
+    def _post_records(self, endpoint: str, data_list: List[str], chunk_size: int, key_field: str = "dtxsid",
+                      headers: Dict[str, str] = None, output: str = None, **kwargs) -> List[Any]:
+        """
+        POST a batch keyed by ID, caching the response one ID at a time.
+
+        Only IDs missing from the cache are sent, so overlapping batches reuse earlier
+        records. Without a cache this is `_post_batch`; repeated IDs are sent once either way.
+
+        :param endpoint: The batch endpoint (e.g., 'hazard/search/by-dtxsid/')
+        :param data_list: IDs to send
+        :param chunk_size: Maximum number of IDs the endpoint accepts per request
+        :param key_field: Record field holding the ID (e.g., 'dtxsid')
+        :param headers: Optional headers for each request
+        :param output: Optional result type, 'pandas', 'arrow' or 'records'
+        :param kwargs: Additional arguments to pass to `_post_batch`
+        :return: Cached and fresh records, grouped by ID in input order.
+        """
+        # Repeated IDs are sent and returned once, with or without a cache
+        data_list = list(dict.fromkeys(data_list))
+        caches = self._caches("POST", endpoint)
+        if not caches:
+            return self._post_batch(endpoint, data_list, chunk_size, headers=headers, output=output, **kwargs)
+
+        keys, found, misses = self._record_lookup(caches, endpoint, data_list, kwargs.get("params"))
+        fresh = []
+        if misses:
+            fresh = self._post_batch(endpoint, misses, chunk_size, headers=headers, use_cache=False, **kwargs)
+        else:
+            self._emit_record_hit(endpoint, list(keys))
+        return self._output(endpoint, self._record_merge(caches, endpoint, keys, found, misses, fresh, key_field), output)
+
+    def _iter_records(self, endpoint: str, data: Iterable[str], chunk_size: int, key_field: str = "dtxsid",
+                      headers: Dict[str, str] = None, window: int = None, **kwargs) -> Iterator[Any]:
+        """
+        Stream a batch keyed by ID: read IDs lazily from any iterable and yield the records
+        of each chunk, in input order, as soon as it and the chunks before it are done.
+
+        At most `window` chunks are in flight, so memory stays bounded whatever the input size.
+        Chunks are cached per ID like `_post_records`; IDs repeated across chunks are requested again.
+
+        :param endpoint: The batch endpoint (e.g., 'hazard/search/by-dtxsid/')
+        :param data: Iterable of IDs (e.g., a list, a generator or a file handle with one ID per line)
+        :param chunk_size: Maximum number of IDs the endpoint accepts per request
+        :param key_field: Record field holding the ID (e.g., 'dtxsid')
+        :param headers: Optional headers for each request
+        :param window: Number of chunks in flight, defaults to the client's `max_workers`
+        :param kwargs: Additional arguments to pass to `_post_records`
+        :return: An iterator over the records.
+        """
+        window = window if window is not None else self.max_workers
+        chunks = chunked(iter_ids(data), chunk_size)
+
+        with ThreadPoolExecutor(max_workers=window) as pool:
+            pending = collections.deque()
+            try:
+                for chunk in chunks:
+                    pending.append(pool.submit(self._post_records, endpoint, chunk, chunk_size, key_field=key_field,
+                                               headers=headers, **kwargs))
+                    if len(pending) >= window:
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _record_lookup(self, caches: List[Any], endpoint: str, data_list: List[str],
+                       params: Any) -> Tuple[Dict[str, str], Dict[str, List[Any]], List[str]]:
+        """
+        Split IDs into cached records and misses.
+
+        :return: A tuple of (record key per ID, cached records per ID, missing IDs).
+        """
+        keys, found, misses = {}, {}, []
+        for id_ in dict.fromkeys(data_list):
+            keys[id_] = make_cache_key("RECORD", endpoint, params, id_, base_url=self.base_url)
+            hit, records = self._cache_get(caches, keys[id_], endpoint)
+            if hit:
+                found[id_] = records
+            else:
+                misses.append(id_)
+        return keys, found, misses
+
+    def _emit_record_hit(self, endpoint: str, data_list: List[str]) -> None:
+        """
+        Report a batch answered entirely from the per-record cache, like a whole-response hit.
+        """
+        event = self._new_event("POST", f"{self.base_url}/{endpoint}", {"json": data_list})
+        if event is not None:
+            event.cache = "hit"
+        self._emit(event)
+
+    def _record_merge(self, caches: List[Any], endpoint: str, keys: Dict[str, str], found: Dict[str, List[Any]],
+                      misses: List[str], fresh: Any, key_field: str) -> List[Any]:
+        """
+        Cache fresh records per ID and merge them with the cached ones.
+        """
+        groups = {id_: [] for id_ in misses}
+        unmatched = []
+        for record in (fresh if isinstance(fresh, list) else [fresh]):
+            id_ = record.get(key_field) if isinstance(record, dict) else None
+            if id_ in groups:
+                groups[id_].append(record)
+            elif record is not None:
+                unmatched.append(record)
+
+        for id_, records in groups.items():
+            # IDs without records are cached as empty unless the response could not be attributed
+            if records or not unmatched:
+                for cache in caches:
+                    cache.set(keys[id_], records, endpoint)
+
+        found.update(groups)
+        return [record for id_ in keys for record in found[id_]] + unmatched
@@ -0,0 +1,275 @@
+from collections import OrderedDict
+from fnmatch import fnmatch
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+import hashlib
+import json
+import os
+import threading
+import time
+from ..utils import jsonlib
+
+if TYPE_CHECKING:  # pragma: no cover
+    import sqlite3
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "pycomptox", "responses.sqlite3")
+
+
+def make_cache_key(method: str, endpoint: str, params: Any = None, json_body: Any = None, data: Any = None,
+                   base_url: str = "") -> str:
+    """
+    Build a stable cache key from the method, endpoint, query parameters and request body.
+
+    :param base_url: The API root the endpoint is relative to, so that clients pointed at
+                     different servers never share cached responses.
+    """
+    parts = [method.upper(), base_url, endpoint, params or {}, json_body, data]
+    raw = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def ttl_for(ttls: Dict[str, Optional[float]], endpoint: str, default: Optional[float]) -> Optional[float]:
+    """
+    Return the TTL of the first glob pattern in `ttls` matching `endpoint`, or `default`.
+
+    A TTL of None means the entry never expires, 0 means the endpoint is not cached.
+    """
+    for pattern, ttl in ttls.items():
+        if fnmatch(endpoint, pattern):
+            return ttl
+    return default
+
+
+class DiskCache:
+    """
+    Persistent single-file response cache backed by SQLite.
+
+    Entries expire according to per-endpoint TTLs and the least recently used entries are
+    evicted once `max_entries` or `max_bytes` is exceeded. The database runs in WAL mode with
+    a busy timeout, so several threads and processes can share one cache file.
+    """
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttls: Dict[str, Optional[float]] = None,
+                 default_ttl: Optional[float] = 7 * 24 * 3600, max_entries: int = 100_000,
+                 max_bytes: int = None, timeout: float = 30.0):
+        """
+        :param path: Location of the SQLite file, created if missing.
+        :param ttls: Mapping of endpoint glob pattern (e.g., 'hazard/*') to TTL in seconds.
+        :param default_ttl: TTL for endpoints matching no pattern.
+        :param max_entries: Maximum number of cached responses.
+        :param max_bytes: Maximum total size of cached responses, unbounded when None.
+        :param timeout: Seconds to wait for a lock held by another process.
+        """
+        self.path = path
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._local = threading.local()
+        self._writes = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, endpoint TEXT, value TEXT, size INTEGER, "
+                "expires REAL, accessed REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    def _connect(self) -> "sqlite3.Connection":
+        # sqlite3 connections must not cross threads or forked processes
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            import sqlite3
+
+            conn = sqlite3.connect(self.path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def ttl(self, endpoint: str) -> Optional[float]:
+        """
+        TTL in seconds for an endpoint, None for no expiry and 0 for not cached.
+        """
+        return ttl_for(self.ttls, endpoint, self.default_ttl)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a key.
+
+        :return: A tuple of (hit, value).
+        """
+        now = time.time()
+        conn = self._connect()
+        row = conn.execute("SELECT value, expires FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return False, None
+
+        value, expires = row
+        with conn:
+            if expires is not None and expires <= now:
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return False, None
+            conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        return True, jsonlib.loads(value)
+
+    def set(self, key: str, value: Any, endpoint: str) -> None:
+        """
+        Store a decoded response for `endpoint`, unless its TTL is 0.
+        """
+        ttl = self.ttl(endpoint)
+        if ttl == 0:
+            return
+
+        now = time.time()
+        payload = jsonlib.dumps(value)
+        expires = now + ttl if ttl is not None else None
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, endpoint, value, size, expires, accessed) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, payload, len(payload), expires, now),
+            )
+
+        self._writes += 1
+        if self._writes % 64 == 0:
+            self.evict()
+
+    def evict(self) -> None:
+        """
+        Drop expired entries, then least recently used ones until the size bounds hold.
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM entries WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+
+            count, total = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+            if self.max_entries is not None and count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+            if self.max_bytes is not None and total > self.max_bytes:
+                excess = total - self.max_bytes
+                rows = conn.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall()
+                stale = []
+                for key, size in rows:
+                    if excess <= 0:
+                        break
+                    stale.append((key,))
+                    excess -= size
+                conn.executemany("DELETE FROM entries WHERE key = ?", stale)
+
+    def invalidate(self, pattern: str = "*") -> None:
+        """
+        Remove cached responses whose endpoint matches a glob pattern.
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM entries WHERE endpoint GLOB ?", (pattern,))
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+        """
+        self.invalidate("*")
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+class MemoryCache:
+    """
+    Process-local LRU cache with per-endpoint TTLs.
+
+    Values are kept JSON-encoded and decoded on every hit, so each caller gets its own copy
+    and mutating a result never changes what later callers get.
+    """
+    def __init__(self, ttls: Dict[str, Optional[float]] = None, default_ttl: Optional[float] = 3600,
+                 max_entries: int = 256):
+        """
+        :param ttls: Mapping of endpoint glob pattern to TTL in seconds.
+        :param default_ttl: TTL for endpoints matching no pattern, 0 to cache only matching endpoints.
+        :param max_entries: Maximum number of cached responses.
+        """
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def ttl(self, endpoint: str) -> Optional[float]:
+        """
+        TTL in seconds for an endpoint, None for no expiry and 0 for not cached.
+        """
+        return ttl_for(self.ttls, endpoint, self.default_ttl)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a key.
+
+        :return: A tuple of (hit, value).
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+
+            endpoint, value, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._entries[key]
+                return False, None
+
+            self._entries.move_to_end(key)
+        return True, jsonlib.loads(value)
+
+    def set(self, key: str, value: Any, endpoint: str) -> None:
+        """
+        Store a decoded response for `endpoint`, unless its TTL is 0.
+        """
+        ttl = self.ttl(endpoint)
+        if ttl == 0:
+            return
+
+        expires = time.monotonic() + ttl if ttl is not None else None
+        payload = jsonlib.dumps(value)
+        with self._lock:
+            self._entries[key] = (endpoint, payload, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, pattern: str = "*") -> None:
+        """
+        Remove cached responses whose endpoint matches a glob pattern.
+        """
+        with self._lock:
+            for key in [key for key, entry in self._entries.items() if fnmatch(entry[0], pattern)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Remove all cached responses.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Slowly changing reference catalogues, memoized in-process by every client
+CATALOGUE_TTLS = {
+    "chemical/list/type": 24 * 3600,
+    "chemical/list/": 24 * 3600,
+    "chemical/property/experimental/name": 24 * 3600,
+    "chemical/property/predicted/name": 24 * 3600,
+    "exposure/list-presence/tags": 24 * 3600,
+    "exposure/product-data/puc": 24 * 3600,
+    "bioactivity/assay/": 24 * 3600,
+}
+
+catalogue_cache = MemoryCache(ttls=CATALOGUE_TTLS, default_ttl=0, max_entries=256)
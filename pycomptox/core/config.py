@@ -2,6 +2,13 @@ class Config:
     """
     Configuration manager for API wrapper.
     """
-    def __init__(self, api_key: str, base_url: str):
+    def __init__(self, api_key: str, base_url: str, pool_connections: int = 10, pool_maxsize: int = 10,
+                 max_workers: int = 4):
         self.api_key = api_key
         self.base_url = base_url
+        # Number of hosts to keep connection pools for, and keep-alive connections per host;
+        # clients created without a transport share one transport per pair of sizes
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        # Number of chunks of a batch request sent concurrently
+        self.max_workers = max_workers
@@ -0,0 +1,251 @@
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import json
+import threading
+import time
+
+# Segments after which the rest of a path holds request values (e.g., 'by-dtxsid/DTXSID7020182')
+_SEARCH_OPS = ("start-with", "equal", "contain")
+
+
+def endpoint_template(endpoint: str) -> str:
+    """
+    Replace the values in an endpoint path by '{}' so requests for different IDs share one label,
+    e.g. 'hazard/search/by-dtxsid/DTXSID7020182' -> 'hazard/search/by-dtxsid/{}'.
+    """
+    endpoint = endpoint.split("?", 1)[0]
+    segments = endpoint.split("/")
+    for i, segment in enumerate(segments):
+        if segment.startswith(("by-", "to-")) or segment in _SEARCH_OPS:
+            return "/".join(segments[:i + 1] + ["{}" if value else value for value in segments[i + 1:]])
+    return endpoint
+
+
+def batch_size(json_body: Any = None, data: Any = None) -> Optional[int]:
+    """
+    Number of values sent to a batch endpoint, as a JSON array or EOL separated text.
+    """
+    if isinstance(json_body, list):
+        return len(json_body)
+    if isinstance(data, str):
+        return len(data.split("\n")) if data else 0
+    return None
+
+
+def body_size(json_body: Any = None, data: Any = None) -> int:
+    """
+    Approximate size in bytes of a request body.
+    """
+    if json_body is not None:
+        return len(json.dumps(json_body).encode("utf-8"))
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+    if isinstance(data, bytes):
+        return len(data)
+    return 0
+
+
+class RequestEvent:
+    """
+    Measurements of one API call, passed to every instrumentation hook when the call ends.
+
+    `cache` is 'hit' or 'miss' for cacheable requests and None otherwise. `coalesced` is True
+    when the response was shared with an identical request already in flight. `status` is None
+    when no response was received (cache hits, coalesced calls and connection errors).
+    """
+    __slots__ = ("endpoint", "method", "status", "latency", "request_bytes", "response_bytes",
+                 "retries", "cache", "coalesced", "batch_size", "error", "_started")
+
+    def __init__(self, endpoint: str, method: str, request_bytes: int = 0, batch_size: int = None):
+        self.endpoint = endpoint
+        self.method = method
+        self.status = None
+        self.latency = 0.0
+        self.request_bytes = request_bytes
+        self.response_bytes = 0
+        self.retries = 0
+        self.cache = None
+        self.coalesced = False
+        self.batch_size = batch_size
+        self.error = None
+        self._started = time.perf_counter()
+
+    def finish(self) -> "RequestEvent":
+        """
+        Record the latency of the call.
+        """
+        self.latency = time.perf_counter() - self._started
+        return self
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self.__slots__ if not field.startswith("_")}
+
+    def __repr__(self) -> str:
+        return f"RequestEvent({self.method} {self.endpoint}, status={self.status}, latency={self.latency:.4f})"
+
+
+_hooks: List[Callable[[RequestEvent], Any]] = []
+_hooks_lock = threading.Lock()
+
+
+def add_hook(hook: Callable[[RequestEvent], Any]) -> Callable[[RequestEvent], Any]:
+    """
+    Call `hook` with a `RequestEvent` after every API call made by any client in the process.
+    """
+    with _hooks_lock:
+        _hooks.append(hook)
+    return hook
+
+
+def remove_hook(hook: Callable[[RequestEvent], Any]) -> None:
+    """
+    Stop calling a hook registered with `add_hook`.
+    """
+    with _hooks_lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
+
+
+def get_hooks() -> List[Callable[[RequestEvent], Any]]:
+    """
+    Return the process-wide instrumentation hooks.
+    """
+    return list(_hooks)
+
+
+def emit(event: RequestEvent, hooks: Iterable[Callable[[RequestEvent], Any]]) -> None:
+    """
+    Pass a finished event to each hook. A failing hook is logged and never fails the request.
+    """
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            import logging
+
+            logging.getLogger(__name__).exception("Instrumentation hook %r failed", hook)
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class LatencyHistogram:
+    """
+    Instrumentation hook aggregating latency histograms per endpoint template and method.
+
+    Register it with `add_hook(histogram)` or a client's `hooks`, then read it with
+    `snapshot()` or export it in the Prometheus text format with `prometheus()`.
+    """
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        """
+        :param buckets: Upper bounds of the latency buckets in seconds.
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        with self._lock:
+            series = self._series.get((event.endpoint, event.method))
+            if series is None:
+                series = self._series[(event.endpoint, event.method)] = {
+                    "counts": [0] * (len(self.buckets) + 1), "count": 0, "sum": 0.0, "errors": 0,
+                    "retries": 0, "cache_hits": 0, "request_bytes": 0, "response_bytes": 0,
+                }
+            series["counts"][bisect_left(self.buckets, event.latency)] += 1
+            series["count"] += 1
+            series["sum"] += event.latency
+            series["errors"] += event.error is not None
+            series["retries"] += event.retries
+            series["cache_hits"] += event.cache == "hit"
+            series["request_bytes"] += event.request_bytes
+            series["response_bytes"] += event.response_bytes
+
+    def quantile(self, endpoint: str, method: str, q: float) -> Optional[float]:
+        """
+        Estimate a latency quantile (e.g., 0.99) of an endpoint by interpolating within its buckets.
+        """
+        with self._lock:
+            series = self._series.get((endpoint, method))
+            counts = list(series["counts"]) if series is not None else []
+        return self._quantile(counts, q)
+
+    def _quantile(self, counts: List[int], q: float) -> Optional[float]:
+        total = sum(counts)
+        if not total:
+            return None
+
+        rank = q * total
+        seen = 0
+        for i, count in enumerate(counts):
+            if count and seen + count >= rank:
+                if i == len(self.buckets):
+                    # Beyond the last bound, the best estimate is the bound itself
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregates keyed by 'METHOD endpoint', with cumulative bucket counts and p50/p95/p99 estimates.
+        """
+        with self._lock:
+            items = [(key, dict(series, counts=list(series["counts"]))) for key, series in self._series.items()]
+
+        snapshot = {}
+        for (endpoint, method), series in sorted(items, key=lambda item: item[0]):
+            counts = series.pop("counts")
+            cumulative, total = {}, 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                total += count
+                cumulative[bound] = total
+            series.update(
+                endpoint=endpoint, method=method, buckets=cumulative,
+                p50=self._quantile(counts, 0.5), p95=self._quantile(counts, 0.95), p99=self._quantile(counts, 0.99),
+            )
+            snapshot[f"{method} {endpoint}"] = series
+        return snapshot
+
+    def prometheus(self, prefix: str = "pycomptox") -> str:
+        """
+        Export the aggregates in the Prometheus text exposition format.
+        """
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_request_duration_seconds Latency of CompTox API calls.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        for series in snapshot.values():
+            labels = f'endpoint="{_escape(series["endpoint"])}",method="{series["method"]}"'
+            for bound, count in series["buckets"].items():
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {series['sum']}")
+            lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {series['count']}")
+
+        for name, help_ in (
+            ("errors", "Failed CompTox API calls."),
+            ("retries", "Retried CompTox API requests."),
+            ("cache_hits", "CompTox API calls served from a cache."),
+            ("request_bytes", "Bytes sent in CompTox API request bodies."),
+            ("response_bytes", "Bytes received in CompTox API responses."),
+        ):
+            lines.append(f"# HELP {prefix}_{name}_total {help_}")
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for series in snapshot.values():
+                labels = f'endpoint="{_escape(series["endpoint"])}",method="{series["method"]}"'
+                lines.append(f"{prefix}_{name}_total{{{labels}}} {series[name]}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """
+        Drop all aggregates.
+        """
+        with self._lock:
+            self._series.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
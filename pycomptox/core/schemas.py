@@ -0,0 +1,194 @@
+"""
+#### Description:
+    Typed column schemas for the documented output shapes of the CompTox endpoints.
+    Each schema is a list of (field, type) pairs where type is one of 'str', 'int', 'float' or 'bool'.
+    They are used to build columnar results (pandas / Arrow) without inferring types row by row.
+"""
+from fnmatch import fnmatch
+from typing import Dict, List, Optional, Tuple
+
+
+Schema = List[Tuple[str, str]]
+
+CHEMICAL_SEARCH = [
+    ("casrn", "str"), ("dtxsid", "str"), ("dtxcid", "str"), ("preferredName", "str"),
+    ("hasStructureImage", "int"), ("smiles", "str"), ("isMarkush", "bool"), ("searchName", "str"),
+    ("searchValue", "str"), ("rank", "int"),
+]
+
+PROPERTY = [
+    ("name", "str"), ("value", "float"), ("id", "int"), ("source", "str"), ("dtxsid", "str"),
+    ("dtxcid", "str"), ("unit", "str"), ("propertyId", "str"), ("propType", "str"), ("description", "str"),
+]
+
+PROPERTY_NAME = [("name", "str"), ("propertyId", "str"), ("propType", "str")]
+
+FATE = [
+    ("id", "int"), ("valueType", "str"), ("dtxsid", "str"), ("dtxcid", "str"), ("unit", "str"),
+    ("resultValue", "float"), ("modelSource", "str"), ("endpointName", "str"), ("description", "str"),
+    ("minValue", "float"), ("maxValue", "float"),
+]
+
+PUBLIC_LIST = [
+    ("id", "int"), ("type", "str"), ("label", "str"), ("visibility", "str"), ("longDescription", "str"),
+    ("chemicalCount", "int"), ("createdAt", "str"), ("updatedAt", "str"), ("listName", "str"),
+    ("shortDescription", "str"),
+]
+
+CHEMICAL_DETAIL = [
+    ("id", "str"), ("dtxsid", "str"), ("dtxcid", "str"), ("casrn", "str"), ("preferredName", "str"),
+    ("molFormula", "str"), ("monoisotopicMass", "float"), ("smiles", "str"), ("inchikey", "str"),
+    ("inchiString", "str"), ("iupacName", "str"), ("msReadySmiles", "str"), ("qsarReadySmiles", "str"),
+    ("qcLevel", "int"), ("qcLevelDesc", "str"), ("qcNotes", "str"), ("pubmedCount", "int"),
+    ("sourcesCount", "int"), ("activeAssays", "int"), ("totalAssays", "int"), ("percentAssays", "float"),
+    ("pubchemCount", "int"), ("pubchemCid", "int"), ("compoundId", "int"), ("genericSubstanceId", "int"),
+    ("cpdataCount", "int"), ("relatedSubstanceCount", "int"), ("relatedStructureCount", "int"),
+    ("hasStructureImage", "int"), ("isotope", "int"), ("multicomponent", "int"), ("isMarkush", "bool"),
+    ("toxcastSelect", "str"), ("wikipediaArticle", "str"), ("descriptorStringTsv", "str"),
+    ("pprtvLink", "str"), ("irisLink", "str"),
+]
+
+GHS_LINK = [("dtxsid", "str"), ("isSafetyData", "bool"), ("safetyUrl", "str")]
+
+HAZARD = [
+    ("id", "int"), ("source", "str"), ("year", "str"), ("studyDurationValue", "float"),
+    ("studyDurationClass", "str"), ("toxvalNumericQualifier", "str"), ("studyDurationUnits", "str"),
+    ("riskAssessmentClass", "str"), ("dtxsid", "str"), ("exposureRoute", "str"), ("toxvalNumeric", "float"),
+    ("subsource", "str"), ("toxvalType", "str"), ("toxvalSubtype", "str"), ("toxvalUnits", "str"),
+    ("studyType", "str"), ("sourceUrl", "str"), ("subsourceUrl", "str"), ("priorityId", "int"),
+    ("criticalEffect", "str"), ("generation", "str"), ("exposureMethod", "str"), ("detailText", "str"),
+    ("population", "str"), ("strain", "str"), ("media", "str"), ("sex", "str"), ("exposureForm", "str"),
+    ("lifestage", "str"), ("supercategory", "str"), ("speciesCommon", "str"), ("humanEcoNt", "str"),
+]
+
+SKIN_EYE = [
+    ("id", "int"), ("source", "str"), ("year", "int"), ("endpoint", "str"), ("dtxsid", "str"),
+    ("studyType", "str"), ("strain", "str"), ("resultText", "str"), ("reliability", "str"),
+    ("guideline", "str"), ("score", "str"), ("species", "str"), ("classification", "str"),
+]
+
+CANCER = [
+    ("id", "int"), ("source", "str"), ("url", "str"), ("cancerCall", "str"), ("dtxsid", "str"),
+    ("exposureRoute", "str"),
+]
+
+GENETOX = [
+    ("id", "int"), ("source", "str"), ("year", "int"), ("dtxsid", "str"), ("strain", "str"),
+    ("species", "str"), ("metabolicActivation", "str"), ("assayCategory", "str"), ("assayResult", "str"),
+    ("assayType", "str"), ("url", "str"),
+]
+
+HTTK = [
+    ("id", "int"), ("dtxsid", "str"), ("parameter", "str"), ("measuredText", "str"), ("measured", "float"),
+    ("predictedText", "str"), ("predicted", "float"), ("units", "str"), ("model", "str"),
+    ("reference", "str"), ("percentile", "str"), ("species", "str"), ("dataSourceSpecies", "str"),
+    ("dataVersion", "str"), ("importDate", "str"),
+]
+
+GENERAL_EXPOSURE = [
+    ("dtxsid", "str"), ("productionVolume", "float"), ("units", "str"), ("stockholmConvention", "int"),
+    ("probabilityDietary", "float"), ("probabilityResidential", "float"), ("probabilityPesticde", "float"),
+    ("probabilityIndustrial", "float"), ("dataVersion", "str"), ("importDate", "str"),
+]
+
+DEMOGRAPHIC_EXPOSURE = [
+    ("id", "int"), ("dtxsid", "str"), ("demographic", "str"), ("predictor", "str"), ("median", "float"),
+    ("medianText", "str"), ("l95", "float"), ("l95Text", "str"), ("u95", "float"), ("u95Text", "str"),
+    ("units", "str"), ("ad", "int"), ("reference", "str"), ("dataVersion", "str"), ("importDate", "str"),
+]
+
+FUNCTIONAL_USE_PROBABILITY = [("harmonizedFunctionalUse", "str"), ("probability", "float")]
+
+FUNCTIONAL_USE = [
+    ("id", "int"), ("dtxsid", "str"), ("datatype", "str"), ("docid", "int"), ("doctitle", "str"),
+    ("docdate", "str"), ("reportedfunction", "str"), ("functioncategory", "str"),
+]
+
+PUC = [
+    ("id", "int"), ("kindName", "str"), ("genCat", "str"), ("prodfam", "str"), ("prodtype", "str"),
+    ("definition", "str"),
+]
+
+PRODUCT_DATA = [
+    ("id", "int"), ("dtxsid", "str"), ("docid", "int"), ("doctitle", "str"), ("docdate", "str"),
+    ("productname", "str"), ("gencat", "str"), ("prodfam", "str"), ("prodtype", "str"),
+    ("classificationmethod", "str"), ("rawmincomp", "str"), ("rawmaxcomp", "str"), ("rawcentralcomp", "str"),
+    ("unittype", "str"), ("lowerweightfraction", "float"), ("upperweightfraction", "float"),
+    ("centralweightfraction", "float"), ("weightfractiontype", "str"), ("component", "str"),
+]
+
+LIST_PRESENCE_TAG = [("id", "int"), ("tagName", "str"), ("tagDefinition", "str"), ("kindName", "str")]
+
+LIST_PRESENCE = [
+    ("id", "int"), ("dtxsid", "str"), ("docid", "int"), ("doctitle", "str"), ("docsubtitle", "str"),
+    ("docdate", "str"), ("organization", "str"), ("reportedfunction", "str"), ("functioncategory", "str"),
+    ("component", "str"), ("keywordset", "str"),
+]
+
+BIOACTIVITY_SUMMARY = [
+    ("aeid", "int"), ("activeMc", "int"), ("totalMc", "int"), ("activeSc", "int"), ("totalSc", "int"),
+]
+
+# Endpoint glob pattern -> schema, first match wins. Endpoints without a schema
+# (e.g., bioactivity data rows) get their columns and types inferred.
+ENDPOINT_SCHEMAS: Dict[str, Schema] = {
+    "chemical/search/*": CHEMICAL_SEARCH,
+    "chemical/property/experimental/name": PROPERTY_NAME,
+    "chemical/property/predicted/name": PROPERTY_NAME,
+    "chemical/property/search/*": PROPERTY,
+    "chemical/fate/search/*": FATE,
+    "chemical/list/chemicals/*": [],
+    "chemical/list/type": [],
+    "chemical/list/*": PUBLIC_LIST,
+    "chemical/detail/search/*": CHEMICAL_DETAIL,
+    "chemical/ghslink/*": GHS_LINK,
+    "hazard/skin-eye/*": SKIN_EYE,
+    "hazard/cancer-summary/*": CANCER,
+    "hazard/genetox/*": GENETOX,
+    "hazard/*": HAZARD,
+    "exposure/httk/*": HTTK,
+    "exposure/seem/general/*": GENERAL_EXPOSURE,
+    "exposure/seem/demographic/*": DEMOGRAPHIC_EXPOSURE,
+    "exposure/functional-use/probability/*": FUNCTIONAL_USE_PROBABILITY,
+    "exposure/functional-use/*": FUNCTIONAL_USE,
+    "exposure/product-data/puc": PUC,
+    "exposure/product-data/*": PRODUCT_DATA,
+    "exposure/list-presence/tags": LIST_PRESENCE_TAG,
+    "exposure/list-presence/*": LIST_PRESENCE,
+    "bioactivity/data/summary/*": BIOACTIVITY_SUMMARY,
+}
+
+
+# Endpoint glob pattern -> name of its record class for output='records', first match wins
+RECORD_NAMES: Dict[str, str] = {
+    "chemical/search/*": "ChemicalSearchHit",
+    "chemical/property/search/*": "PropertyRecord",
+    "chemical/fate/search/*": "FateRecord",
+    "chemical/detail/search/*": "ChemicalDetail",
+    "hazard/skin-eye/*": "SkinEyeRecord",
+    "hazard/cancer-summary/*": "CancerRecord",
+    "hazard/genetox/*": "GenetoxRecord",
+    "hazard/*": "HazardRecord",
+    "bioactivity/data/summary/*": "BioactivitySummary",
+    "bioactivity/data/*": "BioactivityRow",
+}
+
+
+def schema_for(endpoint: str) -> Optional[Schema]:
+    """
+    Return the schema of an endpoint, or None when its columns should be inferred.
+    """
+    for pattern, schema in ENDPOINT_SCHEMAS.items():
+        if fnmatch(endpoint, pattern):
+            return schema or None
+    return None
+
+
+def record_name(endpoint: str) -> str:
+    """
+    Return the name of the record class of an endpoint for output='records'.
+    """
+    for pattern, name in RECORD_NAMES.items():
+        if fnmatch(endpoint, pattern):
+            return name
+    return "Record"
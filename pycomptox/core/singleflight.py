@@ -0,0 +1,71 @@
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict
+import threading
+import weakref
+
+
+class SingleFlight:
+    """
+    Coalesce identical concurrent calls across threads.
+
+    While a call for a key is in flight, later callers with the same key wait for its
+    result instead of starting their own call. Every caller receives the same object,
+    so results must not be mutated.
+    """
+    def __init__(self):
+        self._calls: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        """
+        Run `fn` for `key`, or wait for the call already in flight for it.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._calls[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """
+    Coalesce identical concurrent calls across asyncio tasks of the same event loop.
+    """
+    def __init__(self):
+        self._calls = weakref.WeakKeyDictionary()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Await `fn()` for `key`, or wait for the call already in flight for it.
+        """
+        import asyncio
+
+        calls = self._calls.setdefault(asyncio.get_running_loop(), {})
+        task = calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            calls[key] = task
+            task.add_done_callback(lambda _: calls.pop(key, None))
+
+        # A cancelled waiter must not cancel the shared call
+        return await asyncio.shield(task)
+
+
+single_flight = SingleFlight()
+async_single_flight = AsyncSingleFlight()
@@ -0,0 +1,125 @@
+from typing import Iterable, Optional
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill at `rate` per second up to `burst`. Callers reserve a token and wait
+    for the returned delay, so blocking and asyncio code can share one bucket.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        :param rate: Sustained requests per second.
+        :param burst: Maximum number of requests sent back to back.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take one token and return how many seconds to wait before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """
+        Block until a token is available.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
+class RetryPolicy:
+    """
+    Retry schedule for throttled (429) and failed (5xx) responses.
+
+    Waits for the server's `Retry-After` when present, otherwise for a jittered exponential
+    backoff ("full jitter": uniform between 0 and `backoff * 2 ** attempt`, capped at `max_backoff`).
+    A `Retry-After` longer than `max_retry_after` is not waited for.
+    """
+    def __init__(self, max_retries: int = 3, backoff: float = 0.5, max_backoff: float = 30.0,
+                 statuses: Iterable[int] = (429, 500, 502, 503, 504), max_retry_after: float = 60.0):
+        """
+        :param max_retries: Maximum number of retries per request, 0 to disable retries.
+        :param backoff: Base delay in seconds.
+        :param max_backoff: Upper bound of the exponential delay in seconds.
+        :param statuses: HTTP status codes that are retried.
+        :param max_retry_after: Longest `Retry-After` in seconds worth waiting for; the request
+                                fails immediately when the server asks for more.
+        """
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.statuses = frozenset(statuses)
+        self.max_retry_after = max_retry_after
+
+    def should_retry(self, status: int, attempt: int) -> bool:
+        """
+        Whether a response with `status` should be retried after `attempt` retries.
+        """
+        return status in self.statuses and attempt < self.max_retries
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> Optional[float]:
+        """
+        Seconds to wait before retry number `attempt + 1`, or None when `retry_after` exceeds
+        `max_retry_after` and the request should not be retried.
+        """
+        if retry_after:
+            seconds = parse_retry_after(retry_after)
+            if seconds is not None:
+                return seconds if seconds <= self.max_retry_after else None
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """
+    Parse a `Retry-After` header given in seconds or as an HTTP date.
+    """
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_rate_limiter: Optional[TokenBucket] = None
+
+
+def set_rate_limit(rate: Optional[float], burst: int = 1) -> Optional[TokenBucket]:
+    """
+    Limit every client in the process to `rate` requests per second with bursts of `burst`.
+
+    Pass `rate=None` to remove the limit.
+    """
+    global _rate_limiter
+    _rate_limiter = TokenBucket(rate, burst) if rate is not None else None
+    return _rate_limiter
+
+
+def get_rate_limiter() -> Optional[TokenBucket]:
+    """
+    Return the process-wide rate limiter, or None when requests are not limited.
+    """
+    return _rate_limiter
@@ -0,0 +1,91 @@
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    import requests
+
+
+class Transport:
+    """
+    Pooled, keep-alive HTTP transport shared by API clients.
+
+    Wraps a single `requests.Session` so that every client using the transport
+    reuses open TCP/TLS connections instead of opening one per request.
+    """
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False):
+        """
+        :param pool_connections: Number of per-host connection pools to cache.
+        :param pool_maxsize: Maximum number of keep-alive connections kept per host.
+        :param pool_block: Make requests beyond `pool_maxsize` per host wait for a free connection,
+                           instead of opening an extra one that is discarded afterwards.
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+
+        # requests is imported on first use, it dominates the import time of the package
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.session = requests.Session()
+
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        """
+        Send a request over the pooled session.
+
+        :param method: The HTTP method (e.g., 'GET', 'POST')
+        :param url: The full URL to make the request to
+        :param kwargs: Additional arguments passed to `requests.Session.request`
+        :return: The `requests.Response` object.
+        """
+        return self.session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        """
+        Close all pooled connections.
+        """
+        self.session.close()
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_default_transport: Optional[Transport] = None
+# Shared transports by (pool_connections, pool_maxsize), used while no default is set
+_sized_transports: Dict[Tuple[int, int], Transport] = {}
+_default_lock = threading.Lock()
+
+
+def get_default_transport(pool_connections: int = 10, pool_maxsize: int = 10) -> Transport:
+    """
+    Return the process-wide transport for the given pool sizes, creating it on first use.
+
+    Clients asking for the same pool sizes share one transport; a transport set with
+    `set_default_transport` is returned whatever the sizes.
+    """
+    with _default_lock:
+        if _default_transport is not None:
+            return _default_transport
+        key = (pool_connections, pool_maxsize)
+        transport = _sized_transports.get(key)
+        if transport is None:
+            transport = _sized_transports[key] = Transport(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        return transport
+
+
+def set_default_transport(transport: Optional[Transport]) -> None:
+    """
+    Replace the process-wide transport used by clients created without an explicit one.
+
+    Pass None to go back to one shared transport per pool size.
+    """
+    global _default_transport
+    with _default_lock:
+        _default_transport = transport
@@ -0,0 +1,138 @@
+"""
+#### Description:
+    Chemical dossiers: for each DTXSID, its details, properties, fate, hazard, cancer summary,
+    genotox, skin/eye, HTTK, SEEM exposure and bioactivity data in one merged record.
+
+    The DTXSIDs are processed in chunks; for each chunk every section is requested concurrently,
+    through the batch POST endpoints where they exist and a bounded fan-out of single-ID requests
+    where they don't. Dossiers are yielded in input order as soon as their chunk is complete,
+    while the next chunks are already in flight.
+
+#### Example:
+    ```python
+    with CompTox(api_key=api_key, cache=DiskCache()) as comptox:
+        for dossier in DossierBuilder(comptox).build(dtxsids):
+            print(dossier["dtxsid"], len(dossier["hazard"]))
+    ```
+"""
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence
+import collections
+from .client import CompTox
+from .utils.batching import chunked
+from .utils.exceptions import APIRequestError
+
+
+def _by_dtxsid(records: Any, dtxsids: List[str]) -> Dict[str, List[Any]]:
+    """
+    Group the records of a batch response by their 'dtxsid' field.
+    """
+    groups = {dtxsid: [] for dtxsid in dtxsids}
+    for record in records or []:
+        if isinstance(record, dict) and record.get("dtxsid") in groups:
+            groups[record["dtxsid"]].append(record)
+    return groups
+
+
+def _first(records: Any, dtxsids: List[str]) -> Dict[str, Any]:
+    """
+    One record per DTXSID, None for DTXSIDs without a record.
+    """
+    return {dtxsid: records[0] if records else None for dtxsid, records in _by_dtxsid(records, dtxsids).items()}
+
+
+# Section name -> function fetching it for a list of DTXSIDs, returning a mapping of DTXSID to value
+SECTIONS: Dict[str, Callable[[CompTox, List[str]], Dict[str, Any]]] = {
+    # Batch POST endpoints
+    "details": lambda c, ids: _first(c.chem_details.get_chemical_details_batch(by="dtxsid", data_list=ids), ids),
+    "properties": lambda c, ids: _by_dtxsid(c.properties.get_properties_batch(dtxsid_list=ids), ids),
+    "fate": lambda c, ids: _by_dtxsid(c.chem_fate.get_dtxids_batch(data_list=ids), ids),
+    "hazard": lambda c, ids: _by_dtxsid(c.hazard.get_hazard_batch(type="all", dtxsid_list=ids), ids),
+    "cancer": lambda c, ids: _by_dtxsid(c.cancer.get_by_dtxsid(ids), ids),
+    "genotox": lambda c, ids: _by_dtxsid(c.genotox.get_summary_data(ids), ids),
+    "skin_eye": lambda c, ids: _by_dtxsid(c.skin_eye.get_by_dtxsid(ids), ids),
+    # Single-ID endpoints, fanned out
+    "httk": lambda c, ids: c.httk.get_httk_data(ids),
+    "general_exposure": lambda c, ids: c.general_exposure.get_general_exposure(ids),
+    "demographic_exposure": lambda c, ids: c.demographic_exposure.get_demographic_exposure(ids),
+    "bioactivity": lambda c, ids: c.bioactivity.get_data("dtxsid", ids),
+}
+
+
+class DossierBuilder:
+    """
+    Build one merged record per DTXSID from every section in `sections`.
+
+    Each dossier has a 'dtxsid' key and one key per section. A section that fails for a chunk
+    is None in its dossiers and its error message is kept under 'errors', unless `strict`,
+    in which case the error is raised.
+    """
+    def __init__(self, comptox: CompTox, sections: Sequence[str] = None, chunk_size: int = 200,
+                 prefetch: int = 1, max_sections: int = None, strict: bool = False):
+        """
+        :param comptox: Facade whose clients, connection pool, cache and rate limiter are used. Sections
+                        and their fan-outs can have more requests in flight than the pool has
+                        connections; a pool created by the facade makes them wait for one.
+        :param sections: Names of the sections to include, all of `SECTIONS` by default.
+        :param chunk_size: DTXSIDs requested together; the batch endpoints accept up to 200.
+        :param prefetch: Chunks requested ahead of the one being yielded.
+        :param max_sections: Section requests in flight, defaults to one per section and chunk in flight.
+        :param strict: Raise the first section error instead of recording it.
+        """
+        sections = list(sections) if sections is not None else list(SECTIONS)
+        unknown = [name for name in sections if name not in SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown dossier sections: {unknown}. Valid sections: {list(SECTIONS)}")
+
+        self.comptox = comptox
+        self.sections = sections
+        self.chunk_size = chunk_size
+        self.prefetch = prefetch
+        self.max_sections = max_sections if max_sections is not None else len(sections) * (prefetch + 1)
+        self.strict = strict
+
+    def _submit(self, pool: ThreadPoolExecutor, chunk: List[str]) -> Dict[str, Future]:
+        return {name: pool.submit(SECTIONS[name], self.comptox, chunk) for name in self.sections}
+
+    def _merge(self, chunk: List[str], futures: Dict[str, Future]) -> Iterator[Dict[str, Any]]:
+        values, errors = {}, {}
+        for name, future in futures.items():
+            try:
+                values[name] = future.result()
+            except APIRequestError as e:
+                if self.strict:
+                    raise
+                values[name], errors[name] = {}, str(e)
+
+        for dtxsid in chunk:
+            dossier = {"dtxsid": dtxsid}
+            for name in self.sections:
+                dossier[name] = values[name].get(dtxsid)
+            if errors:
+                dossier["errors"] = dict(errors)
+            yield dossier
+
+    def build(self, dtxsids: Iterable[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yield one dossier per distinct DTXSID, in input order.
+
+        `dtxsids` may be any iterable, including a generator; it is consumed one chunk at a time.
+        """
+        seen = set()
+        unique = (dtxsid for dtxsid in dtxsids if not (dtxsid in seen or seen.add(dtxsid)))
+        chunks = chunked(unique, self.chunk_size)
+
+        with ThreadPoolExecutor(max_workers=self.max_sections) as pool:
+            pending = collections.deque()
+            try:
+                for chunk in chunks:
+                    pending.append((chunk, self._submit(pool, chunk)))
+                    if len(pending) > self.prefetch:
+                        yield from self._merge(*pending.popleft())
+                while pending:
+                    yield from self._merge(*pending.popleft())
+            finally:
+                # Stopped early or failed: drop the requests not started yet
+                for _, futures in pending:
+                    for future in futures.values():
+                        future.cancel()
@@ -0,0 +1,197 @@
+"""
+#### Description:
+    Resumable bulk jobs. A job splits an ID set into chunks, fetches each chunk with a batch or
+    fan-out method and appends its records to a JSON Lines results file. Every finished chunk is
+    recorded in an on-disk journal with the offsets of its records, so a job restarted after a crash
+    or an `APIRequestError` skips the finished chunks and only fetches what remains.
+
+#### Example:
+    ```python
+    hazard = Hazard(api_key=api_key)
+    job = BulkJob("hazard-sweep", lambda chunk: hazard.get_hazard_batch(type="all", dtxsid_list=chunk),
+                  chunk_size=200)
+    with open("dtxsids.txt") as f:
+        job.run(f)          # run again with the same input to resume
+    for record in job.results():
+        ...
+    ```
+"""
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+import collections
+import collections.abc
+import hashlib
+import json
+import os
+import threading
+from .utils.batching import chunked, iter_ids
+from .utils.exceptions import APIRequestError
+
+DEFAULT_JOBS_PATH = os.path.join(os.path.expanduser("~"), ".cache", "pycomptox", "jobs")
+
+
+def _digest(chunk: List[Any]) -> str:
+    return hashlib.sha256(json.dumps(chunk, separators=(",", ":"), default=str).encode("utf-8")).hexdigest()
+
+
+class BulkJob:
+    """
+    Bulk fetch that can be resumed after a failure.
+
+    The job lives in `directory/name/`: `results.jsonl` holds the records, one JSON document
+    per line, and `journal.jsonl` one line per finished chunk with its index, a digest of its
+    IDs and the byte range of its records. A chunk is journaled only after its records are
+    written and synced, so records of unfinished chunks are discarded on restart.
+
+    `fetch` takes a list of IDs. A list or other iterable result (e.g. of an `iter_*` method) is
+    written record by record, a mapping (as returned by fan-out methods) as one
+    `{"id": ..., "result": ...}` record per key. IDs that failed in a fan-out with
+    `return_exceptions=True` are written as `{"id": ..., "error": ..., "status_code": ...}`.
+    """
+    def __init__(self, name: str, fetch: Callable[[List[Any]], Any], chunk_size: int = 200,
+                 max_workers: int = 4, directory: str = DEFAULT_JOBS_PATH):
+        """
+        :param name: Job name, the same name resumes the same job.
+        :param fetch: Function fetching one chunk of IDs, e.g. a bound batch method.
+        :param chunk_size: IDs per chunk; keep it to the endpoint's batch limit.
+        :param max_workers: Chunks fetched concurrently.
+        :param directory: Directory holding the jobs.
+        """
+        self.name = name
+        self.fetch = fetch
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.path = os.path.join(directory, name)
+        self.journal_path = os.path.join(self.path, "journal.jsonl")
+        self.results_path = os.path.join(self.path, "results.jsonl")
+        self._lock = threading.Lock()
+
+    def journal(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Finished chunks by index, as recorded in the journal.
+        """
+        entries = {}
+        if not os.path.exists(self.journal_path):
+            return entries
+
+        with open(self.journal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A line cut by a crash: its chunk is fetched again
+                    break
+                if "chunk" in entry:
+                    entries[entry["chunk"]] = entry
+                elif entry.get("chunk_size") != self.chunk_size:
+                    raise ValueError(f"Job {self.name!r} was started with chunk_size={entry.get('chunk_size')}")
+        return entries
+
+    def _open(self) -> Dict[int, Dict[str, Any]]:
+        os.makedirs(self.path, exist_ok=True)
+        done = self.journal()
+
+        # Rewrite the journal without a line cut by a crash, so new entries follow valid ones
+        tmp_path = self.journal_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"job": self.name, "chunk_size": self.chunk_size}) + "\n")
+            for entry in done.values():
+                f.write(json.dumps(entry) + "\n")
+        os.replace(tmp_path, self.journal_path)
+
+        # Drop records written after the last journaled chunk
+        end = max((entry["end"] for entry in done.values()), default=0)
+        with open(self.results_path, "ab") as f:
+            f.truncate(end)
+        return done
+
+    def _record(self, result: Any) -> Iterator[Any]:
+        if isinstance(result, dict):
+            for key, value in result.items():
+                if isinstance(value, APIRequestError):
+                    yield {"id": key, "error": str(value), "status_code": value.status_code}
+                else:
+                    yield {"id": key, "result": value}
+        elif isinstance(result, collections.abc.Iterable) and not isinstance(result, (str, bytes)):
+            yield from result
+        elif result is not None:
+            yield result
+
+    def _write(self, index: int, chunk: List[Any], result: Any) -> None:
+        data = "".join(json.dumps(record) + "\n" for record in self._record(result)).encode("utf-8")
+        with self._lock:
+            with open(self.results_path, "ab") as f:
+                start = f.tell()
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            entry = {"chunk": index, "digest": _digest(chunk), "ids": len(chunk), "start": start, "end": start + len(data)}
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def run(self, ids: Iterable[Any]) -> Dict[str, int]:
+        """
+        Fetch every chunk of `ids` not finished by a previous run.
+
+        `ids` must yield the same IDs in the same order on every run. On the first failing chunk no
+        new chunk is started; chunks in flight are completed and journaled, then the error is raised.
+
+        :return: Counts of 'fetched' and 'skipped' chunks.
+        """
+        done = self._open()
+        counts = {"fetched": 0, "skipped": 0}
+        failed = threading.Event()
+
+        def fetch(index: int, chunk: List[Any]) -> None:
+            try:
+                self._write(index, chunk, self.fetch(chunk))
+            except BaseException:
+                failed.set()
+                raise
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = collections.deque()
+            try:
+                for index, chunk in enumerate(chunked(iter_ids(ids), self.chunk_size)):
+                    if failed.is_set():
+                        break
+                    entry = done.get(index)
+                    if entry is not None:
+                        if entry["digest"] != _digest(chunk):
+                            raise ValueError(f"Input of job {self.name!r} changed at chunk {index}")
+                        counts["skipped"] += 1
+                        continue
+
+                    pending.append(pool.submit(fetch, index, chunk))
+                    counts["fetched"] += 1
+                    if len(pending) >= self.max_workers:
+                        pending.popleft().result()
+                while pending:
+                    pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+        return counts
+
+    def results(self) -> Iterator[Any]:
+        """
+        Yield the records of the finished chunks, in input order; nothing before the first run.
+        """
+        if not os.path.exists(self.results_path):
+            return
+        entries = sorted(self.journal().values(), key=lambda entry: entry["chunk"])
+        with open(self.results_path, "rb") as f:
+            for entry in entries:
+                f.seek(entry["start"])
+                for line in f.read(entry["end"] - entry["start"]).splitlines():
+                    yield json.loads(line)
+
+    def reset(self) -> None:
+        """
+        Forget all progress, so the next run starts from the beginning.
+        """
+        for path in (self.journal_path, self.results_path):
+            if os.path.exists(path):
+                os.remove(path)
@@ -0,0 +1,12 @@
+"""
+#### Description:
+    Local indexes and caches answering API queries in-process, falling back to the API when they cannot.
+"""
+from .chemical_index import ChemicalIndex
+from .intervals import IntervalSet
+from .mass_cache import MassRangeCache
+from .property_cache import PropertyRangeCache
+from .typeahead import AsyncTypeAheadSession, TypeAheadSession
+
+__all__ = ["ChemicalIndex", "IntervalSet", "MassRangeCache", "PropertyRangeCache", "TypeAheadSession",
+           "AsyncTypeAheadSession"]
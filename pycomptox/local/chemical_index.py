@@ -0,0 +1,151 @@
+"""
+#### Description:
+    Local index answering `ChemSearch.get_chemical` start-with, equal and contain searches
+    without a request.
+
+    The index holds one sorted array of keys per searched field: preferred name, CAS number,
+    DTXSID and DTXCID. Prefix and exact lookups are binary searches, substring lookups a scan
+    of the keys. Matching is case-insensitive and hits have the output shape of the search
+    endpoints. It is built from chemical lists or detail records, and saved to and loaded from
+    a JSON Lines snapshot file.
+
+#### Example:
+    ```python
+    with CompTox(api_key=api_key) as comptox:
+        index = ChemicalIndex.from_lists(comptox, ["PRODWATER", "40CFR1164"])
+        index.save("chemicals.jsonl")
+        comptox.chem_search.index = index
+        hits = comptox.chem_search.get_chemical(op="start-with", word="bisph", params={"top": 10})
+    ```
+"""
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from ..utils import jsonlib
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..client import CompTox
+
+
+# Fields kept per chemical, in the order of the search output schema
+FIELDS = ("casrn", "dtxsid", "dtxcid", "preferredName", "hasStructureImage", "smiles", "isMarkush")
+
+# Searched field -> (searchName of its hits, rank); hits are ordered by rank
+SEARCH_FIELDS = {
+    "preferredName": ("Approved Name", 1),
+    "casrn": ("CAS-RN", 2),
+    "dtxsid": ("DSSTox_Substance_Id", 3),
+    "dtxcid": ("DSSTox_Compound_Id", 4),
+}
+
+OPS = ("start-with", "equal", "contain")
+
+
+class ChemicalIndex:
+    """
+    Sorted-array index over the searched fields of a set of chemicals.
+    """
+    def __init__(self, records: Iterable[Dict[str, Any]] = ()):
+        """
+        :param records: Chemical search hits or chemical details; extra fields are ignored and
+                        records without a DTXSID are skipped. The first record of a DTXSID wins.
+        """
+        seen = set()
+        self._chemicals: List[Tuple[Any, ...]] = []
+        for record in records:
+            dtxsid = record.get("dtxsid")
+            if dtxsid and dtxsid not in seen:
+                seen.add(dtxsid)
+                self._chemicals.append(tuple(record.get(field) for field in FIELDS))
+
+        # Per searched field: sorted upper-cased keys and the position of their chemical
+        self._keys: Dict[str, List[str]] = {}
+        self._positions: Dict[str, array] = {}
+        for field in SEARCH_FIELDS:
+            column = FIELDS.index(field)
+            entries = sorted(
+                (value.upper(), position) for position, chemical in enumerate(self._chemicals)
+                if isinstance(value := chemical[column], str) and value
+            )
+            self._keys[field] = [key for key, _ in entries]
+            self._positions[field] = array("l", (position for _, position in entries))
+
+    def __len__(self) -> int:
+        return len(self._chemicals)
+
+    @classmethod
+    def from_lists(cls, comptox: "CompTox", list_names: Sequence[str]) -> "ChemicalIndex":
+        """
+        Build an index of the chemicals of public lists, e.g. from `ChemList.get_all_public_lists`.
+
+        :param comptox: Facade whose `chem_list` and `chem_details` clients download the lists and details.
+        :param list_names: Names of the lists.
+        """
+        dtxsids = {}
+        for name in list_names:
+            dtxsids.update(dict.fromkeys(comptox.chem_list.get_chem_by_list(op="listname", list=name) or []))
+        details = comptox.chem_details.get_chemical_details_batch(by="dtxsid", data_list=list(dtxsids))
+        return cls(details or [])
+
+    @classmethod
+    def load(cls, path: str) -> "ChemicalIndex":
+        """
+        Build an index from a JSON Lines snapshot file, one chemical per line.
+        """
+        with open(path, "rb") as f:
+            return cls(jsonlib.loads(line) for line in f if line.strip())
+
+    def save(self, path: str) -> None:
+        """
+        Write the indexed chemicals to a JSON Lines snapshot file.
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            for chemical in self._chemicals:
+                f.write(jsonlib.dumps(dict(zip(FIELDS, chemical))) + "\n")
+
+    def _matches(self, field: str, op: str, key: str) -> Iterator[int]:
+        keys, positions = self._keys[field], self._positions[field]
+        if op == "contain":
+            for i, candidate in enumerate(keys):
+                if key in candidate:
+                    yield positions[i]
+            return
+
+        i = bisect_left(keys, key)
+        while i < len(keys) and (keys[i] == key if op == "equal" else keys[i].startswith(key)):
+            yield positions[i]
+            i += 1
+
+    def search(self, op: str, word: str, top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Search the index like `ChemSearch.get_chemical`.
+
+        Hits are ordered by the rank of the matched field, then by matched value, with one hit per
+        chemical.
+
+        :param op: 'start-with', 'equal' or 'contain'
+        :param word: Search word, matched case-insensitively.
+        :param top: Maximum number of hits.
+        :return: Hits in the output schema of the search endpoints; empty when nothing matches.
+        """
+        if op not in OPS:
+            raise ValueError(f"Invalid operator. Valid values are {', '.join(repr(o) for o in OPS)}")
+
+        key = word.strip().upper()
+        hits, seen = [], set()
+        if not key:
+            return hits
+
+        for field, (search_name, rank) in SEARCH_FIELDS.items():
+            column = FIELDS.index(field)
+            for position in self._matches(field, op, key):
+                if top is not None and len(hits) >= top:
+                    return hits
+                if position in seen:
+                    continue
+                seen.add(position)
+                chemical = self._chemicals[position]
+                hit = dict(zip(FIELDS, chemical))
+                hit.update(searchName=search_name, searchValue=chemical[column], rank=rank)
+                hits.append(hit)
+        return hits
@@ -0,0 +1,81 @@
+"""
+#### Description:
+    Sets of closed numeric intervals, used to track which value ranges a local cache has
+    fetched and which gaps of a query still need a request.
+"""
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Tuple
+
+Interval = Tuple[float, float]
+
+
+def split(intervals: Iterable[Interval], max_width: float = None) -> List[Interval]:
+    """
+    Split intervals wider than `max_width` into consecutive pieces of at most `max_width`.
+    """
+    pieces = []
+    for start, end in intervals:
+        while max_width and end - start > max_width:
+            pieces.append((start, start + max_width))
+            start += max_width
+        pieces.append((start, end))
+    return pieces
+
+
+class IntervalSet:
+    """
+    Union of closed intervals, kept as sorted, disjoint lists of starts and ends.
+    """
+    def __init__(self, intervals: Iterable[Interval] = ()):
+        self._starts: List[float] = []
+        self._ends: List[float] = []
+        for start, end in intervals:
+            self.add(start, end)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __iter__(self) -> Iterator[Interval]:
+        return iter(zip(self._starts, self._ends))
+
+    def add(self, start: float, end: float) -> None:
+        """
+        Add [start, end], merging it with the intervals it overlaps or touches.
+        """
+        if start > end:
+            raise ValueError(f"Invalid interval [{start}, {end}]")
+
+        # Intervals ending before `start` and starting after `end` are kept
+        first = bisect_left(self._ends, start)
+        last = bisect_right(self._starts, end)
+        if first < last:
+            start = min(start, self._starts[first])
+            end = max(end, self._ends[last - 1])
+        self._starts[first:last] = [start]
+        self._ends[first:last] = [end]
+
+    def covers(self, start: float, end: float) -> bool:
+        """
+        Whether [start, end] lies within a single interval of the set.
+        """
+        i = bisect_right(self._starts, start) - 1
+        return i >= 0 and self._ends[i] >= end
+
+    def gaps(self, start: float, end: float) -> List[Interval]:
+        """
+        The parts of [start, end] outside the set, each bounded by the query or the intervals around it.
+        """
+        if self.covers(start, end):
+            return []
+
+        gaps = []
+        cursor = start
+        i = bisect_left(self._ends, start)
+        while i < len(self._starts) and self._starts[i] <= end:
+            if self._starts[i] > cursor:
+                gaps.append((cursor, self._starts[i]))
+            cursor = max(cursor, self._ends[i])
+            i += 1
+        if cursor < end or not gaps:
+            gaps.append((cursor, end))
+        return gaps
@@ -0,0 +1,182 @@
+"""
+#### Description:
+    Interval cache for `ChemSearch.ms_ready(op="mass")` mass-window searches.
+
+    The cache remembers which mass ranges it has fetched. A window inside them is answered
+    locally; otherwise only the uncovered gaps are requested. Overlapping windows of a peak
+    list are merged first, so annotating a whole LC-MS run takes a few requests.
+
+    The endpoint returns DTXSIDs without masses, so each candidate's MS-ready mass is known as
+    an interval: the intersection of the windows that returned it, trimmed by the windows that
+    did not. The `details` client places candidates that are their own MS-ready form (same SMILES)
+    at their monoisotopic mass in sorted arrays searched with bisect. A window that cuts through
+    a candidate's interval cannot be answered locally and is requested whole, so without
+    `details` a window inside the fetched ranges is answered locally only once the windows
+    around each candidate have narrowed its interval.
+
+#### Example:
+    ```python
+    cache = MassRangeCache(ChemSearch(api_key=api_key))
+    windows = [(mz - mz * 5e-6, mz + mz * 5e-6) for mz in neutral_masses]
+    candidates = cache.search_many(windows)
+    ```
+"""
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import threading
+from .intervals import Interval, IntervalSet, split
+
+
+class MassRangeCache:
+    """
+    Mass-window cache in front of a `ChemSearch` client. Answers are DTXSIDs ordered by mass,
+    candidates with an unknown exact mass last.
+    """
+    def __init__(self, client: Any, details: Any = None, max_width: float = None, max_workers: int = 4):
+        """
+        :param client: `ChemSearch` client sending the mass searches.
+        :param details: `ChemDetails` client resolving the masses of new candidates, by default one
+                        sharing the settings and connection pool of `client`. Pass False to keep
+                        only the mass bounds learned from the searches.
+        :param max_width: Widest mass range requested at once; wider gaps are split.
+        :param max_workers: Gaps requested concurrently.
+        """
+        if details is None:
+            details = self._details_for(client)
+        self.client = client
+        self.details = details or None
+        self.max_width = max_width
+        self.max_workers = max_workers
+        self.fetched = IntervalSet()
+        self.stats = {"requests": 0, "local": 0}
+        # Candidates with a known mass, sorted by mass
+        self._masses: List[float] = []
+        self._ids: List[str] = []
+        # Candidates with an unknown exact mass -> [low, high] bounds of their mass
+        self._bounds: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _details_for(client: Any) -> Any:
+        from ..apis.chem_search import ChemDetails
+        from ..core.base_client import BaseAPIClient
+
+        if not isinstance(client, BaseAPIClient):
+            raise ValueError("Pass a ChemDetails client as details, or details=False to search without exact masses")
+        details = ChemDetails(
+            client.api_key, config=client.config, transport=client.transport, cache=client.cache,
+            memo_cache=client.memo_cache, rate_limiter=client.rate_limiter, retry=client.retry,
+            max_workers=client.max_workers, coalesce=client.coalesce, hooks=client.hooks,
+        )
+        details.base_url = client.base_url
+        return details
+
+    def __len__(self) -> int:
+        return len(self._ids) + len(self._bounds)
+
+    def _fetch(self, window: Interval) -> List[str]:
+        with self._lock:
+            self.stats["requests"] += 1
+        ids = self.client.ms_ready(op="mass", start=window[0], end=window[1])
+        return [dtxsid for dtxsid in ids or [] if isinstance(dtxsid, str)]
+
+    def _learn(self, window: Interval, ids: List[str]) -> List[str]:
+        """
+        Record the response of a window and narrow the bounds of the candidates; return the new ones.
+        """
+        start, end = window
+        returned = set(ids)
+        for dtxsid, bound in list(self._bounds.items()):
+            if dtxsid in returned:
+                bound[0], bound[1] = max(bound[0], start), min(bound[1], end)
+            elif start <= bound[0] and bound[1] <= end:
+                # Contradicts an earlier response: forget it until it is returned again
+                del self._bounds[dtxsid]
+            elif start <= bound[0] <= end:
+                bound[0] = end
+            elif start <= bound[1] <= end:
+                bound[1] = start
+
+        known = set(self._ids)
+        new = [dtxsid for dtxsid in dict.fromkeys(ids) if dtxsid not in known and dtxsid not in self._bounds]
+        for dtxsid in new:
+            self._bounds[dtxsid] = [start, end]
+        self.fetched.add(start, end)
+        return new
+
+    def _resolve(self, dtxsids: List[str]) -> None:
+        """
+        Place the candidates whose monoisotopic mass is their MS-ready mass.
+        """
+        if self.details is None or not dtxsids:
+            return
+        records = self.details.get_chemical_details_batch(by="dtxsid", data_list=dtxsids) or []
+        with self._lock:
+            for record in records:
+                if not isinstance(record, dict):
+                    continue
+                bound = self._bounds.get(record.get("dtxsid"))
+                mass = record.get("monoisotopicMass")
+                if bound is None or not isinstance(mass, (int, float)):
+                    continue
+                # Salts, mixtures and charged species have a different MS-ready form and mass
+                same_form = record.get("msReadySmiles") and record.get("msReadySmiles") == record.get("smiles")
+                if same_form and bound[0] <= mass <= bound[1]:
+                    del self._bounds[record["dtxsid"]]
+                    i = bisect_right(self._masses, mass)
+                    self._masses.insert(i, mass)
+                    self._ids.insert(i, record["dtxsid"])
+
+    def _answer(self, start: float, end: float) -> Optional[List[str]]:
+        """
+        Candidates of a fetched window, or None when a candidate's bounds straddle the window.
+        """
+        ids = self._ids[bisect_left(self._masses, start):bisect_right(self._masses, end)]
+        for dtxsid, (low, high) in self._bounds.items():
+            if start <= low and high <= end:
+                ids.append(dtxsid)
+            elif low <= end and high >= start:
+                return None
+        return ids
+
+    def search(self, start: float, end: float) -> List[str]:
+        """
+        DTXSIDs whose MS-ready mass lies in [start, end].
+        """
+        return self.search_many([(start, end)])[0]
+
+    def search_many(self, windows: Sequence[Tuple[float, float]]) -> List[List[str]]:
+        """
+        DTXSIDs of every window, requesting the uncovered parts of their union once.
+        """
+        for start, end in windows:
+            if start > end:
+                raise ValueError(f"Invalid mass window [{start}, {end}]")
+
+        with self._lock:
+            gaps = []
+            for start, end in IntervalSet(windows):
+                gaps.extend(self.fetched.gaps(start, end))
+        gaps = split(gaps, self.max_width)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            responses = list(pool.map(self._fetch, gaps))
+        with self._lock:
+            new = [dtxsid for gap, ids in zip(gaps, responses) for dtxsid in self._learn(gap, ids)]
+        self._resolve(new)
+
+        results = []
+        for start, end in windows:
+            with self._lock:
+                ids = self._answer(start, end)
+            if ids is None:
+                ids = self._fetch((start, end))
+                with self._lock:
+                    new = self._learn((start, end), ids)
+                self._resolve(new)
+            else:
+                with self._lock:
+                    self.stats["local"] += 1
+            results.append(ids)
+        return results
@@ -0,0 +1,109 @@
+"""
+#### Description:
+    Range-query cache for `ChemProperties.get_properties(by="propid")` value-range searches.
+
+    For each property the cache remembers the value ranges it has fetched, merged into
+    intervals, and the records they returned in a sorted value index. A range inside the
+    fetched intervals is answered locally with bisect; otherwise only the uncovered parts of
+    the range are requested.
+
+#### Example:
+    ```python
+    cache = PropertyRangeCache(ChemProperties(api_key=api_key))
+    records = cache.search("density", 1.2, 1.4)
+    records = cache.search("density", 1.25, 1.45)   # requests only [1.4, 1.45]
+    ```
+"""
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
+import threading
+from .intervals import Interval, IntervalSet, split
+
+
+class _PropertyIndex:
+    """
+    Fetched ranges and records of one property, sorted by value.
+    """
+    def __init__(self):
+        self.fetched = IntervalSet()
+        self.values: List[float] = []
+        self.records: List[Dict[str, Any]] = []
+        self.keys = set()
+
+    def add(self, window: Interval, records: List[Any]) -> None:
+        for record in records:
+            value = record.get("value") if isinstance(record, dict) else None
+            if not isinstance(value, (int, float)) or isinstance(value, bool):
+                continue
+            key = record.get("id")
+            if key is None:
+                key = (record.get("dtxsid"), record.get("source"), record.get("propType"), value)
+            if key in self.keys:
+                # Returned again by an overlapping range
+                continue
+            self.keys.add(key)
+            i = bisect_right(self.values, value)
+            self.values.insert(i, value)
+            self.records.insert(i, record)
+        self.fetched.add(*window)
+
+    def answer(self, start: float, end: float) -> List[Dict[str, Any]]:
+        return self.records[bisect_left(self.values, start):bisect_right(self.values, end)]
+
+
+class PropertyRangeCache:
+    """
+    Per-property value-range cache in front of a `ChemProperties` client. Answers are property
+    records ordered by value.
+    """
+    def __init__(self, client: Any, max_width: float = None, max_workers: int = 4):
+        """
+        :param client: `ChemProperties` client sending the range searches.
+        :param max_width: Widest value range requested at once; wider gaps are split.
+        :param max_workers: Gaps requested concurrently.
+        """
+        self.client = client
+        self.max_width = max_width
+        self.max_workers = max_workers
+        self.stats = {"requests": 0, "local": 0}
+        self._properties: Dict[str, _PropertyIndex] = {}
+        self._lock = threading.Lock()
+
+    def _fetch(self, request: Tuple[str, Interval]) -> List[Any]:
+        propertyid, (start, end) = request
+        with self._lock:
+            self.stats["requests"] += 1
+        records = self.client.get_properties(by="propid", params={"propertyid": propertyid, "start": start, "end": end})
+        return records if isinstance(records, list) else []
+
+    def search(self, propertyid: str, start: float, end: float) -> List[Dict[str, Any]]:
+        """
+        Records of a property whose value lies in [start, end].
+        """
+        if start > end:
+            raise ValueError(f"Invalid range [{start}, {end}]")
+
+        with self._lock:
+            index = self._properties.setdefault(propertyid, _PropertyIndex())
+            gaps = split(index.fetched.gaps(start, end), self.max_width)
+            if not gaps:
+                self.stats["local"] += 1
+                return index.answer(start, end)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            responses = list(pool.map(self._fetch, [(propertyid, gap) for gap in gaps]))
+        with self._lock:
+            for gap, records in zip(gaps, responses):
+                index.add(gap, records)
+            return index.answer(start, end)
+
+    def clear(self, propertyid: str = None) -> None:
+        """
+        Forget the fetched ranges of a property, or of every property.
+        """
+        with self._lock:
+            if propertyid is None:
+                self._properties.clear()
+            else:
+                self._properties.pop(propertyid, None)
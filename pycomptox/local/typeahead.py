@@ -0,0 +1,171 @@
+"""
+#### Description:
+    Type-ahead search sessions for chemical pickers calling `ChemSearch.get_chemical` with
+    op='start-with' on every keystroke.
+
+    A session remembers recent responses by prefix. A response with fewer hits than `top` is
+    the complete hit list of its prefix, so a longer prefix is answered by filtering it
+    locally instead of sending a request. A query overtaken by a newer one is dropped: its
+    result is still remembered but not returned, and the async session cancels its request
+    (its requests are not coalesced, so that cancelling one closes its connection).
+
+#### Example:
+    ```python
+    session = TypeAheadSession(ChemSearch(api_key=api_key), top=50)
+    for typed in ["benz", "benze", "benzen"]:
+        hits = session.search(typed)     # one request, two local answers
+    ```
+"""
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import threading
+
+# Fields of a hit a longer prefix is matched against when filtering a complete response
+SEARCH_FIELDS = ("searchValue", "preferredName", "casrn", "dtxsid", "dtxcid")
+
+
+class TypeAheadSession:
+    """
+    Prefix search session over a blocking `ChemSearch` client.
+
+    A longer prefix keeps the hits of a complete response with a `SEARCH_FIELDS` value starting
+    with it. A hit only carries the synonym the API matched the shorter prefix with, so a
+    chemical whose other synonyms match the longer prefix, but none of these fields do, is
+    missed.
+    """
+    def __init__(self, client: Any, top: int = 50, max_prefixes: int = 256, params: Dict[str, Any] = None):
+        """
+        :param client: `ChemSearch` client, or `AsyncChemSearch` for `AsyncTypeAheadSession`.
+        :param top: Hits requested per search; responses with fewer hits are complete and reused.
+        :param max_prefixes: Prefix responses remembered, least recently used first evicted.
+        :param params: Other query parameters sent with every search, e.g. a projection.
+        """
+        if top < 1:
+            raise ValueError("top must be at least 1")
+
+        self.client = client
+        self.top = top
+        self.max_prefixes = max_prefixes
+        self.params = dict(params or {}, top=top)
+        self.stats = {"requests": 0, "reused": 0, "dropped": 0}
+        self._prefixes: "OrderedDict[str, Tuple[List[Dict[str, Any]], bool]]" = OrderedDict()
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(word: str) -> str:
+        return word.strip().upper()
+
+    @staticmethod
+    def _matches(hit: Dict[str, Any], key: str) -> bool:
+        return any(str(hit.get(field) or "").upper().startswith(key) for field in SEARCH_FIELDS)
+
+    def _reuse(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Answer from the response of the prefix itself or of the longest complete shorter prefix.
+        """
+        with self._lock:
+            entry = self._prefixes.get(key)
+            if entry is not None:
+                self._prefixes.move_to_end(key)
+                self.stats["reused"] += 1
+                return list(entry[0])
+
+            for end in range(len(key) - 1, 0, -1):
+                entry = self._prefixes.get(key[:end])
+                if entry is not None and entry[1]:
+                    hits = [hit for hit in entry[0] if self._matches(hit, key)]
+                    self._store(key, hits, complete=True)
+                    self.stats["reused"] += 1
+                    return list(hits)
+        return None
+
+    def _store(self, key: str, hits: List[Dict[str, Any]], complete: bool) -> None:
+        self._prefixes[key] = (hits, complete)
+        self._prefixes.move_to_end(key)
+        while len(self._prefixes) > self.max_prefixes:
+            self._prefixes.popitem(last=False)
+
+    def _remember(self, key: str, hits: Any) -> List[Dict[str, Any]]:
+        hits = hits if isinstance(hits, list) else []
+        with self._lock:
+            self._store(key, hits, complete=len(hits) < self.top)
+        return list(hits)
+
+    def _start(self) -> int:
+        with self._lock:
+            self._generation += 1
+            self.stats["requests"] += 1
+            return self._generation
+
+    def search(self, word: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the hits of a prefix, in the ranked order of the API.
+
+        :return: The hits, or None when a newer search started while this one was in flight.
+        """
+        key = self._key(word)
+        if not key:
+            return []
+        hits = self._reuse(key)
+        if hits is not None:
+            return hits
+
+        generation = self._start()
+        hits = self._remember(key, self.client.get_chemical(op="start-with", word=word.strip(), params=dict(self.params)))
+        with self._lock:
+            if generation != self._generation:
+                self.stats["dropped"] += 1
+                return None
+        return hits
+
+    def clear(self) -> None:
+        """
+        Forget the remembered responses.
+        """
+        with self._lock:
+            self._prefixes.clear()
+
+
+class AsyncTypeAheadSession(TypeAheadSession):
+    """
+    Prefix search session over an `AsyncChemSearch` client. Starting a search cancels the
+    request of the previous one if it is still in flight; session requests bypass the client's
+    request coalescing, which would otherwise keep a cancelled request running.
+    """
+    def __init__(self, client: Any, **kwargs):
+        super().__init__(client, **kwargs)
+        self._task = None
+
+    async def search(self, word: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return the hits of a prefix, in the ranked order of the API.
+
+        :return: The hits, or None when a newer search cancelled this one.
+        """
+        import asyncio
+
+        key = self._key(word)
+        if not key:
+            return []
+        hits = self._reuse(key)
+        if hits is not None:
+            return hits
+
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._start()
+        task = self._task = asyncio.ensure_future(
+            self.client.get_chemical(op="start-with", word=word.strip(), params=dict(self.params), coalesce=False)
+        )
+        try:
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+
+        if task.cancelled():
+            with self._lock:
+                self.stats["dropped"] += 1
+            return None
+        return self._remember(key, task.result())
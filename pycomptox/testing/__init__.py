@@ -0,0 +1,3 @@
+from .server import StubServer
+
+__all__ = ["StubServer"]
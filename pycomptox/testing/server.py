@@ -0,0 +1,260 @@
+"""
+#### Description:
+    Local stand-in for the CompTox APIs, for tests and benchmarks that must not reach the network.
+    It serves the `chemical/`, `hazard/`, `exposure/` and `bioactivity/` routes used by the clients
+    with synthetic records shaped like the real responses (see `pycomptox.core.schemas`), and can
+    simulate latency, large payloads, batch size limits and 429 throttling.
+
+#### Example:
+    ```python
+    with StubServer(latency=0.02, batch_limit=200) as server:
+        hazard = Hazard(api_key="test", config=server.config())
+        records = hazard.get_hazard_batch(type="all", dtxsid_list=dtxsids)
+        print(server.requests)
+    ```
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+import collections
+import json
+import random
+import threading
+import time
+import zlib
+from ..core.config import Config
+from ..core.metrics import endpoint_template
+from ..core.schemas import schema_for
+
+# Routes returning a long list for one value (an assay's data rows, a list's chemicals, ...)
+_LARGE_ROUTES = ("bioactivity/data/search/by-aeid/", "chemical/list/chemicals/", "bioactivity/assay/",
+                 "chemical/list/", "chemical/msready/search/by-mass/", "chemical/property/search/by-range/")
+
+
+def _value(field: str, type_: str, id_: Any, i: int) -> Any:
+    if type_ == "int":
+        return i
+    if type_ == "float":
+        return round(1.0 + zlib.crc32(f"{field}/{id_}".encode("utf-8")) % 10_000 / 100.0 + i, 4)
+    if type_ == "bool":
+        return i % 2 == 0
+    return f"{field}-{id_}-{i}"
+
+
+class StubServer:
+    """
+    Threaded HTTP server mimicking the CompTox routes used by the clients.
+
+    GET requests for one value return `records_per_id` records; catalogue and list routes
+    return `list_size` records. POST requests to batch endpoints return `records_per_id` records
+    per value sent, JSON array or EOL separated text, and answer 400 beyond `batch_limit` values.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 records_per_id: int = 1, list_size: int = 1000, padding: int = 0, batch_limit: int = 200,
+                 rate_limit: float = None, burst: int = 1, throttle_every: int = 0, retry_after: float = 0):
+        """
+        :param host: Interface to listen on.
+        :param port: Port to listen on, a free one when 0.
+        :param latency: Seconds to wait before answering each request.
+        :param jitter: Additional uniformly random latency in seconds.
+        :param records_per_id: Records returned per requested value.
+        :param list_size: Records returned by catalogue and list routes.
+        :param padding: Characters of filler added to each record, to simulate larger payloads.
+        :param batch_limit: Maximum number of values accepted by a batch POST.
+        :param rate_limit: Requests per second served before answering 429, unlimited when None.
+        :param burst: Requests served back to back before `rate_limit` applies.
+        :param throttle_every: Answer every n-th request with 429, disabled when 0.
+        :param retry_after: Value of the `Retry-After` header sent with 429 responses.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.records_per_id = records_per_id
+        self.list_size = list_size
+        self.padding = padding
+        self.batch_limit = batch_limit
+        self.rate_limit = rate_limit
+        self.burst = burst
+        self.throttle_every = throttle_every
+        self.retry_after = retry_after
+
+        # Requests received and 429 answers sent, per method and endpoint template
+        self.requests = collections.Counter()
+        self.throttled = collections.Counter()
+        self._count = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def config(self, **kwargs) -> Config:
+        """
+        Client configuration pointing at this server.
+        """
+        return Config(api_key="stub-api-key", base_url=self.base_url, **kwargs)
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="comptox-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _throttle(self) -> bool:
+        """
+        Whether the current request should be answered with 429.
+        """
+        with self._lock:
+            self._count += 1
+            if self.throttle_every and self._count % self.throttle_every == 0:
+                return True
+            if self.rate_limit is None:
+                return False
+
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_limit)
+            self._updated = now
+            if self._tokens < 1:
+                return True
+            self._tokens -= 1
+            return False
+
+    def records(self, endpoint: str, id_: Any, count: int) -> List[Dict[str, Any]]:
+        """
+        Synthetic records of an endpoint for one requested value.
+        """
+        schema = schema_for(endpoint) or [("id", "int"), ("dtxsid", "str"), ("name", "str"), ("value", "float")]
+        key = "dtxcid" if "by-dtxcid" in endpoint else "aeid" if "by-aeid" in endpoint else "dtxsid"
+        records = []
+        for i in range(count):
+            record = {field: _value(field, type_, id_, i) for field, type_ in schema}
+            if id_ is not None:
+                record[key] = id_
+            if self.padding:
+                record["padding"] = "x" * self.padding
+            records.append(record)
+        return records
+
+    def respond(self, method: str, endpoint: str, body: Optional[bytes], content_type: str) -> Tuple[int, Any]:
+        """
+        Status and decoded payload for a request.
+        """
+        if method == "POST":
+            if content_type.startswith("text/plain"):
+                values = [line for line in (body or b"").decode("utf-8").split("\n") if line]
+            else:
+                values = json.loads(body or b"[]")
+            if not isinstance(values, list):
+                return 400, {"title": "Bad Request", "detail": "Expected an array of values"}
+            if len(values) > self.batch_limit:
+                return 400, {"title": "Bad Request", "detail": f"At most {self.batch_limit} values per request"}
+            return 200, [record for value in values for record in self.records(endpoint, value, self.records_per_id)]
+
+        template = endpoint_template(endpoint)
+        id_ = endpoint.rstrip("/").rsplit("/", 1)[-1] if template != endpoint else None
+        if id_ is None or endpoint.startswith(_LARGE_ROUTES):
+            return 200, self.records(endpoint, id_, self.list_size)
+        if endpoint.startswith("chemical/detail/search/"):
+            return 200, self.records(endpoint, id_, 1)[0]
+        return 200, self.records(endpoint, id_, self.records_per_id)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; with Nagle the body waits for the
+            # client's delayed ACK of the headers (~40 ms per keep-alive response)
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _serve(self, method: str):
+                endpoint = unquote(urlsplit(self.path).path).lstrip("/")
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else None
+                with server._lock:
+                    server.requests[(method, endpoint_template(endpoint))] += 1
+
+                delay = server.latency + (random.uniform(0, server.jitter) if server.jitter else 0)
+                if delay:
+                    time.sleep(delay)
+
+                if server._throttle():
+                    with server._lock:
+                        server.throttled[(method, endpoint_template(endpoint))] += 1
+                    status, payload = 429, {"title": "Too Many Requests"}
+                    headers = {"Retry-After": str(server.retry_after)}
+                elif self.headers.get("x-api-key") is None:
+                    status, payload, headers = 401, {"title": "Unauthorized"}, {}
+                else:
+                    status, payload = server.respond(method, endpoint, body, self.headers.get("Content-Type", ""))
+                    headers = {}
+
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._serve("GET")
+
+            def do_POST(self):
+                self._serve("POST")
+
+        return Handler
+
+
+def main(argv: List[str] = None) -> None:
+    """
+    Run the stub server in the foreground: `python -m pycomptox.testing --port 8080`.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local stand-in for the CompTox APIs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--records-per-id", type=int, default=1)
+    parser.add_argument("--list-size", type=int, default=1000)
+    parser.add_argument("--padding", type=int, default=0)
+    parser.add_argument("--batch-limit", type=int, default=200)
+    parser.add_argument("--rate-limit", type=float, default=None)
+    parser.add_argument("--burst", type=int, default=1)
+    parser.add_argument("--throttle-every", type=int, default=0)
+    parser.add_argument("--retry-after", type=float, default=0)
+    args = parser.parse_args(argv)
+
+    server = StubServer(**vars(args))
+    # The first line tells a parent process where to connect
+    print(server.base_url, flush=True)
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
@@ -0,0 +1,46 @@
+from itertools import islice
+from typing import Any, Iterable, Iterator, List
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """
+    Split an iterable into lists of at most `size` items.
+    """
+    if size < 1:
+        raise ValueError("Chunk size must be at least 1")
+
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_ids(items: Iterable[Any]) -> Iterator[Any]:
+    """
+    Yield IDs from any iterable, e.g. a file handle with one ID per line.
+
+    String IDs are stripped of surrounding whitespace and blank lines are skipped.
+    """
+    for item in items:
+        if isinstance(item, str):
+            item = item.strip()
+            if not item:
+                continue
+        yield item
+
+
+def merge_results(results: Iterable[Any]) -> List[Any]:
+    """
+    Merge per-chunk responses into a single list, in chunk order.
+    """
+    merged = []
+    for result in results:
+        if result is None:
+            continue
+        if isinstance(result, list):
+            merged.extend(result)
+        else:
+            merged.append(result)
+    return merged
@@ -1,6 +1,9 @@
 class APIRequestError(Exception):
     """
     Raised when an API request fails.
+
+    `status_code` holds the HTTP status of the failed response, or None when no response was received.
     """
-    def __init__(self, message: str):
+    def __init__(self, message: str, status_code: int = None):
         super().__init__(message)
+        self.status_code = status_code
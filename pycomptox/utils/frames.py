@@ -0,0 +1,107 @@
+"""
+#### Description:
+    Build pandas DataFrames or Arrow tables column by column from decoded JSON records.
+    pandas and pyarrow are optional dependencies and are imported on first use.
+"""
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas
+    import pyarrow
+
+
+Schema = List[Tuple[str, str]]
+
+OUTPUTS = ("pandas", "arrow", "records")
+
+_PANDAS_TYPES = {"str": "string", "int": "Int64", "float": "Float64", "bool": "boolean"}
+
+
+def _records(result: Any) -> List[Any]:
+    if result is None:
+        return []
+    if isinstance(result, list):
+        return result
+    return [result]
+
+
+def to_columns(result: Any, schema: Optional[Schema] = None) -> Tuple[Dict[str, List[Any]], Dict[str, str]]:
+    """
+    Split records into one list per field.
+
+    Schema fields come first with their declared types; fields missing from the schema
+    follow in order of appearance with inferred types. Records that are not objects
+    (e.g., lists of DTXSIDs) become a single 'value' column.
+
+    :return: A tuple of (columns, declared types).
+    """
+    records = _records(result)
+    if records and not all(isinstance(record, dict) for record in records):
+        return {"value": records}, {}
+
+    types = dict(schema or [])
+    fields = dict.fromkeys(types)
+    for record in records:
+        if not fields.keys() >= record.keys():
+            fields.update(dict.fromkeys(record))
+
+    columns = {field: [record.get(field) for record in records] for field in fields}
+    return columns, types
+
+
+def to_pandas(result: Any, schema: Optional[Schema] = None) -> "pandas.DataFrame":
+    """
+    Build a pandas DataFrame with nullable typed columns.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError("pandas is required for output='pandas': pip install pycomptox[pandas]")
+
+    columns, types = to_columns(result, schema)
+    data = {}
+    for field, values in columns.items():
+        dtype = _PANDAS_TYPES.get(types.get(field))
+        try:
+            data[field] = pd.array(values, dtype=dtype)
+        except (TypeError, ValueError):
+            # The API returned values that do not match the documented type
+            data[field] = pd.array(values)
+    return pd.DataFrame(data)
+
+
+def to_arrow(result: Any, schema: Optional[Schema] = None) -> "pyarrow.Table":
+    """
+    Build an Arrow table with typed columns.
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError("pyarrow is required for output='arrow': pip install pycomptox[arrow]")
+
+    arrow_types = {"str": pa.string(), "int": pa.int64(), "float": pa.float64(), "bool": pa.bool_()}
+    columns, types = to_columns(result, schema)
+    arrays = {}
+    for field, values in columns.items():
+        try:
+            arrays[field] = pa.array(values, type=arrow_types.get(types.get(field)))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays[field] = pa.array([None if value is None else str(value) for value in values], type=pa.string())
+    return pa.table(arrays)
+
+
+def convert(result: Any, output: str, schema: Optional[Schema] = None, name: str = "Record") -> Any:
+    """
+    Convert a decoded response to the requested `output`.
+
+    :param output: 'pandas', 'arrow' or 'records'
+    :param name: Name of the record class for 'records'.
+    """
+    if output == "pandas":
+        return to_pandas(result, schema)
+    if output == "arrow":
+        return to_arrow(result, schema)
+    if output == "records":
+        from .records import to_records
+        return to_records(result, schema, name)
+    raise ValueError(f"Invalid output. Valid values are {', '.join(repr(o) for o in OUTPUTS)}")
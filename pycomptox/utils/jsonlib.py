@@ -0,0 +1,115 @@
+"""
+#### Description:
+    Pluggable JSON backend. Responses are decoded straight from their bytes with orjson or
+    msgspec when one is installed, or with the standard library otherwise.
+
+    The backend is picked on first use; `set_json_backend` selects one explicitly.
+
+#### Example:
+    ```python
+    from pycomptox.utils.jsonlib import json_backend, set_json_backend
+
+    set_json_backend("json")    # always use the standard library
+    print(json_backend())
+    ```
+"""
+from typing import Any, Callable, Optional, Tuple, Union
+import json
+import threading
+
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+_backend: Optional[Tuple[str, Callable[[Union[bytes, str]], Any], Callable[[Any], str]]] = None
+_lock = threading.Lock()
+
+
+def _load(name: str) -> Tuple[str, Callable[[Union[bytes, str]], Any], Callable[[Any], str]]:
+    if name == "orjson":
+        import orjson
+
+        option = orjson.OPT_NON_STR_KEYS
+        return name, orjson.loads, lambda value: orjson.dumps(value, option=option).decode("utf-8")
+
+    if name == "msgspec":
+        import msgspec
+
+        decoder, encoder = msgspec.json.Decoder(), msgspec.json.Encoder()
+
+        def decode(data: Union[bytes, str]) -> Any:
+            try:
+                return decoder.decode(data)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+
+        return name, decode, lambda value: encoder.encode(value).decode("utf-8")
+
+    if name == "json":
+        return name, json.loads, json.dumps
+
+    raise ValueError(f"Invalid JSON backend. Valid values are {', '.join(repr(b) for b in BACKENDS)}")
+
+
+def set_json_backend(name: str = None) -> str:
+    """
+    Select the JSON backend.
+
+    :param name: 'orjson', 'msgspec' or 'json'; None picks the first one installed.
+    :return: The name of the selected backend.
+    """
+    global _backend
+
+    if name is None:
+        for candidate in BACKENDS:
+            try:
+                backend = _load(candidate)
+                break
+            except ImportError:
+                continue
+    else:
+        try:
+            backend = _load(name)
+        except ImportError:
+            raise ImportError(f"{name} is not installed: pip install {name}")
+
+    with _lock:
+        _backend = backend
+    return backend[0]
+
+
+def _current() -> Tuple[str, Callable[[Union[bytes, str]], Any], Callable[[Any], str]]:
+    if _backend is None:
+        set_json_backend()
+    return _backend
+
+
+def json_backend() -> str:
+    """
+    Return the name of the JSON backend in use.
+    """
+    return _current()[0]
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document from bytes or text.
+
+    Documents the fast backends reject but the standard library accepts (e.g., NaN, or
+    integers over 64 bits) are decoded by the standard library.
+
+    :raises ValueError: If the document is not valid JSON.
+    """
+    name, decode, _ = _current()
+    try:
+        return decode(data)
+    except ValueError:
+        if name == "json":
+            raise
+        return json.loads(data)
+
+
+def dumps(value: Any) -> str:
+    """
+    Encode a value as a JSON document.
+    """
+    return _current()[2](value)
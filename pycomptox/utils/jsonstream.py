@@ -0,0 +1,161 @@
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, List
+import codecs
+import json
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+class JSONArrayParser:
+    """
+    Incremental decoder for a JSON array arriving in chunks.
+
+    Bytes are fed as they are received and every complete element is returned as soon as
+    its closing delimiter is seen, so memory is bounded by the largest element rather than
+    the whole array. A document that is not an array is decoded once the input ends and
+    returned as a single element.
+
+    An element that is still incomplete is decoded again only once the buffered text has
+    doubled, so an element spanning many chunks costs linear rather than quadratic time.
+    """
+    def __init__(self, encoding: str = "utf-8"):
+        self._text = codecs.getincrementaldecoder(encoding)()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._parts = []
+        self._pending = 0
+        self._retry_at = 0
+        self._state = "start"
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Add a chunk of the response body and return the elements it completed.
+        """
+        text = self._text.decode(chunk)
+        if text:
+            self._parts.append(text)
+            self._pending += len(text)
+        if self._state == "document" or len(self._buffer) + self._pending < self._retry_at:
+            return []
+        return self._drain(final=False)
+
+    def close(self) -> List[Any]:
+        """
+        Signal the end of the body and return the remaining elements.
+        """
+        self._parts.append(self._text.decode(b"", final=True))
+        items = self._drain(final=True)
+
+        if self._state == "document":
+            items.append(json.loads(self._buffer) if self._buffer.strip() else None)
+        elif self._state not in ("start", "done"):
+            raise ValueError("Incomplete JSON array in response")
+        return items
+
+    def _drain(self, final: bool) -> List[Any]:
+        items = []
+        buffer = self._buffer + "".join(self._parts)
+        self._parts, self._pending = [], 0
+        pos = 0
+
+        while self._state not in ("document", "done"):
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos >= len(buffer):
+                break
+            char = buffer[pos]
+
+            if self._state == "start":
+                if char != "[":
+                    self._state = "document"
+                    break
+                self._state = "first"
+                pos += 1
+            elif self._state in ("first", "comma") and char == "]":
+                self._state = "done"
+                pos += 1
+            elif self._state == "comma":
+                if char != ",":
+                    raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+                self._state = "value"
+                pos += 1
+            elif char in ",]":
+                raise ValueError(f"Expected a value in JSON array, got {char!r}")
+            else:
+                try:
+                    item, end = self._decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if final and e.pos < len(buffer):
+                        raise ValueError(f"Invalid element in JSON array: {e}") from None
+                    # The element is not complete yet
+                    self._retry_at = 2 * (len(buffer) - pos)
+                    break
+                if not final and (end == len(buffer) or buffer[end] not in _DELIMITERS):
+                    # A number cut by the chunk boundary ("12" of "12.5") decodes early
+                    break
+                items.append(item)
+                self._retry_at = 0
+                self._state = "comma"
+                pos = end
+
+        if self._state == "done":
+            if buffer[pos:].strip(_WHITESPACE):
+                raise ValueError("Unexpected data after the end of the JSON array")
+            pos = len(buffer)
+        self._buffer = buffer[pos:]
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Yield the elements of a JSON array read from an iterable of byte chunks.
+    """
+    parser = JSONArrayParser(encoding)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+class ClosingIterator:
+    """
+    Iterator over streamed records that runs `release` once, when it is exhausted, closed or
+    garbage collected, even if iteration never started.
+    """
+    def __init__(self, records: Iterator[Any], release: Callable[[], None]):
+        self._records = records
+        self._release = release
+
+    def __iter__(self) -> "ClosingIterator":
+        return self
+
+    def __next__(self) -> Any:
+        return next(self._records)
+
+    def close(self) -> None:
+        self._records.close()
+        self._release()
+
+    def __del__(self):
+        self.close()
+
+
+class AsyncClosingIterator:
+    """
+    Async counterpart of `ClosingIterator`; `release` must not block.
+    """
+    def __init__(self, records: AsyncIterator[Any], release: Callable[[], None]):
+        self._records = records
+        self._release = release
+
+    def __aiter__(self) -> "AsyncClosingIterator":
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self._records.__anext__()
+
+    async def aclose(self) -> None:
+        await self._records.aclose()
+        self._release()
+
+    def __del__(self):
+        self._release()
@@ -0,0 +1,167 @@
+"""
+#### Description:
+    Compact record classes for high-volume results, returned with `output="records"`.
+
+    A record stores its values in `__slots__` instead of a per-record dict, and the values of
+    categorical fields (sources, units, property types, endpoint names, ...) are interned so
+    the millions of records sharing them hold one copy of each string. Records read like the
+    decoded dicts: `record.dtxsid`, `record["dtxsid"]`, `record.get("unit")`, `record.as_dict()`.
+
+#### Example:
+    ```python
+    hits = ChemProperties(api_key=api_key).get_properties_batch(dtxsid_list=dtxsids, output="records")
+    print(type(hits[0]).__name__, hits[0].name, hits[0].value, hits[0].unit)
+    ```
+"""
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import keyword
+import sys
+import threading
+
+
+Schema = List[Tuple[str, str]]
+
+# Fields with few distinct string values, interned when records are built
+INTERNED_FIELDS = frozenset({
+    "source", "subsource", "unit", "units", "propType", "propertyId", "name", "valueType", "modelSource",
+    "endpointName", "toxvalType", "toxvalSubtype", "toxvalUnits", "toxvalNumericQualifier", "riskAssessmentClass",
+    "exposureRoute", "exposureMethod", "exposureForm", "studyType", "studyDurationClass", "studyDurationUnits",
+    "supercategory", "speciesCommon", "species", "strain", "sex", "lifestage", "generation", "media",
+    "population", "humanEcoNt", "searchName", "assayCategory", "assayResult", "assayType", "metabolicActivation",
+    "model", "parameter", "dataVersion", "demographic", "predictor", "datatype", "reportedfunction",
+    "functioncategory",
+})
+
+_types: Dict[Tuple[str, Tuple[str, ...]], type] = {}
+_lock = threading.Lock()
+
+
+def _slot(index: int, field: str) -> str:
+    # Field names that cannot be slot names (e.g., 'first-name' or 'keys') are stored under a positional slot
+    if field.isidentifier() and not field.startswith("_") and not keyword.iskeyword(field) and not hasattr(Record, field):
+        return field
+    return f"_{index}"
+
+
+class Record:
+    """
+    Base class of the record classes built by `record_type`.
+    """
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+    _slots: Tuple[str, ...] = ()
+
+    def __getitem__(self, field: str) -> Any:
+        try:
+            return getattr(self, self._slots[self._fields.index(field)])
+        except ValueError:
+            raise KeyError(field) from None
+
+    def get(self, field: str, default: Any = None) -> Any:
+        try:
+            return self[field]
+        except KeyError:
+            return default
+
+    def __contains__(self, field: str) -> bool:
+        return field in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def keys(self) -> Tuple[str, ...]:
+        return self._fields
+
+    def values(self) -> List[Any]:
+        return [getattr(self, slot) for slot in self._slots]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return list(zip(self._fields, self.values()))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Return the record as a dict, fields without a value included as None.
+        """
+        return dict(self.items())
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Record):
+            return self._fields == other._fields and self.values() == other.values()
+        if isinstance(other, dict):
+            # Equal to the decoded dict it was built from
+            return other.keys() <= set(self._fields) and all(other.get(field) == value for field, value in self.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({', '.join(f'{field}={value!r}' for field, value in self.items())})"
+
+    def __reduce__(self):
+        return _rebuild, (type(self).__name__, self._fields, tuple(self.values()))
+
+
+def _rebuild(name: str, fields: Tuple[str, ...], values: Tuple[Any, ...]) -> Record:
+    cls = record_type(name, fields)
+    record = Record.__new__(cls)
+    for slot, value in zip(cls._slots, values):
+        setattr(record, slot, value)
+    return record
+
+
+def record_type(name: str, fields: Tuple[str, ...]) -> type:
+    """
+    Return the record class with these fields, created on first use.
+    """
+    key = (name, tuple(fields))
+    cls = _types.get(key)
+    if cls is None:
+        with _lock:
+            cls = _types.get(key)
+            if cls is None:
+                slots = tuple(_slot(index, field) for index, field in enumerate(key[1]))
+                cls = type(name, (Record,), {"__slots__": slots, "_fields": key[1], "_slots": slots,
+                                             "__module__": __name__})
+                _types[key] = cls
+    return cls
+
+
+def to_records(result: Any, schema: Optional[Schema] = None, name: str = "Record") -> Any:
+    """
+    Convert decoded records to record objects.
+
+    Schema fields come first, then the other fields of the response in order of appearance;
+    all records of a response share one class. A single object gives a single record, and
+    responses that are not lists of objects (e.g., lists of DTXSIDs) are returned unchanged.
+
+    :param name: Name of the record class, e.g. 'PropertyRecord'.
+    """
+    if isinstance(result, dict):
+        return to_records([result], schema, name)[0]
+    if not isinstance(result, list) or not all(isinstance(record, dict) for record in result):
+        return result
+
+    fields = dict.fromkeys(field for field, _ in schema or [])
+    for record in result:
+        if not fields.keys() >= record.keys():
+            fields.update(dict.fromkeys(record))
+
+    cls = record_type(name, tuple(fields))
+    members = [(cls.__dict__[slot].__set__, field, field in INTERNED_FIELDS)
+               for slot, field in zip(cls._slots, cls._fields)]
+    intern, new = sys.intern, Record.__new__
+
+    records = []
+    for record in result:
+        obj = new(cls)
+        get = record.get
+        for set_, field, interned in members:
+            value = get(field)
+            if interned and type(value) is str:
+                value = intern(value)
+            set_(obj, value)
+        records.append(obj)
+    return records
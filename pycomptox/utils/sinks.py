@@ -0,0 +1,247 @@
+"""
+#### Description:
+    Incremental result sinks writing records to JSON Lines, CSV or Parquet files.
+
+    Records are buffered and written every `flush_rows` rows, so memory stays constant whatever
+    the number of rows. Full buffers are written by a background thread while the next buffer
+    fills, overlapping disk I/O with network I/O; at most one buffer waits to be written.
+    pyarrow is required by `ParquetSink` only and is imported on first use.
+
+#### Example:
+    ```python
+    with ParquetSink("properties.parquet", endpoint="chemical/property/search/by-dtxsid/") as sink:
+        sink.write_all(client.iter_properties_batch(dtxsids))
+
+    with CSVSink("assay.csv") as sink:
+        sink.write_all(client.get_data(search_by="aeid", search_for=1386, stream=True))
+
+    with JSONLSink("httk.jsonl") as sink:
+        sink.write_mapping(httk.get_httk_data(dtxsid=dtxsids))
+    ```
+"""
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import csv
+import json
+from ..core.schemas import schema_for
+from .records import Record
+
+
+Schema = List[Tuple[str, str]]
+
+
+class Sink(ABC):
+    """
+    Base class of the sinks: buffers records and hands full buffers to `_write_rows`.
+    """
+    def __init__(self, path: str, flush_rows: int = 10_000, schema: Optional[Schema] = None, endpoint: str = None):
+        """
+        :param path: File to write.
+        :param flush_rows: Rows buffered before they are written.
+        :param schema: Typed fields of the records, e.g. from `pycomptox.core.schemas`.
+        :param endpoint: Endpoint whose schema to use when `schema` is not given.
+        """
+        if flush_rows < 1:
+            raise ValueError("flush_rows must be at least 1")
+
+        self.path = path
+        self.flush_rows = flush_rows
+        self.schema = schema if schema is not None else (schema_for(endpoint) if endpoint else None)
+        self.rows = 0
+        self._buffer: List[Any] = []
+        self._writer = ThreadPoolExecutor(max_workers=1)
+        self._pending: Optional[Future] = None
+        self._closed = False
+
+    def write(self, record: Any) -> None:
+        """
+        Add one record.
+        """
+        if isinstance(record, Record):
+            record = record.as_dict()
+        self._buffer.append(record)
+        self.rows += 1
+        if len(self._buffer) >= self.flush_rows:
+            self._submit()
+
+    def write_all(self, records: Iterable[Any]) -> None:
+        """
+        Add every record of an iterable: a batch response, a streamed response or an `iter_*` batch.
+        """
+        if records is None:
+            return
+        if isinstance(records, dict):
+            records = [records]
+        for record in records:
+            self.write(record)
+
+    def write_mapping(self, result: Dict[Any, Any]) -> None:
+        """
+        Add the records of a fan-out result, a mapping of ID to its response.
+        """
+        for value in result.values():
+            self.write_all(value)
+
+    def _submit(self) -> None:
+        # Keep at most one buffer waiting for the writer thread
+        self._wait()
+        rows, self._buffer = self._buffer, []
+        self._pending = self._writer.submit(self._write_rows, rows)
+
+    def _wait(self) -> None:
+        if self._pending is not None:
+            self._pending.result()
+            self._pending = None
+
+    def flush(self) -> None:
+        """
+        Write the buffered records and wait until they are written.
+        """
+        if self._buffer:
+            self._submit()
+        self._wait()
+
+    def close(self) -> None:
+        """
+        Flush and close the file.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self.flush()
+        finally:
+            self._writer.shutdown()
+            self._close()
+
+    @abstractmethod
+    def _write_rows(self, rows: List[Any]) -> None:
+        """
+        Write a buffer of records, on the writer thread.
+        """
+
+    def _close(self) -> None:
+        pass
+
+    def __enter__(self) -> "Sink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class JSONLSink(Sink):
+    """
+    Append-only JSON Lines file, one record per line.
+    """
+    def __init__(self, path: str, flush_rows: int = 1000, **kwargs):
+        super().__init__(path, flush_rows=flush_rows, **kwargs)
+        self._file = open(path, "a", encoding="utf-8")
+
+    def _write_rows(self, rows: List[Any]) -> None:
+        self._file.write("".join(json.dumps(row) + "\n" for row in rows))
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class CSVSink(Sink):
+    """
+    CSV file with a stable header: the schema fields first, then the other fields of the first
+    buffer written. Fields appearing later are ignored; nested values are written as JSON.
+    """
+    def __init__(self, path: str, flush_rows: int = 10_000, **kwargs):
+        super().__init__(path, flush_rows=flush_rows, **kwargs)
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._csv = None
+        self.fields: Optional[List[str]] = None
+
+    def _write_rows(self, rows: List[Any]) -> None:
+        rows = [row if isinstance(row, dict) else {"value": row} for row in rows]
+        if self._csv is None:
+            fields = dict.fromkeys(field for field, _ in self.schema or [])
+            for row in rows:
+                fields.update(dict.fromkeys(row))
+            self.fields = list(fields)
+            self._csv = csv.DictWriter(self._file, fieldnames=self.fields, extrasaction="ignore")
+            self._csv.writeheader()
+
+        for row in rows:
+            self._csv.writerow({
+                field: json.dumps(value) if isinstance(value, (dict, list)) else value
+                for field, value in row.items()
+            })
+        self._file.flush()
+
+    def _close(self) -> None:
+        self._file.close()
+
+
+class ParquetSink(Sink):
+    """
+    Parquet file written one row group per `flush_rows` records.
+
+    The file schema is the endpoint schema, extended with the other fields of the first row
+    group as inferred by Arrow; columns with no value in that group are strings. Fields
+    appearing later are ignored and values that do not fit their column type are written as
+    nulls, or as JSON in string columns.
+    """
+    def __init__(self, path: str, flush_rows: int = 100_000, compression: str = "snappy", **kwargs):
+        super().__init__(path, flush_rows=flush_rows, **kwargs)
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ImportError("pyarrow is required for ParquetSink: pip install pycomptox[arrow]")
+
+        self.compression = compression
+        self._parquet = None
+        self.arrow_schema = None
+
+    def _table(self, rows: List[Any]):
+        import pyarrow as pa
+        from .frames import to_arrow, to_columns
+
+        if self.arrow_schema is None:
+            inferred = to_arrow(rows, self.schema).schema
+            self.arrow_schema = pa.schema([
+                pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field for field in inferred
+            ])
+
+        columns, _ = to_columns(rows, self.schema)
+        arrays = []
+        for field in self.arrow_schema:
+            values = columns.get(field.name, [None] * len(rows))
+            try:
+                arrays.append(pa.array(values, type=field.type))
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                arrays.append(pa.array([self._coerce(value, field.type) for value in values], type=field.type))
+        return pa.Table.from_arrays(arrays, schema=self.arrow_schema)
+
+    def _coerce(self, value: Any, type_) -> Any:
+        import pyarrow as pa
+
+        if value is None:
+            return None
+        if pa.types.is_string(type_):
+            return value if isinstance(value, str) else json.dumps(value)
+        try:
+            return pa.scalar(value, type=type_).as_py()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, TypeError, ValueError):
+            return None
+
+    def _write_rows(self, rows: List[Any]) -> None:
+        import pyarrow.parquet as pq
+
+        table = self._table(rows)
+        if self._parquet is None:
+            self._parquet = pq.ParquetWriter(self.path, table.schema, compression=self.compression)
+        self._parquet.write_table(table)
+
+    def _close(self) -> None:
+        if self._parquet is None and self.arrow_schema is None and self.schema:
+            # No rows: still write a file with the expected columns
+            self._write_rows([])
+        if self._parquet is not None:
+            self._parquet.close()
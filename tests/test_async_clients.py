@@ -0,0 +1,172 @@
+import asyncio
+import unittest
+from pycomptox.utils.exceptions import APIRequestError
+
+try:
+    import aiohttp
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+except ImportError:
+    web = None
+
+if web is not None:
+    from pycomptox.apis.aio import AsyncBioActivityAssay, AsyncChemSearch, AsyncHazard
+    from pycomptox.core.async_client import AsyncTransport
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class TestAsyncClients(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "test-api-key"
+
+    async def _serve(self, routes):
+        app = web.Application()
+        app.add_routes(routes)
+        server = TestServer(app)
+        await server.start_server()
+        return server
+
+    def test_get_and_post_share_pool(self):
+        seen = []
+
+        async def search(request):
+            seen.append((request.method, request.path, request.headers["x-api-key"]))
+            return web.json_response([{"dtxsid": request.match_info["word"]}])
+
+        async def hazard_batch(request):
+            body = await request.json()
+            seen.append((request.method, request.path, body))
+            return web.json_response([{"dtxsid": d} for d in body])
+
+        async def run():
+            server = await self._serve([
+                web.get("/chemical/search/equal/{word}", search),
+                web.post("/hazard/search/by-dtxsid/", hazard_batch),
+            ])
+            transport = AsyncTransport()
+            search_client = AsyncChemSearch(api_key=self.api_key, transport=transport)
+            hazard_client = AsyncHazard(api_key=self.api_key, transport=transport)
+            for client in (search_client, hazard_client):
+                client.base_url = str(server.make_url("")).rstrip("/")
+            try:
+                results = await asyncio.gather(
+                    search_client.get_chemical(op="equal", word="DTXSID7020182"),
+                    hazard_client.get_hazard_batch(type="all", dtxsid_list=["DTXSID1", "DTXSID2"]),
+                )
+                self.assertIs(transport.session(), transport.session())
+            finally:
+                await transport.close()
+                await server.close()
+            return results
+
+        found, hazards = asyncio.run(run())
+        self.assertEqual(found, [{"dtxsid": "DTXSID7020182"}])
+        self.assertEqual(hazards, [{"dtxsid": "DTXSID1"}, {"dtxsid": "DTXSID2"}])
+        self.assertIn(("GET", "/chemical/search/equal/DTXSID7020182", self.api_key), seen)
+
+    def test_identical_requests_are_coalesced(self):
+        calls = []
+
+        async def search(request):
+            calls.append(request.path)
+            await asyncio.sleep(0.05)
+            return web.json_response([{"dtxsid": request.match_info["word"]}])
+
+        async def run():
+            server = await self._serve([web.get("/chemical/search/equal/{word}", search)])
+            transport = AsyncTransport()
+            client = AsyncChemSearch(api_key=self.api_key, transport=transport)
+            client.base_url = str(server.make_url("")).rstrip("/")
+            try:
+                results = await asyncio.gather(*[client.get_chemical(op="equal", word="DTXSID7020182") for _ in range(5)])
+                # Opting out per request
+                await asyncio.gather(*[client.get_chemical(op="equal", word="DTXSID7020182", coalesce=False)
+                                       for _ in range(3)])
+                return results
+            finally:
+                await transport.close()
+                await server.close()
+
+        results = asyncio.run(run())
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(results, [[{"dtxsid": "DTXSID7020182"}]] * 5)
+        self.assertEqual(len({id(result) for result in results}), 5)
+
+    def test_sessions_are_closed_with_their_loop(self):
+        transport = AsyncTransport()
+
+        async def use():
+            return transport.session()
+
+        sessions = [asyncio.run(use()), asyncio.run(use())]
+        self.assertIsNot(sessions[0], sessions[1])
+        self.assertTrue(all(session.closed for session in sessions))
+        self.assertEqual(len(transport._sessions), 0)
+
+    def test_timeouts_raise_api_request_errors(self):
+        async def slow(request):
+            await asyncio.sleep(1)
+            return web.json_response([])
+
+        async def run():
+            server = await self._serve([web.get("/chemical/search/equal/{word}", slow)])
+            transport = AsyncTransport()
+            client = AsyncChemSearch(api_key=self.api_key, transport=transport)
+            client.base_url = str(server.make_url("")).rstrip("/")
+            try:
+                await client.get_chemical(op="equal", word="DTXSID7020182", timeout=aiohttp.ClientTimeout(total=0.05))
+            finally:
+                await transport.close()
+                await server.close()
+
+        with self.assertRaises(APIRequestError) as ctx:
+            asyncio.run(run())
+        self.assertIn("TimeoutError", str(ctx.exception))
+
+    def test_validation_is_eager(self):
+        client = AsyncChemSearch(api_key=self.api_key, transport=AsyncTransport())
+        with self.assertRaises(ValueError):
+            client.get_chemical(op="bogus", word="x")
+
+    def test_iter_hazard_batch_streams_chunks(self):
+        async def hazard_batch(request):
+            body = await request.json()
+            return web.json_response([{"dtxsid": d} for d in body])
+
+        async def run():
+            server = await self._serve([web.post("/hazard/search/by-dtxsid/", hazard_batch)])
+            transport = AsyncTransport()
+            client = AsyncHazard(api_key=self.api_key, transport=transport, memo_cache=None)
+            client.base_url = str(server.make_url("")).rstrip("/")
+            try:
+                ids = (f"DTXSID{i}" for i in range(450))
+                return [record["dtxsid"] async for record in client.iter_hazard_batch(type="all", dtxsids=ids, window=2)]
+            finally:
+                await transport.close()
+                await server.close()
+
+        self.assertEqual(asyncio.run(run()), [f"DTXSID{i}" for i in range(450)])
+
+    def test_unstarted_stream_releases_the_connection(self):
+        events = []
+
+        async def assays(request):
+            return web.json_response([{"aeid": 1}, {"aeid": 2}])
+
+        async def run():
+            server = await self._serve([web.get("/bioactivity/assay/", assays)])
+            transport = AsyncTransport()
+            client = AsyncBioActivityAssay(api_key=self.api_key, transport=transport, hooks=[events.append])
+            client.base_url = str(server.make_url("")).rstrip("/")
+            try:
+                records = await client.get_assay(stream=True)
+                del records
+                self.assertEqual(len(events), 1)
+                records = await client.get_assay(stream=True)
+                return [record async for record in records]
+            finally:
+                await transport.close()
+                await server.close()
+
+        self.assertEqual(asyncio.run(run()), [{"aeid": 1}, {"aeid": 2}])
+        self.assertEqual(len(events), 2)
@@ -0,0 +1,329 @@
+import io
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+import requests
+from pycomptox.apis.chem_search import ChemProperties, ChemSearch
+from pycomptox.apis.hazard import Hazard
+from pycomptox.apis.exposure import Httk
+from pycomptox.apis.bioactivity import BioActivityAssay
+from pycomptox.core.config import Config
+from pycomptox.core.singleflight import SingleFlight
+from pycomptox.core.throttle import RetryPolicy, TokenBucket
+from pycomptox.core.transport import Transport
+from pycomptox.utils.exceptions import APIRequestError
+from pycomptox.utils.jsonstream import JSONArrayParser
+
+
+class TestTransport(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "test-api-key"
+
+    def test_clients_share_default_transport(self):
+        search = ChemSearch(api_key=self.api_key)
+        hazard = Hazard(api_key=self.api_key)
+        self.assertIs(search.transport, hazard.transport)
+
+    def test_default_transport_follows_config_pool_size(self):
+        config = Config(api_key=self.api_key, base_url="https://api-ccte.epa.gov", pool_maxsize=32)
+        search = ChemSearch(api_key=self.api_key)
+        sized = [ChemSearch(api_key=self.api_key, config=config), Hazard(api_key=self.api_key, config=config)]
+
+        self.assertIsNot(sized[0].transport, search.transport)
+        self.assertIs(sized[0].transport, sized[1].transport)
+        self.assertEqual(sized[0].transport.pool_maxsize, 32)
+
+    def test_pool_size_per_host(self):
+        transport = Transport(pool_connections=2, pool_maxsize=32)
+        adapter = transport.session.get_adapter("https://api-ccte.epa.gov")
+        self.assertEqual(adapter._pool_maxsize, 32)
+        self.assertEqual(adapter._pool_connections, 2)
+
+    def test_request_goes_through_session(self):
+        transport = Transport()
+        client = ChemSearch(api_key=self.api_key, transport=transport)
+        mock_response = MagicMock()
+        mock_response.content = json.dumps([{"dtxsid": "DTXSID7020182"}]).encode()
+
+        with patch.object(transport.session, "request", return_value=mock_response) as mock_request:
+            response = client.get_chemical(op="equal", word="DTXSID7020182")
+
+        mock_request.assert_called_once()
+        args, kwargs = mock_request.call_args
+        self.assertEqual(args, ("GET", "https://api-ccte.epa.gov/chemical/search/equal/DTXSID7020182"))
+        self.assertEqual(kwargs["headers"]["x-api-key"], self.api_key)
+        self.assertEqual(response, [{"dtxsid": "DTXSID7020182"}])
+
+
+class TestBatching(unittest.TestCase):
+    def setUp(self):
+        self.api_key = "test-api-key"
+        self.transport = Transport()
+
+    def _echo(self, method, url, headers=None, data=None, **kwargs):
+        values = kwargs["json"] if kwargs.get("json") is not None else data.split("\n")
+        response = MagicMock()
+        response.content = json.dumps([{"dtxsid": value} for value in values]).encode()
+        return response
+
+    def test_hazard_batch_is_chunked_and_merged(self):
+        client = Hazard(api_key=self.api_key, transport=self.transport, max_workers=3)
+        dtxsids = [f"DTXSID{i}" for i in range(450)]
+
+        with patch.object(self.transport.session, "request", side_effect=self._echo) as mock_request:
+            response = client.get_hazard_batch(type="all", dtxsid_list=dtxsids)
+
+        self.assertEqual(mock_request.call_count, 3)
+        sizes = sorted(len(call.kwargs["json"]) for call in mock_request.call_args_list)
+        self.assertEqual(sizes, [50, 200, 200])
+        self.assertEqual([record["dtxsid"] for record in response], dtxsids)
+
+    def test_search_batch_sends_text_chunks(self):
+        client = ChemSearch(api_key=self.api_key, transport=self.transport)
+        values = [f"DTXCID{i}" for i in range(201)]
+
+        with patch.object(self.transport.session, "request", side_effect=self._echo) as mock_request:
+            response = client.by_batch(data_list=values)
+
+        self.assertEqual(mock_request.call_count, 2)
+        for call in mock_request.call_args_list:
+            self.assertEqual(call.kwargs["headers"]["Content-Type"], "text/plain")
+        self.assertEqual([record["dtxsid"] for record in response], values)
+
+    def test_httk_fan_out_returns_mapping(self):
+        client = Httk(api_key=self.api_key, transport=self.transport)
+
+        def by_dtxsid(method, url, **kwargs):
+            response = MagicMock()
+            response.content = json.dumps([{"dtxsid": url.rsplit("/", 1)[-1]}]).encode()
+            return response
+
+        dtxsids = ["DTXSID1", "DTXSID2", "DTXSID3", "DTXSID1"]
+        with patch.object(self.transport.session, "request", side_effect=by_dtxsid) as mock_request:
+            response = client.get_httk_data(dtxsid=dtxsids, max_workers=2)
+
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(list(response), ["DTXSID1", "DTXSID2", "DTXSID3"])
+        self.assertEqual(response["DTXSID2"], [{"dtxsid": "DTXSID2"}])
+
+    def test_fan_out_can_return_per_id_errors(self):
+        client = Httk(api_key=self.api_key, transport=self.transport, memo_cache=None)
+
+        def by_dtxsid(method, url, **kwargs):
+            dtxsid = url.rsplit("/", 1)[-1]
+            response = requests.Response()
+            response.status_code = 404 if dtxsid == "BAD" else 200
+            response._content = json.dumps([{"dtxsid": dtxsid}]).encode()
+            return response
+
+        with patch.object(self.transport.session, "request", side_effect=by_dtxsid):
+            with self.assertRaises(APIRequestError):
+                client.get_httk_data(dtxsid=["DTXSID1", "BAD", "DTXSID2"])
+            response = client.get_httk_data(dtxsid=["DTXSID1", "BAD", "DTXSID2"], return_exceptions=True)
+
+        self.assertEqual(response["DTXSID1"], [{"dtxsid": "DTXSID1"}])
+        self.assertEqual(response["DTXSID2"], [{"dtxsid": "DTXSID2"}])
+        self.assertIsInstance(response["BAD"], APIRequestError)
+        self.assertEqual(response["BAD"].status_code, 404)
+
+
+    def test_iter_hazard_batch_streams_with_bounded_window(self):
+        client = Hazard(api_key=self.api_key, transport=self.transport, memo_cache=None)
+        lock = threading.Lock()
+        in_flight, peak = [0], [0]
+        consumed = []
+
+        def ids():
+            for i in range(1000):
+                consumed.append(i)
+                yield f"DTXSID{i}\n"
+
+        def slow_echo(*args, **kwargs):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return self._echo(*args, **kwargs)
+
+        with patch.object(self.transport.session, "request", side_effect=slow_echo) as mock_request:
+            records = client.iter_hazard_batch(type="all", dtxsids=ids(), window=2)
+            first = next(records)
+            self.assertLess(len(consumed), 1000)
+            rest = list(records)
+
+        self.assertEqual(mock_request.call_count, 5)
+        self.assertLessEqual(peak[0], 2)
+        self.assertEqual([first["dtxsid"]] + [record["dtxsid"] for record in rest], [f"DTXSID{i}" for i in range(1000)])
+
+    def test_iter_properties_batch_reads_file_handles(self):
+        client = ChemProperties(api_key=self.api_key, transport=self.transport)
+
+        with patch.object(self.transport.session, "request", side_effect=self._echo):
+            records = list(client.iter_properties_batch(io.StringIO("DTXSID1\n\nDTXSID2\n")))
+
+        self.assertEqual(records, [{"dtxsid": "DTXSID1"}, {"dtxsid": "DTXSID2"}])
+
+
+class TestRetries(unittest.TestCase):
+    def setUp(self):
+        self.transport = Transport()
+
+    def _response(self, status_code, headers=None, body=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        response.content = json.dumps(body).encode()
+        return response
+
+    @patch("pycomptox.core.base_client.time.sleep")
+    def test_retries_429_honouring_retry_after(self, mock_sleep):
+        client = ChemSearch(api_key="test-api-key", transport=self.transport, retry=RetryPolicy(max_retries=3))
+        responses = [self._response(429, {"Retry-After": "2"}), self._response(503), self._response(200, body=["ok"])]
+
+        with patch.object(self.transport.session, "request", side_effect=responses) as mock_request:
+            response = client.get_chemical(op="equal", word="DTXSID7020182")
+
+        self.assertEqual(response, ["ok"])
+        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(mock_sleep.call_args_list[0].args, (2.0,))
+        self.assertLessEqual(mock_sleep.call_args_list[1].args[0], 1.0)
+
+    @patch("pycomptox.core.base_client.time.sleep")
+    def test_gives_up_after_max_retries(self, mock_sleep):
+        client = ChemSearch(api_key="test-api-key", transport=self.transport, retry=RetryPolicy(max_retries=1))
+        failed = self._response(500)
+        failed.raise_for_status.side_effect = requests.exceptions.HTTPError("500 Server Error", response=failed)
+
+        with patch.object(self.transport.session, "request", return_value=failed) as mock_request:
+            with self.assertRaises(APIRequestError) as ctx:
+                client.get_chemical(op="equal", word="DTXSID7020182")
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(ctx.exception.status_code, 500)
+
+    @patch("pycomptox.core.base_client.time.sleep")
+    def test_long_retry_after_fails_immediately(self, mock_sleep):
+        client = ChemSearch(api_key="test-api-key", transport=self.transport,
+                            retry=RetryPolicy(max_retries=3, max_retry_after=60))
+        throttled = self._response(429, {"Retry-After": "3600"})
+
+        with patch.object(self.transport.session, "request", return_value=throttled) as mock_request:
+            with self.assertRaises(APIRequestError) as ctx:
+                client.get_chemical(op="equal", word="DTXSID7020182")
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(ctx.exception.status_code, 429)
+        mock_sleep.assert_not_called()
+        self.assertEqual(RetryPolicy(max_retry_after=60).delay(0, "60"), 60.0)
+
+    def test_token_bucket_spaces_requests(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        delays = [bucket.reserve() for _ in range(4)]
+        self.assertEqual(delays[:2], [0.0, 0.0])
+        self.assertAlmostEqual(delays[2], 0.1, places=2)
+        self.assertAlmostEqual(delays[3], 0.2, places=2)
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_identical_concurrent_requests_share_one_call(self):
+        transport = Transport()
+        client = ChemSearch(api_key="test-api-key", transport=transport)
+        release = threading.Event()
+
+        def slow_response(method, url, **kwargs):
+            release.wait(5)
+            response = MagicMock()
+            response.content = json.dumps([{"dtxsid": "DTXSID7020182"}]).encode()
+            return response
+
+        with patch.object(transport.session, "request", side_effect=slow_response) as mock_request:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                futures = [pool.submit(client.get_chemical, op="equal", word="DTXSID7020182") for _ in range(8)]
+                time.sleep(0.1)
+                release.set()
+                results = [future.result() for future in futures]
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertTrue(all(result == [{"dtxsid": "DTXSID7020182"}] for result in results))
+        # Each waiter gets its own copy of the shared response
+        self.assertEqual(len({id(result) for result in results}), 8)
+        results[0][0]["dtxsid"] = "mutated"
+        self.assertEqual(results[1], [{"dtxsid": "DTXSID7020182"}])
+
+    def test_errors_propagate_to_waiters(self):
+        flight = SingleFlight()
+        with self.assertRaises(ValueError):
+            flight.do("key", lambda: (_ for _ in ()).throw(ValueError("boom")))
+        self.assertEqual(flight.do("key", lambda: 1), 1)
+
+
+class TestStreaming(unittest.TestCase):
+    def test_stream_yields_records_across_chunk_boundaries(self):
+        transport = Transport()
+        client = BioActivityAssay(api_key="test-api-key", transport=transport)
+        body = json.dumps([{"aeid": i, "assayComponentEndpointName": f"assay {i}"} for i in range(50)] + [12.5]).encode()
+        response = MagicMock()
+        response.status_code = 200
+        response.iter_content.return_value = [body[i:i + 7] for i in range(0, len(body), 7)]
+
+        with patch.object(transport.session, "request", return_value=response) as mock_request:
+            records = client.get_assay(stream=True)
+            self.assertTrue(mock_request.call_args.kwargs["stream"])
+            self.assertEqual(next(records), {"aeid": 0, "assayComponentEndpointName": "assay 0"})
+            rest = list(records)
+
+        self.assertEqual(len(rest), 50)
+        self.assertEqual(rest[-1], 12.5)
+        response.close.assert_called_once()
+
+    def test_large_elements_are_not_decoded_once_per_chunk(self):
+        element = {"dtxsid": "DTXSID1", "values": ["x" * 100] * 10000}
+        body = json.dumps([element, 2.5, {"dtxsid": "DTXSID2"}]).encode()
+        parser = JSONArrayParser()
+        items = []
+
+        with patch.object(parser._decoder, "raw_decode", wraps=parser._decoder.raw_decode) as raw_decode:
+            for i in range(0, len(body), 1024):
+                items += parser.feed(body[i:i + 1024])
+            items += parser.close()
+
+        self.assertEqual(items, [element, 2.5, {"dtxsid": "DTXSID2"}])
+        # About 1000 chunks, but each retry waits for the buffer to double
+        self.assertLess(raw_decode.call_count, 20)
+
+    def test_unstarted_stream_releases_the_response(self):
+        events = []
+        transport = Transport()
+        client = BioActivityAssay(api_key="test-api-key", transport=transport, hooks=[events.append])
+        response = MagicMock()
+        response.status_code = 200
+        response.iter_content.return_value = [b"[1, 2]"]
+
+        with patch.object(transport.session, "request", return_value=response):
+            records = client.get_assay(stream=True)
+            del records
+
+        response.close.assert_called_once()
+        self.assertEqual(len(events), 1)
+
+        with patch.object(transport.session, "request", return_value=response):
+            records = client.get_assay(stream=True)
+            self.assertEqual(list(records), [1, 2])
+            records.close()
+        self.assertEqual(response.close.call_count, 2)
+        self.assertEqual(len(events), 2)
+
+    def test_malformed_arrays_are_rejected(self):
+        for body in (b"[1,]", b"[,1]", b"[1] [2]", b'[{"a": }]', b"[1"):
+            with self.subTest(body=body):
+                parser = JSONArrayParser()
+                with self.assertRaises(ValueError):
+                    parser.feed(body[:2])
+                    parser.feed(body[2:])
+                    parser.close()
+        self.assertEqual(JSONArrayParser().feed(b"[1] \n"), [1])
@@ -0,0 +1,166 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+from pycomptox.apis.chem_search import ChemSearch, ChemList
+from pycomptox.apis.hazard import Hazard
+from pycomptox.core.cache import DiskCache, MemoryCache, catalogue_cache, make_cache_key
+from pycomptox.core.transport import Transport
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "cache.sqlite3")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_key_depends_on_body_and_params(self):
+        base = make_cache_key("POST", "hazard/search/by-dtxsid/", None, ["DTXSID1"])
+        self.assertNotEqual(base, make_cache_key("POST", "hazard/search/by-dtxsid/", None, ["DTXSID2"]))
+        self.assertNotEqual(base, make_cache_key("POST", "hazard/search/by-dtxsid/", {"projection": "x"}, ["DTXSID1"]))
+        self.assertEqual(make_cache_key("GET", "a", {"x": 1, "y": 2}), make_cache_key("GET", "a", {"y": 2, "x": 1}))
+
+    def test_per_endpoint_ttl(self):
+        cache = DiskCache(self.path, ttls={"chemical/search/*": 0, "hazard/*": 0.05}, default_ttl=None)
+        cache.set("a", [1], "chemical/search/equal/x")
+        cache.set("b", [2], "hazard/search/by-dtxsid/x")
+        cache.set("c", [3], "exposure/httk/search/by-dtxsid/x")
+
+        self.assertEqual(cache.get("a"), (False, None))
+        self.assertEqual(cache.get("b"), (True, [2]))
+        time.sleep(0.06)
+        self.assertEqual(cache.get("b"), (False, None))
+        self.assertEqual(cache.get("c"), (True, [3]))
+
+    def test_lru_eviction(self):
+        cache = DiskCache(self.path, max_entries=2)
+        cache.set("a", 1, "x")
+        cache.set("b", 2, "x")
+        cache.get("a")
+        cache.set("c", 3, "x")
+        cache.evict()
+        self.assertEqual(len(cache), 2)
+        self.assertFalse(cache.get("b")[0])
+        self.assertTrue(cache.get("a")[0])
+
+    def test_client_serves_repeat_requests_from_cache(self):
+        transport = Transport()
+        cache = DiskCache(self.path)
+        client = ChemSearch(api_key="test-api-key", transport=transport, cache=cache)
+        mock_response = MagicMock()
+        mock_response.content = json.dumps([{"dtxsid": "DTXSID7020182"}]).encode()
+
+        with patch.object(transport.session, "request", return_value=mock_response) as mock_request:
+            first = client.get_chemical(op="equal", word="DTXSID7020182")
+            second = ChemSearch(api_key="test-api-key", transport=transport, cache=DiskCache(self.path)).get_chemical(
+                op="equal", word="DTXSID7020182")
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(first, second)
+
+    def test_batch_only_requests_cache_misses(self):
+        transport = Transport()
+        client = Hazard(api_key="test-api-key", transport=transport, cache=DiskCache(self.path))
+
+        def hazard_records(method, url, headers=None, **kwargs):
+            response = MagicMock()
+            # DTXSID0 has no hazard records
+            response.content = json.dumps([{"dtxsid": d, "source": s} for d in kwargs["json"] if d != "DTXSID0" for s in ("a", "b")]).encode()
+            return response
+
+        with patch.object(transport.session, "request", side_effect=hazard_records) as mock_request:
+            client.get_hazard_batch(type="all", dtxsid_list=["DTXSID0", "DTXSID1", "DTXSID2"])
+            response = client.get_hazard_batch(type="all", dtxsid_list=["DTXSID2", "DTXSID3", "DTXSID0"])
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertEqual(mock_request.call_args.kwargs["json"], ["DTXSID3"])
+        self.assertEqual([(r["dtxsid"], r["source"]) for r in response],
+                         [("DTXSID2", "a"), ("DTXSID2", "b"), ("DTXSID3", "a"), ("DTXSID3", "b")])
+
+    def test_repeated_ids_give_the_same_records_with_or_without_cache(self):
+        transport = Transport()
+        sent = []
+
+        def hazard_records(method, url, headers=None, **kwargs):
+            sent.append(kwargs["json"])
+            response = MagicMock()
+            response.content = json.dumps([{"dtxsid": d} for d in kwargs["json"]]).encode()
+            return response
+
+        ids = ["DTXSID1", "DTXSID2", "DTXSID1"]
+        with patch.object(transport.session, "request", side_effect=hazard_records):
+            cached = Hazard(api_key="test-api-key", transport=transport, cache=DiskCache(self.path)).get_hazard_batch(
+                type="all", dtxsid_list=ids)
+            uncached = Hazard(api_key="test-api-key", transport=transport, memo_cache=None).get_hazard_batch(
+                type="all", dtxsid_list=ids)
+
+        self.assertEqual(cached, uncached)
+        self.assertEqual(uncached, [{"dtxsid": "DTXSID1"}, {"dtxsid": "DTXSID2"}])
+        self.assertEqual(sent, [["DTXSID1", "DTXSID2"]] * 2)
+
+
+class TestMemoryCache(unittest.TestCase):
+    def test_lru_and_invalidation(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 1, "chemical/list/type")
+        cache.set("b", 2, "chemical/list/")
+        cache.get("a")
+        cache.set("c", 3, "bioactivity/assay/")
+        self.assertEqual(cache.get("b"), (False, None))
+        cache.invalidate("chemical/*")
+        self.assertEqual(cache.get("a"), (False, None))
+        self.assertEqual(cache.get("c"), (True, 3))
+
+    def test_catalogue_endpoints_are_memoized(self):
+        transport = Transport()
+        catalogue_cache.clear()
+        client = ChemList(api_key="test-api-key", transport=transport)
+        mock_response = MagicMock()
+        mock_response.content = json.dumps(["federal", "state"]).encode()
+
+        with patch.object(transport.session, "request", return_value=mock_response) as mock_request:
+            client.get_list_types()
+            client.get_list_types()
+            client.get_public_list(op="type", value="state")
+            client.get_public_list(op="type", value="state")
+
+        self.assertEqual(mock_request.call_count, 3)
+        catalogue_cache.invalidate("chemical/list/type")
+        self.assertEqual(len(catalogue_cache), 0)
+
+    def test_mutating_a_memoized_result_does_not_change_later_results(self):
+        transport = Transport()
+        catalogue_cache.clear()
+        self.addCleanup(catalogue_cache.clear)
+        client = ChemList(api_key="test-api-key", transport=transport)
+        mock_response = MagicMock()
+        mock_response.content = json.dumps(["federal", "state"]).encode()
+
+        with patch.object(transport.session, "request", return_value=mock_response) as mock_request:
+            client.get_list_types().append("mutated")
+            second = client.get_list_types()
+            second.clear()
+            third = ChemList(api_key="other-api-key", transport=transport).get_list_types()
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(third, ["federal", "state"])
+
+    def test_clients_for_different_servers_do_not_share_responses(self):
+        transport = Transport()
+        catalogue_cache.clear()
+        self.addCleanup(catalogue_cache.clear)
+        clients = [ChemList(api_key="test-api-key", transport=transport) for _ in range(2)]
+        clients[1].base_url = "http://localhost:8080"
+        mock_response = MagicMock()
+        mock_response.content = json.dumps(["federal", "state"]).encode()
+
+        with patch.object(transport.session, "request", return_value=mock_response) as mock_request:
+            for client in clients * 2:
+                client.get_list_types()
+
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertNotEqual(make_cache_key("GET", "a", base_url="http://x"), make_cache_key("GET", "a", base_url="http://y"))
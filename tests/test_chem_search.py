@@ -1,3 +1,4 @@
+import json
 import unittest
 from unittest.mock import patch, MagicMock
 from pycomptox.apis.chem_search import ChemSearch
@@ -22,7 +23,7 @@ class TestChemSearch(unittest.TestCase):
         print("----------------------------------")
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "123", "name": "Density", "value": 2.5}
+        mock_response.content = json.dumps({"id": "123", "name": "Density", "value": 2.5}).encode()
         mock_request.return_value = mock_response
 
         # Call the get_property method
@@ -49,7 +50,7 @@ class TestChemSearch(unittest.TestCase):
         print("-----------------------------")
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "123", "name": "Density", "value": 2.5}
+        mock_response.content = json.dumps({"id": "123", "name": "Density", "value": 2.5}).encode()
         mock_request.return_value = mock_response
 
         # Call the get_property method
@@ -76,7 +77,7 @@ class TestChemSearch(unittest.TestCase):
         print("-----------------------------")
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"id": "123", "name": "Density", "value": 2.5}
+        mock_response.content = json.dumps({"id": "123", "name": "Density", "value": 2.5}).encode()
         mock_request.return_value = mock_response
 
         # Call the get_property method
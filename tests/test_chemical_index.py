@@ -0,0 +1,113 @@
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+from pycomptox.apis.chem_search import ChemSearch
+from pycomptox.core.transport import Transport
+from pycomptox.local import ChemicalIndex
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+CHEMICALS = [
+    {"dtxsid": "DTXSID7020182", "dtxcid": "DTXCID30182", "casrn": "80-05-7", "preferredName": "Bisphenol A",
+     "hasStructureImage": 1, "smiles": "CC(C)(C1=CC=C(O)C=C1)C1=CC=C(O)C=C1", "isMarkush": False,
+     "monoisotopicMass": 228.115},
+    {"dtxsid": "DTXSID2021781", "dtxcid": "DTXCID101781", "casrn": "80-09-1", "preferredName": "Bisphenol S",
+     "hasStructureImage": 1, "smiles": "OC1=CC=C(C=C1)S(=O)(=O)C1=CC=C(O)C=C1", "isMarkush": False},
+    {"dtxsid": "DTXSID5020029", "dtxcid": "DTXCID1029", "casrn": "107-13-1", "preferredName": "Acrylonitrile",
+     "hasStructureImage": 1, "smiles": "C=CC#N", "isMarkush": False},
+    {"dtxsid": "DTXSID7020182", "preferredName": "Duplicate"},
+    {"preferredName": "No DTXSID"},
+]
+
+
+class TestChemicalIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = ChemicalIndex(CHEMICALS)
+
+    def test_prefix_search_is_case_insensitive_and_ranked(self):
+        hits = self.index.search("start-with", "bisphenol")
+        self.assertEqual([hit["preferredName"] for hit in hits], ["Bisphenol A", "Bisphenol S"])
+        self.assertEqual(hits[0]["searchName"], "Approved Name")
+        self.assertEqual(hits[0]["searchValue"], "Bisphenol A")
+        self.assertNotIn("monoisotopicMass", hits[0])
+        self.assertEqual(len(self.index), 3)
+
+    def test_search_fields_and_ops(self):
+        self.assertEqual([hit["dtxsid"] for hit in self.index.search("start-with", "80-0")],
+                         ["DTXSID7020182", "DTXSID2021781"])
+        self.assertEqual(self.index.search("equal", "dtxcid1029")[0]["searchName"], "DSSTox_Compound_Id")
+        self.assertEqual(self.index.search("equal", "DTXSID502"), [])
+        self.assertEqual([hit["preferredName"] for hit in self.index.search("contain", "LONIT")], ["Acrylonitrile"])
+
+    def test_one_hit_per_chemical_and_top(self):
+        # 'DTXSID7020182' and 'DTXCID...' match 'DTX' for every chemical
+        hits = self.index.search("start-with", "DTX")
+        self.assertEqual(len(hits), 3)
+        self.assertEqual(len(self.index.search("start-with", "DTX", top=2)), 2)
+        with self.assertRaises(ValueError):
+            self.index.search("fuzzy", "DTX")
+
+    def test_snapshot_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "chemicals.jsonl")
+            self.index.save(path)
+            loaded = ChemicalIndex.load(path)
+        self.assertEqual(loaded.search("start-with", "bis"), self.index.search("start-with", "bis"))
+
+    def test_from_lists(self):
+        comptox = MagicMock()
+        comptox.chem_list.get_chem_by_list.side_effect = [["DTXSID7020182"], ["DTXSID7020182", "DTXSID5020029"]]
+        comptox.chem_details.get_chemical_details_batch.return_value = [CHEMICALS[0], CHEMICALS[2]]
+
+        index = ChemicalIndex.from_lists(comptox, ["LIST1", "LIST2"])
+
+        comptox.chem_details.get_chemical_details_batch.assert_called_once_with(
+            by="dtxsid", data_list=["DTXSID7020182", "DTXSID5020029"])
+        self.assertEqual(len(index), 2)
+
+
+class TestChemSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.transport = Transport()
+        self.client = ChemSearch(api_key="test-api-key", transport=self.transport, memo_cache=None,
+                                 index=ChemicalIndex(CHEMICALS))
+
+    def _api(self, body):
+        response = MagicMock()
+        response.status_code = 200
+        response.content = json.dumps(body).encode()
+        return patch.object(self.transport.session, "request", return_value=response)
+
+    def test_hits_are_answered_locally(self):
+        with self._api([]) as mock_request:
+            hits = self.client.get_chemical(op="start-with", word="Bisphenol", params={"top": 1})
+        mock_request.assert_not_called()
+        self.assertEqual([hit["dtxsid"] for hit in hits], ["DTXSID7020182"])
+
+    def test_misses_and_other_projections_use_the_api(self):
+        api_hit = [{"dtxsid": "DTXSID0000001", "preferredName": "Zinc"}]
+        with self._api(api_hit) as mock_request:
+            self.assertEqual(self.client.get_chemical(op="start-with", word="Zin"), api_hit)
+            self.client.get_chemical(op="contain", word="Bisphenol", params={"projection": "chemicalsearchlite"})
+        self.assertEqual(mock_request.call_count, 2)
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+    def test_async_client_uses_the_index(self):
+        from pycomptox.apis.aio import AsyncChemSearch
+
+        async def search():
+            client = AsyncChemSearch(api_key="test-api-key", index=ChemicalIndex(CHEMICALS))
+            return await client.get_chemical(op="equal", word="80-09-1")
+
+        hits = asyncio.run(search())
+        self.assertEqual(hits[0]["preferredName"], "Bisphenol S")
+
+
+if __name__ == "__main__":
+    unittest.main()
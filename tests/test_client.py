@@ -0,0 +1,55 @@
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+from pycomptox import AsyncCompTox, CompTox
+from pycomptox.apis.exposure import Httk
+from pycomptox.apis.hazard import Hazard
+from pycomptox.core.cache import MemoryCache
+from pycomptox.core.config import Config
+from pycomptox.core.throttle import TokenBucket
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+class TestCompTox(unittest.TestCase):
+    def test_sub_clients_share_state(self):
+        cache = MemoryCache()
+        limiter = TokenBucket(rate=100, burst=10)
+        comptox = CompTox(api_key="test-api-key", cache=cache, rate_limiter=limiter, max_workers=2)
+
+        self.assertIsInstance(comptox.hazard, Hazard)
+        self.assertIsInstance(comptox.httk, Httk)
+        for client in (comptox.hazard, comptox.httk, comptox.chem_search):
+            self.assertIs(client.transport, comptox.transport)
+            self.assertIs(client.cache, cache)
+            self.assertIs(client.rate_limiter, limiter)
+            self.assertEqual(client.max_workers, 2)
+
+    def test_sub_clients_are_built_once(self):
+        comptox = CompTox(api_key="test-api-key")
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            clients = list(pool.map(lambda _: comptox.cancer, range(8)))
+        self.assertTrue(all(client is clients[0] for client in clients))
+
+    def test_config_sets_base_url_and_pool(self):
+        config = Config(api_key="test-api-key", base_url="http://localhost:8080", pool_maxsize=32)
+        with CompTox(api_key="test-api-key", config=config) as comptox:
+            mock_response = MagicMock()
+            mock_response.content = json.dumps([]).encode()
+            with patch.object(comptox.transport.session, "request", return_value=mock_response) as mock_request:
+                comptox.httk.get_httk_data(dtxsid="DTXSID7020182")
+
+            self.assertEqual(mock_request.call_args.args[1], "http://localhost:8080/exposure/httk/search/by-dtxsid/DTXSID7020182")
+            self.assertEqual(comptox.transport.session.get_adapter("http://localhost")._pool_maxsize, 32)
+
+    @unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+    def test_async_facade_builds_async_clients(self):
+        from pycomptox.apis.aio import AsyncHazard
+
+        comptox = AsyncCompTox(api_key="test-api-key")
+        self.assertIsInstance(comptox.hazard, AsyncHazard)
+        self.assertIs(comptox.hazard.transport, comptox.skin_eye.transport)
@@ -0,0 +1,52 @@
+import logging
+import unittest
+from pycomptox.client import CompTox
+from pycomptox.dossier import SECTIONS, DossierBuilder
+from pycomptox.testing import StubServer
+from pycomptox.utils.exceptions import APIRequestError
+
+
+class TestDossierBuilder(unittest.TestCase):
+    def test_dossiers_merge_every_section_in_input_order(self):
+        dtxsids = [f"DTXSID{i}" for i in range(450)] + ["DTXSID3"]
+        with StubServer(records_per_id=2) as server:
+            with CompTox(api_key="test-api-key", config=server.config()) as comptox:
+                dossiers = list(DossierBuilder(comptox, chunk_size=200).build(iter(dtxsids)))
+
+        self.assertEqual([dossier["dtxsid"] for dossier in dossiers], dtxsids[:450])
+        dossier = dossiers[3]
+        self.assertEqual(set(dossier), {"dtxsid", *SECTIONS})
+        self.assertEqual(dossier["details"]["dtxsid"], "DTXSID3")
+        self.assertEqual(len(dossier["hazard"]), 2)
+        self.assertTrue(all(record["dtxsid"] == "DTXSID3" for record in dossier["httk"]))
+        self.assertEqual(server.requests[("POST", "hazard/search/by-dtxsid/")], 3)
+        self.assertEqual(server.requests[("GET", "exposure/httk/search/by-dtxsid/{}")], 450)
+
+    def test_requests_in_flight_fit_the_connection_pool(self):
+        dtxsids = [f"DTXSID{i}" for i in range(100)]
+        with StubServer(latency=0.002) as server:
+            with CompTox(api_key="test-api-key", config=server.config()) as comptox:
+                with self.assertLogs("urllib3.connectionpool", logging.WARNING) as logs:
+                    dossiers = list(DossierBuilder(comptox, chunk_size=50).build(dtxsids))
+                    logging.getLogger("urllib3.connectionpool").warning("done")
+
+        self.assertEqual(len(dossiers), 100)
+        # "Connection pool is full, discarding connection" would be logged on overflow
+        self.assertEqual(logs.output, ["WARNING:urllib3.connectionpool:done"])
+
+    def test_section_errors_are_recorded_or_raised(self):
+        with StubServer(batch_limit=2) as server:
+            with CompTox(api_key="test-api-key", config=server.config()) as comptox:
+                builder = DossierBuilder(comptox, sections=["hazard", "httk"], chunk_size=3)
+                dossiers = list(builder.build(["DTXSID1", "DTXSID2", "DTXSID3"]))
+
+                with self.assertRaises(APIRequestError):
+                    list(DossierBuilder(comptox, sections=["hazard"], strict=True).build(["DTXSID1", "DTXSID2", "DTXSID3"]))
+
+        self.assertIsNone(dossiers[0]["hazard"])
+        self.assertIn("400", dossiers[0]["errors"]["hazard"])
+        self.assertEqual(len(dossiers[0]["httk"]), 1)
+
+    def test_unknown_sections(self):
+        with self.assertRaises(ValueError):
+            DossierBuilder(CompTox(api_key="test-api-key"), sections=["hazard", "nope"])
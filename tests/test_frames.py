@@ -0,0 +1,69 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+from pycomptox.apis.chem_search import ChemProperties
+from pycomptox.core.schemas import PROPERTY, schema_for
+from pycomptox.core.transport import Transport
+from pycomptox.utils.frames import to_columns
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+RECORDS = [
+    {"name": "Density", "value": 1, "id": 1, "source": "EPI", "dtxsid": "DTXSID1", "unit": "g/cm3",
+     "propertyId": "density", "propType": "predicted"},
+    {"name": "LogP", "value": 2.5, "id": 2, "source": "EPI", "dtxsid": "DTXSID1", "unit": None,
+     "propertyId": "logp", "propType": "experimental", "extra": "x"},
+]
+
+
+class TestColumns(unittest.TestCase):
+    def test_schema_fields_first_then_extra_fields(self):
+        columns, types = to_columns(RECORDS, PROPERTY)
+        self.assertEqual(list(columns)[:len(PROPERTY)], [field for field, _ in PROPERTY])
+        self.assertEqual(columns["extra"], [None, "x"])
+        self.assertEqual(columns["dtxcid"], [None, None])
+        self.assertEqual(types["value"], "float")
+
+    def test_non_record_lists_become_value_column(self):
+        columns, _ = to_columns(["DTXSID1", "DTXSID2"])
+        self.assertEqual(columns, {"value": ["DTXSID1", "DTXSID2"]})
+
+    def test_endpoint_schemas(self):
+        self.assertIs(schema_for("chemical/property/search/by-dtxsid/"), PROPERTY)
+        self.assertIsNone(schema_for("bioactivity/data/search/by-aeid/1386"))
+
+    @unittest.skipIf(pandas is None, "pandas is not installed")
+    def test_batch_to_pandas(self):
+        transport = Transport()
+        client = ChemProperties(api_key="test-api-key", transport=transport)
+        mock_response = MagicMock()
+        mock_response.content = json.dumps(RECORDS).encode()
+
+        with patch.object(transport.session, "request", return_value=mock_response):
+            frame = client.get_properties_batch(dtxsid_list=["DTXSID1"], output="pandas")
+
+        self.assertEqual(len(frame), 2)
+        self.assertEqual(str(frame["value"].dtype), "Float64")
+        self.assertEqual(str(frame["id"].dtype), "Int64")
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_to_arrow(self):
+        transport = Transport()
+        client = ChemProperties(api_key="test-api-key", transport=transport)
+        mock_response = MagicMock()
+        mock_response.content = json.dumps(RECORDS).encode()
+
+        with patch.object(transport.session, "request", return_value=mock_response):
+            table = client.get_properties(by="dtxsid", params={"dtxsid": "DTXSID1"}, output="arrow")
+
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(table.schema.field("value").type, pyarrow.float64())
+        self.assertEqual(table.column("unit").to_pylist(), ["g/cm3", None])
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+import unittest
+
+# Cold start budget for importing one client class, in microseconds, measured with `-X importtime`
+IMPORT_BUDGET_US = int(os.environ.get("PYCOMPTOX_IMPORT_BUDGET_US", 100_000))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code, *options):
+    return subprocess.run([sys.executable, *options, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+class TestImportTime(unittest.TestCase):
+    def test_package_import_has_no_side_effects(self):
+        result = _run(
+            "import sys, logging, pycomptox\n"
+            "print(sorted(name for name in sys.modules if name.startswith('pycomptox')))\n"
+            "print(logging.getLogger().handlers)"
+        )
+        modules, handlers = result.stdout.splitlines()
+        self.assertEqual(modules, "['pycomptox']")
+        self.assertEqual(handlers, "[]")
+
+    def test_client_import_defers_heavy_dependencies(self):
+        result = _run(
+            "import sys\n"
+            "from pycomptox import Hazard\n"
+            "heavy = ['requests', 'pandas', 'pyarrow', 'aiohttp', 'asyncio', 'sqlite3', 'pycomptox.apis.exposure']\n"
+            "print([name for name in heavy if name in sys.modules])"
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def test_client_import_within_budget(self):
+        result = _run("import pycomptox.apis.hazard", "-X", "importtime")
+        cumulative = {}
+        for line in result.stderr.splitlines():
+            if line.startswith("import time:") and "|" in line:
+                _, total, name = line[len("import time:"):].split("|")
+                if total.strip().isdigit():
+                    cumulative[name.strip()] = int(total)
+
+        self.assertLess(cumulative["pycomptox.apis.hazard"], IMPORT_BUDGET_US)
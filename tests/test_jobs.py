@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+import unittest
+from pycomptox.jobs import BulkJob
+from pycomptox.utils.exceptions import APIRequestError
+
+
+class TestBulkJob(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.ids = [f"DTXSID{i}" for i in range(10)]
+        self.calls = []
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _job(self, fetch, **kwargs):
+        return BulkJob("sweep", fetch, chunk_size=3, max_workers=1, directory=self.directory.name, **kwargs)
+
+    def _records(self, chunk):
+        self.calls.append(chunk)
+        return [{"dtxsid": id_} for id_ in chunk]
+
+    def test_resume_skips_finished_chunks(self):
+        def flaky(chunk):
+            if chunk[0] == "DTXSID6":
+                raise APIRequestError("503 Service Unavailable", status_code=503)
+            return self._records(chunk)
+
+        with self.assertRaises(APIRequestError):
+            self._job(flaky).run(self.ids)
+        self.assertEqual(len(self.calls), 2)
+
+        # Records of a chunk written but never journaled are dropped on restart
+        with open(os.path.join(self.directory.name, "sweep", "results.jsonl"), "a") as f:
+            f.write(json.dumps({"dtxsid": "partial"}) + "\n")
+
+        self.calls.clear()
+        job = self._job(self._records)
+        self.assertEqual(job.run(iter(self.ids)), {"fetched": 2, "skipped": 2})
+        self.assertEqual(self.calls, [self.ids[6:9], self.ids[9:]])
+        self.assertEqual([record["dtxsid"] for record in job.results()], self.ids)
+
+    def test_fan_out_results_and_changed_input(self):
+        job = self._job(lambda chunk: {id_: [id_.lower()] for id_ in chunk})
+        job.run(self.ids[:4])
+        self.assertEqual(list(job.results())[3], {"id": "DTXSID3", "result": ["dtxsid3"]})
+
+        with self.assertRaises(ValueError):
+            job.run(["DTXSID9"] + self.ids[1:4])
+
+        job.reset()
+        self.assertEqual(job.run(self.ids[:4]), {"fetched": 2, "skipped": 0})
+
+    def test_failed_fan_out_ids_are_recorded(self):
+        def fan_out(chunk):
+            return {id_: APIRequestError("404 Not Found", status_code=404) if id_ == "DTXSID1" else [id_]
+                    for id_ in chunk}
+
+        job = self._job(fan_out)
+        self.assertEqual(job.run(self.ids[:4]), {"fetched": 2, "skipped": 0})
+        records = list(job.results())
+        self.assertEqual(records[1], {"id": "DTXSID1", "error": "404 Not Found", "status_code": 404})
+        self.assertEqual(records[3], {"id": "DTXSID3", "result": ["DTXSID3"]})
+
+    def test_generator_results(self):
+        job = self._job(lambda chunk: ({"dtxsid": id_} for id_ in chunk))
+        job.run(self.ids)
+        self.assertEqual([record["dtxsid"] for record in job.results()], self.ids)
+
+    def test_results_before_first_run(self):
+        self.assertEqual(list(self._job(self._records).results()), [])
@@ -0,0 +1,55 @@
+import importlib.util
+import unittest
+from unittest.mock import patch, MagicMock
+from pycomptox.apis.hazard import Hazard
+from pycomptox.core.transport import Transport
+from pycomptox.utils import jsonlib
+
+INSTALLED = [name for name in jsonlib.BACKENDS if importlib.util.find_spec(name) is not None]
+
+
+class TestJSONBackend(unittest.TestCase):
+    def setUp(self):
+        self.addCleanup(jsonlib.set_json_backend)
+
+    def test_default_is_first_installed_backend(self):
+        self.assertEqual(jsonlib.set_json_backend(), INSTALLED[0])
+        self.assertEqual(jsonlib.json_backend(), INSTALLED[0])
+
+    def test_backends_decode_bytes_and_text(self):
+        for name in INSTALLED:
+            with self.subTest(backend=name):
+                jsonlib.set_json_backend(name)
+                self.assertEqual(jsonlib.loads(b'[{"dtxsid": "DTXSID1", "value": 2.5}]'),
+                                 [{"dtxsid": "DTXSID1", "value": 2.5}])
+                self.assertEqual(jsonlib.loads('{"a": null}'), {"a": None})
+                self.assertEqual(jsonlib.loads(jsonlib.dumps({"a": [1, "b"]})), {"a": [1, "b"]})
+                # Accepted by the standard library only
+                self.assertEqual(jsonlib.loads(b"[18446744073709551616]"), [18446744073709551616])
+                with self.assertRaises(ValueError):
+                    jsonlib.loads(b"2,4-Dichlorophenol")
+
+    def test_invalid_and_missing_backends(self):
+        with self.assertRaises(ValueError):
+            jsonlib.set_json_backend("simplejson")
+        for name in jsonlib.BACKENDS:
+            if name not in INSTALLED:
+                with self.assertRaises(ImportError):
+                    jsonlib.set_json_backend(name)
+
+    def test_client_decodes_response_bytes(self):
+        transport = Transport()
+        client = Hazard(api_key="test-api-key", transport=transport, memo_cache=None)
+        response = MagicMock()
+        response.status_code = 200
+        response.content = b'[{"dtxsid": "DTXSID7020182"}]'
+
+        with patch.object(transport.session, "request", return_value=response):
+            result = client.get_hazard(type="all", dtxsid="DTXSID7020182")
+
+        self.assertEqual(result, [{"dtxsid": "DTXSID7020182"}])
+        response.json.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from pycomptox.apis.chem_search import ChemDetails, ChemSearch
+from pycomptox.core.transport import Transport
+from pycomptox.local import IntervalSet, MassRangeCache
+
+# DTXSID -> (MS-ready mass, monoisotopic mass, SMILES, MS-ready SMILES)
+CHEMICALS = {
+    "DTXSID1": (100.0, 100.0, "C", "C"),
+    "DTXSID2": (100.5, 100.5, "CC", "CC"),
+    "DTXSID3": (101.0, 101.0, "CCC", "CCC"),
+    # A sodium salt: its monoisotopic mass is not its MS-ready mass
+    "DTXSID4": (100.7, 122.7, "CCCC.[Na]", "CCCC"),
+}
+
+
+def ms_ready(op, start, end):
+    return [dtxsid for dtxsid, (mass, *_) in CHEMICALS.items() if start <= mass <= end]
+
+
+def details_batch(by, data_list):
+    return [{"dtxsid": dtxsid, "monoisotopicMass": CHEMICALS[dtxsid][1], "smiles": CHEMICALS[dtxsid][2],
+             "msReadySmiles": CHEMICALS[dtxsid][3]} for dtxsid in data_list]
+
+
+class TestIntervalSet(unittest.TestCase):
+    def test_add_merges_overlapping_and_touching_intervals(self):
+        intervals = IntervalSet([(1, 2), (3, 4), (2, 2.5), (6, 7)])
+        self.assertEqual(list(intervals), [(1, 2.5), (3, 4), (6, 7)])
+        intervals.add(4, 6)
+        self.assertEqual(list(intervals), [(1, 2.5), (3, 7)])
+        with self.assertRaises(ValueError):
+            intervals.add(2, 1)
+
+    def test_gaps_and_covers(self):
+        intervals = IntervalSet([(1, 2.5), (3, 4), (6, 7)])
+        self.assertEqual(intervals.gaps(0, 8), [(0, 1), (2.5, 3), (4, 6), (7, 8)])
+        self.assertEqual(intervals.gaps(1.5, 2.2), [])
+        self.assertEqual(intervals.gaps(5, 5), [(5, 5)])
+        self.assertTrue(intervals.covers(3, 4))
+        self.assertFalse(intervals.covers(2, 3))
+
+
+class TestMassRangeCache(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.ms_ready.side_effect = ms_ready
+        self.details = MagicMock()
+        self.details.get_chemical_details_batch.side_effect = details_batch
+
+    def test_covered_windows_are_answered_locally(self):
+        cache = MassRangeCache(self.client, details=self.details)
+        self.assertEqual(cache.search(99, 102), ["DTXSID1", "DTXSID2", "DTXSID3", "DTXSID4"])
+        # The salt's bounds are [99, 102]: only windows containing them are local
+        self.assertEqual(cache.search(98, 103), ["DTXSID1", "DTXSID2", "DTXSID3", "DTXSID4"])
+        # Only the gaps [98, 99] and [102, 103] are requested
+        self.assertEqual(self.client.ms_ready.call_count, 3)
+        self.client.ms_ready.assert_called_with(op="mass", start=102, end=103)
+
+        # Cuts through the salt's bounds: requested, which narrows them to [100.6, 100.8]
+        self.assertEqual(cache.search(100.6, 100.8), ["DTXSID4"])
+        self.assertEqual(self.client.ms_ready.call_count, 4)
+        self.assertEqual(cache.search(100.4, 101.5), ["DTXSID2", "DTXSID3", "DTXSID4"])
+        self.assertEqual(cache.search(99.9, 100.1), ["DTXSID1"])
+        self.assertEqual(self.client.ms_ready.call_count, 4)
+        self.assertEqual(cache.stats, {"requests": 4, "local": 4})
+
+    def test_default_details_client_shares_the_search_client(self):
+        client = ChemSearch(api_key="test-api-key", transport=Transport())
+        client.base_url = "http://localhost:8080"
+        cache = MassRangeCache(client)
+
+        self.assertIsInstance(cache.details, ChemDetails)
+        self.assertIs(cache.details.transport, client.transport)
+        self.assertEqual(cache.details.base_url, client.base_url)
+
+        def neutral(op, start, end):
+            # Without the salt, whose MS-ready mass stays a [99, 102] interval
+            return [dtxsid for dtxsid in ms_ready(op, start, end) if dtxsid != "DTXSID4"]
+
+        with patch.object(client, "ms_ready", side_effect=neutral) as search, \
+                patch.object(cache.details, "get_chemical_details_batch", side_effect=details_batch):
+            cache.search(99, 102)
+            self.assertEqual(cache.search(99.9, 100.6), ["DTXSID1", "DTXSID2"])
+        self.assertEqual(search.call_count, 1)
+
+        with self.assertRaises(ValueError):
+            MassRangeCache(self.client)
+
+    def test_without_details_every_candidate_has_bounds(self):
+        cache = MassRangeCache(self.client, details=False)
+        cache.search(99, 102)
+        self.assertEqual(sorted(cache.search(99.5, 101.5)), ["DTXSID1", "DTXSID2", "DTXSID3", "DTXSID4"])
+        self.assertEqual(sorted(cache.search(99.5, 101.5)), ["DTXSID1", "DTXSID2", "DTXSID3", "DTXSID4"])
+        self.assertEqual(self.client.ms_ready.call_count, 2)
+        self.assertEqual(len(cache), 4)
+
+    def test_search_many_requests_the_union_once(self):
+        cache = MassRangeCache(self.client, details=self.details)
+        windows = [(99.9, 100.1), (100.0, 100.6), (100.9, 101.1)]
+        self.assertEqual(cache.search_many(windows), [["DTXSID1"], ["DTXSID1", "DTXSID2"], ["DTXSID3"]])
+        # [99.9, 100.6] in one request, [100.9, 101.1] in another
+        self.assertEqual(self.client.ms_ready.call_count, 2)
+
+        with self.assertRaises(ValueError):
+            cache.search(2, 1)
+
+    def test_wide_gaps_are_split(self):
+        cache = MassRangeCache(self.client, details=False, max_width=1)
+        cache.search(99, 101.5)
+        self.assertEqual(self.client.ms_ready.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+import requests
+from pycomptox.apis.chem_search import ChemSearch
+from pycomptox.apis.hazard import Hazard
+from pycomptox.core.cache import MemoryCache
+from pycomptox.core.metrics import LatencyHistogram, RequestEvent, add_hook, endpoint_template, remove_hook
+from pycomptox.core.throttle import RetryPolicy
+from pycomptox.core.transport import Transport
+from pycomptox.utils.exceptions import APIRequestError
+
+
+def _response(status_code=200, body=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = json.dumps(body).encode()
+    return response
+
+
+class TestEndpointTemplate(unittest.TestCase):
+    def test_values_are_replaced(self):
+        self.assertEqual(endpoint_template("hazard/search/by-dtxsid/DTXSID7020182"), "hazard/search/by-dtxsid/{}")
+        self.assertEqual(endpoint_template("chemical/search/equal/Bisphenol A"), "chemical/search/equal/{}")
+        self.assertEqual(endpoint_template("chemical/property/search/by-range/density/1/2"),
+                         "chemical/property/search/by-range/{}/{}/{}")
+        self.assertEqual(endpoint_template("chemical/fate/search/by-dtxsid/"), "chemical/fate/search/by-dtxsid/")
+        self.assertEqual(endpoint_template("chemical/list/type"), "chemical/list/type")
+
+
+class TestClientEvents(unittest.TestCase):
+    def setUp(self):
+        self.transport = Transport()
+        self.events = []
+
+    @patch("pycomptox.core.base_client.time.sleep")
+    def test_event_records_status_retries_and_cache(self, mock_sleep):
+        client = ChemSearch(api_key="test-api-key", transport=self.transport, hooks=[self.events.append],
+                            cache=MemoryCache(), retry=RetryPolicy(max_retries=2))
+        responses = [_response(503), _response(200, body=["ok"])]
+
+        with patch.object(self.transport.session, "request", side_effect=responses):
+            client.get_chemical(op="equal", word="DTXSID7020182")
+            client.get_chemical(op="equal", word="DTXSID7020182")
+
+        first, second = self.events
+        self.assertEqual((first.endpoint, first.method), ("chemical/search/equal/{}", "GET"))
+        self.assertEqual((first.status, first.retries, first.cache), (200, 1, "miss"))
+        self.assertEqual(first.response_bytes, len(b'["ok"]'))
+        self.assertGreater(first.latency, 0)
+        self.assertEqual((second.status, second.cache), (None, "hit"))
+
+    def test_batch_events_carry_batch_size(self):
+        client = Hazard(api_key="test-api-key", transport=self.transport, memo_cache=None)
+        histogram = LatencyHistogram()
+        add_hook(histogram)
+        add_hook(self.events.append)
+        try:
+            with patch.object(self.transport.session, "request", return_value=_response(body=[])):
+                client.get_hazard_batch(type="all", dtxsid_list=[f"DTXSID{i}" for i in range(250)])
+        finally:
+            remove_hook(histogram)
+            remove_hook(self.events.append)
+
+        self.assertEqual(sorted(event.batch_size for event in self.events), [50, 200])
+        series = histogram.snapshot()["POST hazard/search/by-dtxsid/"]
+        self.assertEqual(series["count"], 2)
+        self.assertGreater(series["request_bytes"], 0)
+
+    def test_batches_served_from_the_record_cache_emit_a_hit(self):
+        client = Hazard(api_key="test-api-key", transport=self.transport, hooks=[self.events.append],
+                        cache=MemoryCache(), memo_cache=None)
+        body = [{"dtxsid": "DTXSID1"}, {"dtxsid": "DTXSID2"}]
+
+        with patch.object(self.transport.session, "request", return_value=_response(body=body)) as mock_request:
+            client.get_hazard_batch(type="all", dtxsid_list=["DTXSID1", "DTXSID2"])
+            client.get_hazard_batch(type="all", dtxsid_list=["DTXSID2", "DTXSID1"])
+
+        self.assertEqual(mock_request.call_count, 1)
+        self.assertEqual(len(self.events), 2)
+        hit = self.events[1]
+        self.assertEqual((hit.method, hit.endpoint, hit.cache, hit.status), ("POST", "hazard/search/by-dtxsid/", "hit", None))
+        self.assertEqual(hit.batch_size, 2)
+
+    def test_failures_and_failing_hooks(self):
+        def broken(event):
+            raise RuntimeError("hook failure")
+
+        client = ChemSearch(api_key="test-api-key", transport=self.transport, hooks=[broken, self.events.append],
+                            retry=RetryPolicy(max_retries=0))
+        failed = _response(404)
+        failed.raise_for_status.side_effect = requests.exceptions.HTTPError("404 Not Found", response=failed)
+
+        with patch.object(self.transport.session, "request", return_value=failed):
+            with self.assertRaises(APIRequestError):
+                client.get_chemical(op="equal", word="unknown")
+
+        self.assertEqual((self.events[0].status, self.events[0].error), (404, "APIRequestError"))
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def _event(self, latency, endpoint="hazard/search/by-dtxsid/{}"):
+        event = RequestEvent(endpoint, "GET")
+        event.latency = latency
+        return event
+
+    def test_snapshot_and_quantiles(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for latency in (0.05, 0.05, 0.5, 2.0):
+            histogram(self._event(latency))
+
+        series = histogram.snapshot()["GET hazard/search/by-dtxsid/{}"]
+        self.assertEqual(series["count"], 4)
+        self.assertEqual(series["buckets"], {0.1: 2, 1.0: 3, float("inf"): 4})
+        self.assertAlmostEqual(series["p50"], 0.1)
+        self.assertEqual(series["p99"], 1.0)
+
+    def test_prometheus_text(self):
+        histogram = LatencyHistogram(buckets=(0.1,))
+        histogram(self._event(0.05, endpoint='odd/"name"'))
+
+        text = histogram.prometheus()
+        self.assertIn('pycomptox_request_duration_seconds_bucket{endpoint="odd/\\"name\\"",method="GET",le="0.1"} 1', text)
+        self.assertIn('pycomptox_request_duration_seconds_count{endpoint="odd/\\"name\\"",method="GET"} 1', text)
+        self.assertIn("# TYPE pycomptox_errors_total counter", text)
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import MagicMock
+from pycomptox.local import PropertyRangeCache
+from pycomptox.local.intervals import split
+
+RECORDS = {
+    "density": [{"id": i, "dtxsid": f"DTXSID{i}", "propertyId": "density", "value": 1.0 + i / 10} for i in range(10)],
+    "logp": [{"id": 100, "dtxsid": "DTXSID100", "propertyId": "logp", "value": 2.0},
+             {"id": 101, "dtxsid": "DTXSID101", "propertyId": "logp", "value": None}],
+}
+
+
+def by_range(by, params):
+    return [record for record in RECORDS[params["propertyid"]]
+            if record["value"] is not None and params["start"] <= record["value"] <= params["end"]]
+
+
+class TestPropertyRangeCache(unittest.TestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.client.get_properties.side_effect = by_range
+        self.cache = PropertyRangeCache(self.client)
+
+    def ids(self, records):
+        return [record["id"] for record in records]
+
+    def test_sub_ranges_are_answered_locally(self):
+        self.assertEqual(self.ids(self.cache.search("density", 1.2, 1.5)), [2, 3, 4, 5])
+        self.assertEqual(self.ids(self.cache.search("density", 1.25, 1.45)), [3, 4])
+        self.assertEqual(self.client.get_properties.call_count, 1)
+        self.assertEqual(self.cache.stats, {"requests": 1, "local": 1})
+
+    def test_only_uncovered_parts_are_requested(self):
+        self.cache.search("density", 1.2, 1.5)
+        self.cache.search("density", 1.7, 1.8)
+        self.client.get_properties.reset_mock()
+
+        # Sliding over both fetched ranges requests [1.5, 1.7] and [1.8, 1.9]
+        self.assertEqual(self.ids(self.cache.search("density", 1.4, 1.9)), [4, 5, 6, 7, 8, 9])
+        requested = sorted((call.kwargs["params"]["start"], call.kwargs["params"]["end"])
+                           for call in self.client.get_properties.call_args_list)
+        self.assertEqual(requested, [(1.5, 1.7), (1.8, 1.9)])
+        # Records on the boundaries of overlapping requests are indexed once
+        self.assertEqual(self.ids(self.cache.search("density", 1.0, 2.0)), list(range(10)))
+
+    def test_properties_are_cached_separately(self):
+        self.cache.search("density", 1.0, 3.0)
+        self.assertEqual(self.ids(self.cache.search("logp", 1.0, 3.0)), [100])
+        self.assertEqual(self.client.get_properties.call_count, 2)
+
+        self.cache.clear("logp")
+        self.cache.search("logp", 1.0, 3.0)
+        self.cache.search("density", 1.0, 3.0)
+        self.assertEqual(self.client.get_properties.call_count, 3)
+
+    def test_invalid_range(self):
+        with self.assertRaises(ValueError):
+            self.cache.search("density", 2, 1)
+
+    def test_split(self):
+        self.assertEqual(split([(0, 2.5), (3, 3.5)], 1), [(0, 1), (1, 2), (2, 2.5), (3, 3.5)])
+        self.assertEqual(split([(0, 2.5)]), [(0, 2.5)])
+
+
+if __name__ == "__main__":
+    unittest.main()
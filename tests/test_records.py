@@ -0,0 +1,76 @@
+import json
+import pickle
+import unittest
+from unittest.mock import patch, MagicMock
+from pycomptox.apis.chem_search import ChemProperties
+from pycomptox.core.schemas import PROPERTY, record_name
+from pycomptox.core.transport import Transport
+from pycomptox.utils.records import Record, to_records
+
+RECORDS = [
+    {"name": "Density", "value": 1.2, "id": 1, "source": "EPISUITE", "dtxsid": "DTXSID1", "unit": "g/cm3"},
+    {"name": "LogP", "value": 2.5, "id": 2, "source": "EPISUITE", "dtxsid": "DTXSID1", "unit": None, "extra": "x"},
+]
+
+
+class TestRecords(unittest.TestCase):
+    def test_records_use_slots_and_read_like_dicts(self):
+        records = to_records(json.loads(json.dumps(RECORDS)), PROPERTY, "PropertyRecord")
+        first, second = records
+
+        self.assertIs(type(first), type(second))
+        self.assertEqual(type(first).__name__, "PropertyRecord")
+        self.assertFalse(hasattr(first, "__dict__"))
+        self.assertEqual(first.name, "Density")
+        self.assertEqual(first["unit"], "g/cm3")
+        self.assertIsNone(first.extra)
+        self.assertEqual(second.get("extra"), "x")
+        self.assertIsNone(first.get("missing"))
+        with self.assertRaises(KeyError):
+            first["missing"]
+        self.assertEqual(list(first)[:len(PROPERTY)], [field for field, _ in PROPERTY])
+        self.assertEqual(records, RECORDS)
+
+    def test_categorical_strings_are_interned(self):
+        first, second = to_records(json.loads(json.dumps(RECORDS)), PROPERTY)
+        self.assertIs(first.source, second.source)
+
+    def test_invalid_field_names(self):
+        record = to_records({"first-name": "a", "keys": 1, "_id": 2})
+        self.assertEqual(record.as_dict(), {"first-name": "a", "keys": 1, "_id": 2})
+        self.assertEqual(record["keys"], 1)
+        self.assertEqual(list(record.keys()), ["first-name", "keys", "_id"])
+
+    def test_non_record_results_are_unchanged(self):
+        self.assertEqual(to_records(["DTXSID1", "DTXSID2"]), ["DTXSID1", "DTXSID2"])
+        self.assertIsNone(to_records(None))
+
+    def test_pickle(self):
+        record = to_records(RECORDS[1], PROPERTY, "PropertyRecord")
+        copy = pickle.loads(pickle.dumps(record))
+        self.assertIsInstance(copy, Record)
+        self.assertEqual(copy, record)
+
+    def test_record_names(self):
+        self.assertEqual(record_name("chemical/property/search/by-dtxsid/"), "PropertyRecord")
+        self.assertEqual(record_name("hazard/genetox/summary/search/by-dtxsid/"), "GenetoxRecord")
+        self.assertEqual(record_name("hazard/search/by-dtxsid/"), "HazardRecord")
+        self.assertEqual(record_name("bioactivity/data/search/by-aeid/1386"), "BioactivityRow")
+        self.assertEqual(record_name("chemical/list/"), "Record")
+
+    def test_client_records_output(self):
+        transport = Transport()
+        client = ChemProperties(api_key="test-api-key", transport=transport, memo_cache=None)
+        response = MagicMock()
+        response.status_code = 200
+        response.content = json.dumps(RECORDS).encode()
+
+        with patch.object(transport.session, "request", return_value=response):
+            records = client.get_properties_batch(dtxsid_list=["DTXSID1"], output="records")
+
+        self.assertEqual(type(records[0]).__name__, "PropertyRecord")
+        self.assertEqual(records[1].value, 2.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
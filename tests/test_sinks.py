@@ -0,0 +1,119 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+from pycomptox.core.schemas import PROPERTY
+from pycomptox.utils.sinks import CSVSink, JSONLSink, ParquetSink, Sink
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+RECORDS = [
+    {"name": "Density", "value": 1, "id": 1, "source": "EPI", "dtxsid": "DTXSID1", "unit": "g/cm3"},
+    {"name": "LogP", "value": 2.5, "id": 2, "source": "EPI", "dtxsid": "DTXSID1", "unit": None, "extra": "x"},
+    {"name": "MP", "value": "n/a", "id": 3, "source": "EPI", "dtxsid": "DTXSID2", "tags": ["a", "b"]},
+]
+
+
+class TestSinks(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_jsonl_appends_and_flushes_every_flush_rows(self):
+        path = self.path("out.jsonl")
+        with JSONLSink(path, flush_rows=2) as sink:
+            sink.write_all(RECORDS[:2])
+            sink._wait()
+            with open(path) as f:
+                self.assertEqual(len(f.readlines()), 2)
+            sink.write(RECORDS[2])
+        with JSONLSink(path) as sink:
+            sink.write_mapping({"DTXSID3": [{"id": 4}], "DTXSID4": {"id": 5}, "DTXSID5": None})
+
+        with open(path) as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(rows, RECORDS + [{"id": 4}, {"id": 5}])
+        self.assertEqual(sink.rows, 2)
+
+    def test_csv_header_is_stable(self):
+        path = self.path("out.csv")
+        with CSVSink(path, flush_rows=2, schema=PROPERTY) as sink:
+            sink.write_all(iter(RECORDS))
+
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        fields = [field for field, _ in PROPERTY]
+        self.assertEqual(sink.fields, fields + ["extra"])
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(rows[1]["extra"], "x")
+        # 'tags' first appears after the header was written
+        self.assertNotIn("tags", rows[2])
+
+    def test_csv_header_from_endpoint(self):
+        path = self.path("out.csv")
+        with CSVSink(path, endpoint="chemical/property/search/by-dtxsid/") as sink:
+            sink.write({"dtxsid": "DTXSID1", "nested": {"a": 1}})
+
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(list(rows[0])[:len(PROPERTY)], [field for field, _ in PROPERTY])
+        self.assertEqual(json.loads(rows[0]["nested"]), {"a": 1})
+
+    def test_invalid_flush_rows(self):
+        with self.assertRaises(ValueError):
+            JSONLSink(self.path("out.jsonl"), flush_rows=0)
+
+    def test_sinks_must_implement_write_rows(self):
+        class Incomplete(Sink):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete(self.path("out.txt"))
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class TestParquetSink(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "out.parquet")
+
+    def test_row_groups_share_the_schema(self):
+        with ParquetSink(self.path, flush_rows=2, schema=PROPERTY) as sink:
+            sink.write_all(RECORDS)
+
+        parquet = pyarrow.parquet.ParquetFile(self.path)
+        self.assertEqual(parquet.metadata.num_row_groups, 2)
+        table = parquet.read()
+        self.assertEqual(table.schema.field("value").type, pyarrow.float64())
+        self.assertEqual(table.column("value").to_pylist(), [1.0, 2.5, None])
+        self.assertEqual(table.column("extra").to_pylist(), [None, "x", None])
+        self.assertNotIn("tags", table.column_names)
+
+    def test_inferred_null_columns_are_strings(self):
+        with ParquetSink(self.path, flush_rows=1) as sink:
+            sink.write({"dtxsid": "DTXSID1", "unit": None})
+            sink.write({"dtxsid": "DTXSID2", "unit": "mg/L"})
+
+        table = pyarrow.parquet.read_table(self.path)
+        self.assertEqual(table.column("unit").to_pylist(), [None, "mg/L"])
+
+    def test_empty_file_keeps_schema_columns(self):
+        with ParquetSink(self.path, endpoint="chemical/property/search/by-dtxsid/"):
+            pass
+
+        table = pyarrow.parquet.read_table(self.path)
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.column_names, [field for field, _ in PROPERTY])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+from pycomptox.apis.bioactivity import BioActivityData
+from pycomptox.apis.chem_search import ChemSearch
+from pycomptox.apis.hazard import Hazard
+from pycomptox.core.throttle import RetryPolicy
+from pycomptox.core.transport import Transport
+from pycomptox.testing import StubServer
+from pycomptox.utils.exceptions import APIRequestError
+
+
+class TestStubServer(unittest.TestCase):
+    def _client(self, cls, server, **kwargs):
+        return cls("test-api-key", config=server.config(), transport=Transport(), memo_cache=None, **kwargs)
+
+    def test_batch_requests_are_served_per_value(self):
+        with StubServer(records_per_id=2) as server:
+            hazard = self._client(Hazard, server)
+            dtxsids = [f"DTXSID{i}" for i in range(450)]
+            records = hazard.get_hazard_batch(type="all", dtxsid_list=dtxsids)
+
+        self.assertEqual(len(records), 900)
+        self.assertEqual(records[0]["dtxsid"], "DTXSID0")
+        self.assertEqual(server.requests[("POST", "hazard/search/by-dtxsid/")], 3)
+
+    def test_batch_limit_and_text_batches(self):
+        with StubServer(batch_limit=10) as server:
+            search = self._client(ChemSearch, server)
+            self.assertEqual(len(search.by_batch(data_list=["a", "b"])), 2)
+            with self.assertRaises(APIRequestError) as ctx:
+                search.by_batch(data_list=[str(i) for i in range(11)])
+
+        self.assertEqual(ctx.exception.status_code, 400)
+
+    def test_throttled_requests_are_retried(self):
+        with StubServer(throttle_every=2) as server:
+            hazard = self._client(Hazard, server, retry=RetryPolicy(max_retries=2, backoff=0))
+            for i in range(3):
+                self.assertEqual(len(hazard.get_hazard(type="all", dtxsid=f"DTXSID{i}")), 1)
+
+        self.assertEqual(server.requests[("GET", "hazard/search/by-dtxsid/{}")], 5)
+        self.assertEqual(server.throttled[("GET", "hazard/search/by-dtxsid/{}")], 2)
+
+    def test_large_lists_stream(self):
+        with StubServer(list_size=5000, padding=100) as server:
+            bioactivity = self._client(BioActivityData, server)
+            count = sum(1 for _ in bioactivity.get_data(search_by="aeid", search_for=1386, stream=True))
+
+        self.assertEqual(count, 5000)
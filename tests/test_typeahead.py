@@ -0,0 +1,120 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import MagicMock
+from pycomptox.local import AsyncTypeAheadSession, TypeAheadSession
+
+NAMES = ["Benzaldehyde", "Benzene", "Benzenethiol", "Benzidine", "Benzoic acid"]
+
+
+def start_with(op, word, params):
+    hits = [{"preferredName": name, "searchValue": name, "rank": 1}
+            for name in NAMES if name.upper().startswith(word.upper())]
+    return hits[:params["top"]]
+
+
+class TestTypeAheadSession(unittest.TestCase):
+    def test_complete_responses_answer_longer_prefixes(self):
+        client = MagicMock()
+        client.get_chemical.side_effect = start_with
+        session = TypeAheadSession(client, top=10)
+
+        self.assertEqual(len(session.search("benz")), 5)
+        self.assertEqual([hit["preferredName"] for hit in session.search("Benze")], ["Benzene", "Benzenethiol"])
+        self.assertEqual([hit["preferredName"] for hit in session.search("benzen")], ["Benzene", "Benzenethiol"])
+        self.assertEqual(session.search("benz")[0]["preferredName"], "Benzaldehyde")
+
+        client.get_chemical.assert_called_once_with(op="start-with", word="benz", params={"top": 10})
+        self.assertEqual(session.stats, {"requests": 1, "reused": 3, "dropped": 0})
+
+    def test_longer_prefixes_match_every_search_field(self):
+        client = MagicMock()
+        client.get_chemical.return_value = [
+            {"preferredName": "Benzene", "searchValue": "Benzol", "casrn": "71-43-2", "dtxsid": "DTXSID3039242"},
+            {"preferredName": "Benzoic acid", "searchValue": "Benzoic acid", "casrn": "65-85-0"},
+        ]
+        session = TypeAheadSession(client, top=10)
+
+        session.search("benz")
+        self.assertEqual([hit["preferredName"] for hit in session.search("benze")], ["Benzene"])
+        self.assertEqual(session.search("benzx"), [])
+        self.assertEqual(client.get_chemical.call_count, 1)
+
+    def test_truncated_responses_are_not_filtered(self):
+        client = MagicMock()
+        client.get_chemical.side_effect = start_with
+        session = TypeAheadSession(client, top=5)
+
+        session.search("benz")
+        session.search("benzo")
+        self.assertEqual(client.get_chemical.call_count, 2)
+        # A shorter prefix is never answered from a longer one
+        session.search("ben")
+        self.assertEqual(client.get_chemical.call_count, 3)
+
+    def test_lru_eviction(self):
+        client = MagicMock()
+        client.get_chemical.side_effect = start_with
+        session = TypeAheadSession(client, top=10, max_prefixes=1)
+
+        session.search("benz")
+        session.search("acryl")
+        session.search("benzo")
+        self.assertEqual(client.get_chemical.call_count, 3)
+
+    def test_superseded_search_is_dropped(self):
+        started, release = threading.Event(), threading.Event()
+
+        def slow(op, word, params):
+            if word == "ben":
+                started.set()
+                release.wait(5)
+            return start_with(op, word, params)
+
+        client = MagicMock()
+        client.get_chemical.side_effect = slow
+        session = TypeAheadSession(client, top=5)
+        results = {}
+        thread = threading.Thread(target=lambda: results.setdefault("ben", session.search("ben")))
+        thread.start()
+        started.wait(5)
+        results["acr"] = session.search("acr")
+        release.set()
+        thread.join(5)
+
+        self.assertIsNone(results["ben"])
+        self.assertEqual(session.stats["dropped"], 1)
+        # The dropped response is still remembered
+        session.search("ben")
+        self.assertEqual(client.get_chemical.call_count, 2)
+
+
+class TestAsyncTypeAheadSession(unittest.TestCase):
+    def test_new_search_cancels_the_previous_request(self):
+        class Client:
+            calls = []
+
+            async def get_chemical(self, op, word, params, coalesce=True):
+                self.calls.append((word, coalesce))
+                await asyncio.sleep(0.5 if word == "ben" else 0)
+                return start_with(op, word, params)
+
+        async def run():
+            session = AsyncTypeAheadSession(Client(), top=10)
+            first = asyncio.ensure_future(session.search("ben"))
+            await asyncio.sleep(0.05)
+            second = await session.search("benz")
+            third = await session.search("benzo")
+            return session, await first, second, third
+
+        session, first, second, third = asyncio.run(run())
+        self.assertIsNone(first)
+        self.assertEqual(len(second), 5)
+        self.assertEqual([hit["preferredName"] for hit in third], ["Benzoic acid"])
+        # Not coalesced: a shared request would outlive the cancelled search
+        self.assertEqual(Client.calls, [("ben", False), ("benz", False)])
+        self.assertEqual(session.stats, {"requests": 2, "reused": 1, "dropped": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()